@@ -8,6 +8,10 @@ import yabadaba
 # Local imports
 from .. import settings
 from .load_database import load_database
+from ._metadata_index import MetadataIndex
+from ._query_cache import QueryCache
+from ._artifact_cache import ArtifactCache
+from ._artifact_store import ArtifactStore
 
 class Database():
     """
@@ -45,6 +49,8 @@ class Database():
                                     save_lammps_potential, delete_lammps_potential,
                                     bad_lammps_potentials)
 
+    from ._sync import (sync_all, _sync_lammps_potential_files)
+
     from ._widgets import (widget_search_potentials, widget_lammps_potential)
 
     def __init__(self,
@@ -152,6 +158,10 @@ class Database():
         else:
             self.__local_database = None
         
+        # Remote query caching and artifact caching are off by default
+        self.__remote_cache = None
+        self.__artifact_cache = None
+
         # Initialize list of kim models to use
         self.init_kim_models(kim_models=kim_models, kim_models_file=kim_models_file,
                              kim_api_directory=kim_api_directory)
@@ -166,6 +176,155 @@ class Database():
         """yabadaba.database.Database : Interfaces with the local database"""
         return self.__local_database
 
+    @property
+    def remote_cache(self) -> Optional[QueryCache]:
+        """QueryCache or None : The cache of remote query results, if enabled"""
+        return self.__remote_cache
+
+    def set_remote_cache(self,
+                         cache: Optional[QueryCache] = None,
+                         ttl: float = 300.0,
+                         maxsize: int = 128,
+                         persist: bool = False):
+        """
+        Enables caching of remote query results so that repeated get and
+        remote_query calls do not resend the same query to the remote
+        database.
+
+        Parameters
+        ----------
+        cache : QueryCache, optional
+            A pre-existing QueryCache to use.  Cannot be given with the other
+            parameters.
+        ttl : float, optional
+            The number of seconds that cached results remain valid.  Default
+            value is 300.
+        maxsize : int, optional
+            The maximum number of query results to keep.  Default value is 128.
+        persist : bool, optional
+            If True, the cached results will be saved to and loaded from a
+            file in the settings directory.  Default value is False.
+        """
+        if cache is not None:
+            self.__remote_cache = cache
+        else:
+            path = None
+            if persist:
+                path = Path(settings.directory, 'remote_query_cache.json')
+            self.__remote_cache = QueryCache(ttl=ttl, maxsize=maxsize, path=path)
+
+    def unset_remote_cache(self):
+        """Disables caching of remote query results"""
+        self.__remote_cache = None
+
+    @property
+    def artifact_cache(self) -> Optional[ArtifactCache]:
+        """ArtifactCache or None : The node-local cache of artifact files, if enabled"""
+        return self.__artifact_cache
+
+    def set_artifact_cache(self,
+                           cache: Optional[ArtifactCache] = None,
+                           root: Optional[Path] = None,
+                           maxsize: Optional[int] = None,
+                           timeout: Optional[float] = None,
+                           max_age: Optional[float] = None):
+        """
+        Enables a node-local artifact cache that get_lammps_potential_files
+        populates once and stages parameter files from.  Concurrent processes
+        using the same cache root coordinate with file locks so that each
+        artifact is only copied or downloaded once.
+
+        Parameters
+        ----------
+        cache : ArtifactCache, optional
+            A pre-existing ArtifactCache to use.  Cannot be given with the
+            other parameters.
+        root : path-like object, optional
+            The cache directory.  If not given, will use the directory
+            "artifact_cache" located in the settings directory.
+        maxsize : int, optional
+            The maximum total size of the cached files in bytes.  If not
+            given (default), files are never evicted.
+        timeout : float, optional
+            The number of seconds to wait for another process populating an
+            artifact.  If not given (default), will wait indefinitely.
+        max_age : float, optional
+            The number of seconds after which files of artifacts without a
+            recorded sha256 are fetched again.  If not given (default), they
+            are never refreshed.
+        """
+        if cache is not None:
+            if (root is not None or maxsize is not None or timeout is not None
+                or max_age is not None):
+                raise ValueError('cache cannot be given with root, maxsize, timeout or max_age')
+            self.__artifact_cache = cache
+        else:
+            if root is None:
+                root = Path(settings.directory, 'artifact_cache')
+            self.__artifact_cache = ArtifactCache(root, maxsize=maxsize,
+                                                  timeout=timeout,
+                                                  max_age=max_age)
+
+    def unset_artifact_cache(self):
+        """Disables the artifact cache"""
+        self.__artifact_cache = None
+
+    @property
+    def local_index(self) -> Optional[MetadataIndex]:
+        """MetadataIndex or None : The persistent metadata index for the local database, if it is of style local"""
+        if self.local_database is None or self.local_database.style != 'local':
+            return None
+        return MetadataIndex(self.local_database.host)
+
+    @property
+    def local_artifact_store(self) -> Optional[ArtifactStore]:
+        """ArtifactStore or None : The deduplicated artifact file storage for the local database, if it is of style local"""
+        if self.local_database is None or self.local_database.style != 'local':
+            return None
+        return ArtifactStore(self.local_database.host)
+
+    def dedupe_artifacts(self, verbose: bool = False) -> dict:
+        """
+        Converts the artifact files in a local-style local database to be
+        stored once by SHA-256 checksum, with each potential's folder holding
+        links to the stored files.  The linked files are shared, so writing to
+        one in place changes it in every folder.
+
+        Parameters
+        ----------
+        verbose : bool, optional
+            If True, info messages will be printed.  Default value is False.
+
+        Returns
+        -------
+        dict
+            The number of 'folders' and 'files' processed, the number of
+            unique 'blobs' stored, the disk usage in bytes 'before' and
+            'after', and the bytes 'saved'.
+        """
+        if self.local_artifact_store is None:
+            raise ValueError('dedupe requires a local database of style local')
+        return self.local_artifact_store.dedupe(verbose=verbose)
+
+    def gc_artifacts(self, verbose: bool = False) -> dict:
+        """
+        Removes stored artifact files of a local-style local database that no
+        potential folder manifest refers to.
+
+        Parameters
+        ----------
+        verbose : bool, optional
+            If True, info messages will be printed.  Default value is False.
+
+        Returns
+        -------
+        dict
+            The number of stored files 'removed' and the bytes 'freed'.
+        """
+        if self.local_artifact_store is None:
+            raise ValueError('gc requires a local database of style local')
+        return self.local_artifact_store.gc(verbose=verbose)
+
     @property
     def local(self) -> bool:
         """bool : Indicates if load operations will check localpath"""
@@ -277,7 +436,10 @@ class Database():
                      status: Union[str, list, None] = None,
                      downloadfiles: bool = True,
                      overwrite: bool = False,
-                     verbose: bool = False):
+                     max_workers: int = 8,
+                     sync: bool = False,
+                     dedupe: bool = False,
+                     verbose: bool = False) -> Optional[dict]:
         """
         Downloads all potential-related records from the remote location to the
         local location.
@@ -295,14 +457,35 @@ class Database():
             Flag indicating if any existing local records with names matching
             remote records are updated (True) or left unchanged (False).  Default
             value is False.
+        max_workers : int, optional
+            The maximum number of parameter files to download at the same time.
+            Default value is 8.
+        sync : bool, optional
+            If True, only the records and files that are new or changed since
+            the last sync are transferred using sync_all, and overwrite is
+            ignored.  Default value is False.
+        dedupe : bool, optional
+            If True and the local database is of style local, the downloaded
+            parameter files are stored once by SHA-256 checksum.  See
+            download_lammps_potentials.  Default value is False.
         verbose : bool, optional
             If True, info messages will be printed during operations.  Default
             value is False.
 
+        Returns
+        -------
+        dict
+            The sync report.  Only returned if sync is True.
         """
+        if sync is True:
+            return self.sync_all(status=status, downloadfiles=downloadfiles,
+                                 max_workers=max_workers, dedupe=dedupe,
+                                 verbose=verbose)
+
         self.download_citations(overwrite=overwrite, verbose=verbose)
 
         self.download_potentials(overwrite=overwrite, verbose=verbose)
 
         self.download_lammps_potentials(status=status, downloadfiles=downloadfiles,
-                                        overwrite=overwrite, verbose=verbose)
\ No newline at end of file
+                                        overwrite=overwrite, max_workers=max_workers,
+                                        dedupe=dedupe, verbose=verbose)
\ No newline at end of file
@@ -0,0 +1,252 @@
+# coding: utf-8
+# Standard libraries
+from io import BytesIO
+from pathlib import Path
+import shutil
+import tarfile
+from typing import BinaryIO, Optional, Union
+import zipfile
+
+# Leading bytes of compressed tar streams
+_compressed_magic = (b'\x1f\x8b', b'BZh', b'\xfd7zXZ\x00')
+
+archive_formats = ('tar', 'zip')
+
+def build_archive(root_dir: Union[str, Path],
+                  name: str,
+                  format: str = 'tar') -> bytes:
+    """
+    Builds the content of an archive of a record's folder for saving with a
+    database's add_tar or update_tar.  The members are named
+    "<name>/<filename>" in the same way as the database-built tar archives.
+
+    Parameters
+    ----------
+    root_dir : path-like object
+        The directory containing the folder to archive.
+    name : str
+        The name of the folder to archive, i.e. the record's name.
+    format : str, optional
+        'tar' (default) builds a gzipped tar archive matching the ones built
+        by the databases.  'zip' builds a zip archive whose central directory
+        allows any member to be read without reading the others.  The
+        databases store either under their tar archive names, so zip archives
+        can only be read with ArtifactArchive and not with get_tar or other
+        tar tools.
+
+    Returns
+    -------
+    bytes
+        The archive content.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the folder does not exist.
+    """
+    folder = Path(root_dir, name)
+    if not folder.is_dir():
+        raise FileNotFoundError(f'No folder {name} found in {root_dir}')
+    buffer = BytesIO()
+    if format == 'zip':
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as z:
+            for path in sorted(folder.rglob('*')):
+                if path.is_file():
+                    z.write(path, arcname=path.relative_to(root_dir).as_posix())
+    elif format == 'tar':
+        with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+            tar.add(folder, arcname=name)
+    else:
+        raise ValueError(f'Invalid archive format {format}: must be one of {archive_formats}')
+    return buffer.getvalue()
+
+def open_archive(database, record) -> 'ArtifactArchive':
+    """
+    Opens the archive associated with a record in a database.  The archives
+    of local-style databases are read directly from their files, while those
+    of other database styles are retrieved as raw content.
+
+    Parameters
+    ----------
+    database : yabadaba.Database
+        The database to open the archive from.
+    record : Record
+        The record whose archive to open.
+
+    Returns
+    -------
+    ArtifactArchive
+        The opened archive.
+
+    Raises
+    ------
+    ValueError
+        If the database has no archive for the record.
+    """
+    if database.style == 'local':
+        path = Path(database.host, record.style, f'{record.name}.tar.gz')
+        if not path.is_file():
+            raise ValueError(f'No existing tar found for {record.style} record {record.name}')
+        return ArtifactArchive(path)
+    return ArtifactArchive(database.get_tar(record=record, raw=True))
+
+class ArtifactArchive():
+    """
+    Random access reader for the archives of a record's artifact files.
+    Zip archives and uncompressed tar archives are indexed once when opened
+    so that each member is read directly from its offset.  Compressed tar
+    archives cannot be indexed, so all wanted members are extracted in one
+    sequential pass with extract_many.  Members are streamed to disk in
+    chunks rather than read fully into memory.
+    """
+    def __init__(self, content: Union[bytes, str, Path, BinaryIO]):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        content : bytes, path-like object or file-like object
+            The archive content, a path to the archive file, or an open
+            binary file positioned at the start of the archive.
+        """
+        if isinstance(content, (bytes, bytearray)):
+            self.__fileobj = BytesIO(content)
+        elif isinstance(content, (str, Path)):
+            self.__fileobj = open(content, 'rb')
+        else:
+            self.__fileobj = content
+
+        self.__zip = None
+        self.__members = None
+        magic = self.__fileobj.read(6)
+        self.__fileobj.seek(0)
+
+        if zipfile.is_zipfile(self.__fileobj):
+            self.__format = 'zip'
+            self.__fileobj.seek(0)
+            self.__zip = zipfile.ZipFile(self.__fileobj)
+            self.__members = {info.filename: info for info in self.__zip.infolist()
+                              if not info.is_dir()}
+        elif magic.startswith(_compressed_magic):
+            self.__format = 'compressed tar'
+        else:
+            self.__format = 'tar'
+            self.__fileobj.seek(0)
+            with tarfile.open(fileobj=self.__fileobj, mode='r:') as tar:
+                self.__members = {info.name: info for info in tar.getmembers()
+                                  if info.isfile()}
+
+    @property
+    def format(self) -> str:
+        """str : The archive format: 'zip', 'tar' or 'compressed tar'"""
+        return self.__format
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes the archive"""
+        if self.__zip is not None:
+            self.__zip.close()
+        self.__fileobj.close()
+
+    def names(self) -> list:
+        """
+        Lists the file members of the archive.  For compressed tar archives
+        this reads through the whole archive the first time it is called.
+
+        Returns
+        -------
+        list
+            The member names.
+        """
+        if self.__members is None:
+            self.__fileobj.seek(0)
+            with tarfile.open(fileobj=self.__fileobj, mode='r|*') as tar:
+                self.__members = {info.name: None for info in tar if info.isfile()}
+        return list(self.__members)
+
+    def __contains__(self, member: str) -> bool:
+        return member in self.names()
+
+    def extract(self,
+                member: str,
+                dest: Union[str, Path]):
+        """
+        Writes the content of one archive member to a file.
+
+        Parameters
+        ----------
+        member : str
+            The member name.
+        dest : path-like object
+            The file path to write to.
+
+        Raises
+        ------
+        KeyError
+            If the member is not in the archive.
+        """
+        if member not in self.extract_many({member: dest}):
+            raise KeyError(f'{member} not found in archive')
+
+    def extract_many(self, targets: dict) -> list:
+        """
+        Writes the content of multiple archive members to files.  Compressed
+        tar archives are read through once for all members.
+
+        Parameters
+        ----------
+        targets : dict
+            The file path to write to for each member name.
+
+        Returns
+        -------
+        list
+            The names of the members that were found and extracted.
+        """
+        extracted = []
+        if self.format == 'compressed tar':
+            self.__fileobj.seek(0)
+            with tarfile.open(fileobj=self.__fileobj, mode='r|*') as tar:
+                for info in tar:
+                    if info.isfile() and info.name in targets:
+                        self.__copy(tar.extractfile(info), targets[info.name])
+                        extracted.append(info.name)
+                        if len(extracted) == len(targets):
+                            break
+
+        else:
+            for member, dest in targets.items():
+                info = self.__members.get(member, None)
+                if info is None:
+                    continue
+                if self.format == 'zip':
+                    self.__copy(self.__zip.open(info), dest)
+                else:
+                    self.__fileobj.seek(info.offset_data)
+                    self.__copy(self.__fileobj, dest, info.size)
+                extracted.append(member)
+
+        return extracted
+
+    @staticmethod
+    def __copy(fr: BinaryIO,
+               dest: Union[str, Path],
+               size: Optional[int] = None,
+               chunksize: int = 2**20):
+        """Streams content from an open file to dest"""
+        with open(dest, 'wb') as fw:
+            if size is None:
+                shutil.copyfileobj(fr, fw, chunksize)
+                fr.close()
+            else:
+                while size > 0:
+                    chunk = fr.read(min(chunksize, size))
+                    if not chunk:
+                        break
+                    fw.write(chunk)
+                    size -= len(chunk)
@@ -0,0 +1,462 @@
+# coding: utf-8
+# Standard libraries
+from contextlib import contextmanager
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import stat
+import tempfile
+import time
+from typing import Callable, Generator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Local imports
+from ._staging import stage_file
+
+class ArtifactCache():
+    """
+    Node-local cache of artifact files shared by all processes using the same
+    root directory.  Each artifact is stored once under a key based on its
+    sha256 checksum, or its URL if no checksum is recorded.  Populating an
+    artifact holds an exclusive file lock so that exactly one process copies
+    or downloads it while the others wait, and completed files are moved
+    into place so that partial content is never visible.  Cached files are
+    read-only and are staged into pot_dir directories by linking or copying.
+
+    If maxsize is set, the least recently used files are evicted once the
+    cache grows larger than it.  Files are only evicted when no process is
+    staging them, but symlinks to evicted files will break, so use hardlinks
+    or copies when eviction is enabled.
+
+    Files cached by URL cannot be checked against the upstream content, so
+    they are kept until evicted unless max_age is set.
+    """
+    def __init__(self,
+                 root: Union[str, Path],
+                 maxsize: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 max_age: Optional[float] = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        root : path-like object
+            The cache directory.  Should be on a node-local filesystem that
+            supports file locking.
+        maxsize : int, optional
+            The maximum total size of the cached files in bytes.  If not
+            given (default), files are never evicted.
+        timeout : float, optional
+            The number of seconds to wait for another process to finish
+            populating an artifact before raising a TimeoutError.  If not
+            given (default), will wait indefinitely.
+        max_age : float, optional
+            The number of seconds after which files cached by URL, i.e. for
+            artifacts with no recorded sha256, are populated again.  If not
+            given (default), they are never refreshed.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        if max_age is not None and max_age < 0:
+            raise ValueError('max_age must not be negative')
+        self.__root = Path(root).resolve()
+        self.__maxsize = maxsize
+        self.__timeout = timeout
+        self.__max_age = max_age
+
+    @property
+    def root(self) -> Path:
+        """pathlib.Path : The cache directory"""
+        return self.__root
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """int or None : The maximum total size of the cached files in bytes"""
+        return self.__maxsize
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """float or None : The number of seconds to wait for locks"""
+        return self.__timeout
+
+    @property
+    def max_age(self) -> Optional[float]:
+        """float or None : The number of seconds before files cached by URL are refreshed"""
+        return self.__max_age
+
+    def __repr__(self) -> str:
+        return f'ArtifactCache({str(self.root)!r}, {len(self.keys())} files)'
+
+    @staticmethod
+    def key(artifact) -> str:
+        """
+        Gives the cache key for an artifact.
+
+        Parameters
+        ----------
+        artifact : Artifact
+            The artifact.
+
+        Returns
+        -------
+        str
+            The artifact's lowercase sha256 checksum if recorded, otherwise
+            'url-' followed by the sha256 hash of the artifact's URL.
+        """
+        if artifact.sha256 is not None:
+            return artifact.sha256.lower()
+        url = artifact.url if artifact.url is not None else artifact.filename
+        return 'url-' + hashlib.sha256(url.encode('UTF-8')).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        Gives the path where the file for a key is stored.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        pathlib.Path
+            The file path.
+        """
+        return Path(self.root, 'objects', key[-2:], key)
+
+    def potential_dir(self, lammps_potential) -> Path:
+        """
+        Gives a shared directory inside the cache that can be used as the
+        pot_dir for a LAMMPS potential.  Staging the potential's artifacts
+        there with symlinks allows all jobs to use the same pot_dir.
+
+        Parameters
+        ----------
+        lammps_potential : PotentialLAMMPS
+            The LAMMPS potential.
+
+        Returns
+        -------
+        pathlib.Path
+            The directory path.
+        """
+        return Path(self.root, 'potentials', lammps_potential.id)
+
+    def keys(self) -> list:
+        """list : The keys of all cached files"""
+        objects = Path(self.root, 'objects')
+        if not objects.is_dir():
+            return []
+        return sorted(path.name for path in objects.glob('*/*')
+                      if not path.name.startswith('.'))
+
+    def size(self) -> int:
+        """int : The total size of the cached files in bytes"""
+        total = 0
+        for key in self.keys():
+            try:
+                total += self.path(key).stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    @contextmanager
+    def lock(self,
+             key: str,
+             shared: bool = False,
+             blocking: bool = True) -> Generator[bool, None, None]:
+        """
+        Context manager that holds the file lock for a key.  Exclusive locks
+        are held while populating or evicting a file and shared locks while
+        staging it.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        shared : bool, optional
+            If True, a shared lock is acquired.  Default value is False.
+            Shared locks are exclusive on systems without fcntl.
+        blocking : bool, optional
+            If True (default), waits for the lock up to timeout seconds.  If
+            False, the context yields False immediately if the lock is held
+            by another process.
+
+        Yields
+        ------
+        bool
+            True if the lock was acquired.
+        """
+        lockpath = Path(self.root, 'locks', f'{key}.lock')
+        lockpath.parent.mkdir(parents=True, exist_ok=True)
+        with open(lockpath, 'a+b') as f:
+            acquired = self.__acquire(f, shared, blocking)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    self.__release(f)
+
+    def __acquire(self, f, shared: bool, blocking: bool) -> bool:
+        """Acquires the lock on an open lock file"""
+        start = time.monotonic()
+        while True:
+            try:
+                if fcntl is not None:
+                    flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                    if blocking and self.timeout is None:
+                        fcntl.flock(f.fileno(), flags)
+                    else:
+                        fcntl.flock(f.fileno(), flags | fcntl.LOCK_NB)
+                elif msvcrt is not None:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                if self.timeout is not None and time.monotonic() - start > self.timeout:
+                    raise TimeoutError(f'timed out waiting for cache lock {f.name}')
+                time.sleep(0.05)
+
+    @staticmethod
+    def __release(f):
+        """Releases the lock on an open lock file"""
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def get(self,
+            artifact,
+            source: Optional[Callable[[Path], None]] = None,
+            download: bool = True,
+            session=None,
+            verbose: bool = False) -> Optional[Path]:
+        """
+        Gives the path to an artifact's cached file, populating the cache if
+        needed.  If another process is populating the same artifact, this
+        waits for it to finish.
+
+        Parameters
+        ----------
+        artifact : Artifact
+            The artifact to get.
+        source : callable, optional
+            A function that writes the artifact's content to the path it is
+            given.  Used to populate the cache from a database folder or
+            archive.
+        download : bool, optional
+            If True (default), the artifact is downloaded from its URL if it
+            is not cached and no source is given.
+        session : requests.Session, optional
+            An open session to use for downloading.
+        verbose : bool, optional
+            If True, info messages will be printed.  Default value is False.
+
+        Returns
+        -------
+        pathlib.Path or None
+            The path to the cached file, or None if it is not cached and could
+            not be populated.
+
+        Raises
+        ------
+        ValueError
+            If the populated content does not match the artifact's recorded
+            sha256 checksum.
+        """
+        key = self.key(artifact)
+        path = self.path(key)
+
+        if self.__missing(key, path):
+            if source is None and download is False:
+                return path if path.is_file() else None
+            with self.lock(key):
+                # Check again in case another process populated it
+                if self.__missing(key, path):
+                    if not self.__populate(artifact, path, source, session):
+                        return path if path.is_file() else None
+                    if verbose:
+                        print(f'{artifact.filename} added to cache {self.root}')
+
+            if self.maxsize is not None:
+                self.evict(keep=[key])
+
+        return path
+
+    def __missing(self,
+                  key: str,
+                  path: Path) -> bool:
+        """Checks if a key's file is not cached or is a URL-keyed file older than max_age"""
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        return (self.max_age is not None and key.startswith('url-')
+                and time.time() - mtime > self.max_age)
+
+    def __populate(self,
+                   artifact,
+                   path: Path,
+                   source: Optional[Callable[[Path], None]],
+                   session) -> bool:
+        """Writes an artifact's content to path"""
+        tmproot = Path(self.root, 'tmp')
+        tmproot.mkdir(parents=True, exist_ok=True)
+        tmpdir = Path(tempfile.mkdtemp(dir=tmproot))
+        try:
+            tmpname = Path(tmpdir, artifact.filename)
+            if source is not None:
+                source(tmpname)
+            elif not artifact.download(tmpdir, session=session):
+                return False
+
+            if artifact.sha256 is not None and not artifact.verify(tmpdir):
+                raise ValueError(f'sha256 checksum mismatch for {artifact.filename}')
+
+            # Use the modification time to track when the file was cached
+            os.utime(tmpname)
+            os.chmod(tmpname, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmpname, path)
+            return True
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def stage(self,
+              artifact,
+              pot_dir: Union[str, Path],
+              mode: str = 'copy',
+              source: Optional[Callable[[Path], None]] = None,
+              download: bool = True,
+              session=None,
+              verbose: bool = False) -> Optional[str]:
+        """
+        Places an artifact's cached file in a directory, populating the cache
+        if needed.
+
+        Parameters
+        ----------
+        artifact : Artifact
+            The artifact to stage.
+        pot_dir : path-like object
+            The directory to stage the file to.
+        mode : str, optional
+            How the file is placed: 'copy' (default), 'symlink', 'hardlink' or
+            'reflink'.  Links that cannot be made fall back to copying.
+        source : callable, optional
+            A function that writes the artifact's content to the path it is
+            given.  Used to populate the cache from a database folder or
+            archive.
+        download : bool, optional
+            If True (default), the artifact is downloaded from its URL if it
+            is not cached and no source is given.
+        session : requests.Session, optional
+            An open session to use for downloading.
+        verbose : bool, optional
+            If True, info messages will be printed.  Default value is False.
+
+        Returns
+        -------
+        str or None
+            The mode that was used, or None if the artifact is not cached and
+            could not be populated.
+        """
+        key = self.key(artifact)
+        while True:
+            path = self.get(artifact, source=source, download=download,
+                            session=session, verbose=verbose)
+            if path is None:
+                return None
+
+            # Hold a shared lock so that the file is not evicted while staging
+            with self.lock(key, shared=True):
+                if not path.is_file():
+                    continue
+                # Mark the file as used for eviction, which only the owner can do
+                try:
+                    os.utime(path, (time.time(), path.stat().st_mtime))
+                except OSError:
+                    pass
+                Path(pot_dir).mkdir(parents=True, exist_ok=True)
+                used = stage_file(path, Path(pot_dir, artifact.filename), mode)
+
+            if verbose:
+                print(f'{artifact.filename} staged from cache to {pot_dir} using {used}')
+            return used
+
+    def evict(self,
+              maxsize: Optional[int] = None,
+              keep: Optional[list] = None) -> int:
+        """
+        Removes the least recently used cached files until the cache size is
+        no more than maxsize.  Files being staged or populated by other
+        processes are skipped.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The size in bytes to reduce the cache to.  If not given, will use
+            the cache's maxsize, or remove all files if that is not set.
+        keep : list, optional
+            Keys of files that are not to be evicted.
+
+        Returns
+        -------
+        int
+            The number of files removed.
+        """
+        if maxsize is None:
+            maxsize = self.maxsize if self.maxsize is not None else 0
+        if keep is None:
+            keep = []
+
+        entries = []
+        total = 0
+        for key in self.keys():
+            try:
+                info = self.path(key).stat()
+            except FileNotFoundError:
+                continue
+            total += info.st_size
+            if key not in keep:
+                entries.append((info.st_atime, info.st_size, key))
+
+        removed = 0
+        for atime, size, key in sorted(entries):
+            if total <= maxsize:
+                break
+            with self.lock(key, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                try:
+                    self.path(key).unlink()
+                except FileNotFoundError:
+                    continue
+            total -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """
+        Removes all cached files that are not in use.
+
+        Returns
+        -------
+        int
+            The number of files removed.
+        """
+        return self.evict(maxsize=0)
@@ -0,0 +1,336 @@
+# coding: utf-8
+# Standard libraries
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Union
+
+# Local imports
+from ._staging import stage_file, staging_modes
+
+class ArtifactStore():
+    """
+    Content-addressed storage of the artifact files in a local-style
+    database.  Each unique file content is stored once as a blob named by its
+    SHA-256 checksum, and the files in each record folder are links to the
+    blobs.  A manifest in each folder lists the checksum and size of its
+    files.  Hardlinked folder files are indistinguishable from regular files,
+    so readers that do not know about the store continue to work.  Linked
+    files share their content with the blob and every other folder linking
+    to it, so they should be replaced rather than written to in place.
+    """
+
+    # Name of the manifest file in each record folder
+    manifest_name = '.manifest.json'
+
+    # Record styles with artifact folders
+    styles = ('potential_LAMMPS',)
+
+    def __init__(self,
+                 host: Union[str, Path],
+                 dirname: str = 'artifact_blobs',
+                 linkmode: str = 'hardlink'):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        host : path-like object
+            The host directory of the local database.
+        dirname : str, optional
+            The name of the blob directory in the host directory.  Default
+            value is 'artifact_blobs'.
+        linkmode : str, optional
+            How folder files are linked to blobs: 'hardlink' (default),
+            'symlink', 'reflink' or 'copy'.  Links that cannot be made fall
+            back to copying, which stores the content twice.
+        """
+        if linkmode not in staging_modes:
+            raise ValueError(f'Invalid linkmode {linkmode}: must be one of {staging_modes}')
+        self.__host = Path(host)
+        self.__blob_dir = Path(host, dirname)
+        self.__linkmode = linkmode
+
+    @property
+    def host(self) -> Path:
+        """pathlib.Path : The host directory of the local database"""
+        return self.__host
+
+    @property
+    def blob_dir(self) -> Path:
+        """pathlib.Path : The directory where the blobs are stored"""
+        return self.__blob_dir
+
+    @property
+    def linkmode(self) -> str:
+        """str : How folder files are linked to blobs"""
+        return self.__linkmode
+
+    def blob_path(self, sha256: str) -> Path:
+        """
+        Gives the path to the blob for a checksum.
+
+        Parameters
+        ----------
+        sha256 : str
+            The SHA-256 checksum of the content.
+
+        Returns
+        -------
+        pathlib.Path
+            The blob path.
+        """
+        sha256 = sha256.lower()
+        return Path(self.blob_dir, sha256[:2], sha256)
+
+    def blobs(self) -> list:
+        """list : The checksums of all stored blobs"""
+        if not self.blob_dir.is_dir():
+            return []
+        return sorted(path.name for path in self.blob_dir.glob('*/*')
+                      if not path.name.startswith('.'))
+
+    def folders(self) -> list:
+        """list : The paths to all record folders in the database"""
+        folders = []
+        for style in self.styles:
+            styledir = Path(self.host, style)
+            if styledir.is_dir():
+                folders += sorted(path for path in styledir.iterdir() if path.is_dir())
+        return folders
+
+    @staticmethod
+    def file_sha256(path: Union[str, Path]) -> str:
+        """
+        Computes the SHA-256 checksum of a file.
+
+        Parameters
+        ----------
+        path : path-like object
+            The file.
+
+        Returns
+        -------
+        str
+            The hex digest of the file's content.
+        """
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(2**20), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def load_manifest(self, folder: Union[str, Path]) -> dict:
+        """
+        Reads the manifest of a record folder.
+
+        Parameters
+        ----------
+        folder : path-like object
+            The record folder.
+
+        Returns
+        -------
+        dict
+            The sha256 and size of each file by filename.  Empty if the folder
+            has no manifest.
+        """
+        path = Path(folder, self.manifest_name)
+        if not path.is_file():
+            return {}
+        with open(path, encoding='UTF-8') as f:
+            return json.load(f)['files']
+
+    def save_manifest(self,
+                      folder: Union[str, Path],
+                      files: dict):
+        """
+        Writes the manifest of a record folder.
+
+        Parameters
+        ----------
+        folder : path-like object
+            The record folder.
+        files : dict
+            The sha256 and size of each file by filename.
+        """
+        path = Path(folder, self.manifest_name)
+        tmppath = Path(folder, self.manifest_name + '.tmp')
+        with open(tmppath, 'w', encoding='UTF-8') as f:
+            json.dump({'version': 1, 'files': files}, f, indent=4, sort_keys=True)
+        os.replace(tmppath, path)
+
+    def add_file(self, path: Union[str, Path]) -> dict:
+        """
+        Stores a file's content as a blob and replaces the file with a link
+        to the blob.
+
+        Parameters
+        ----------
+        path : path-like object
+            The file to store.
+
+        Returns
+        -------
+        dict
+            The file's 'sha256' and 'size', and the 'mode' used to link it to
+            the blob, which is 'existing' if it was already linked.
+        """
+        path = Path(path)
+        sha256 = self.file_sha256(path)
+        size = path.stat().st_size
+        blob = self.blob_path(sha256)
+
+        if not blob.is_file():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            if self.linkmode == 'symlink':
+                stage_file(path.resolve(), blob, 'hardlink')
+                mode = stage_file(blob, path, 'symlink')
+            else:
+                # Hardlinking makes the file itself the blob
+                mode = stage_file(path.resolve(), blob, self.linkmode)
+        elif path.is_symlink() and path.resolve() == blob.resolve():
+            mode = 'existing'
+        elif not path.is_symlink() and os.path.samefile(path, blob):
+            mode = 'existing'
+        else:
+            mode = stage_file(blob, path, self.linkmode)
+
+        return {'sha256': sha256, 'size': size, 'mode': mode}
+
+    def add_folder(self, folder: Union[str, Path]) -> dict:
+        """
+        Stores all files in a record folder as blobs and writes the folder's
+        manifest.
+
+        Parameters
+        ----------
+        folder : path-like object
+            The record folder.
+
+        Returns
+        -------
+        dict
+            The results of add_file for each filename.
+        """
+        results = {}
+        for path in sorted(Path(folder).iterdir()):
+            if path.name.startswith('.') or not path.is_file():
+                continue
+            results[path.name] = self.add_file(path)
+
+        files = {name: {'sha256': result['sha256'], 'size': result['size']}
+                 for name, result in results.items()}
+        self.save_manifest(folder, files)
+        return results
+
+    def resolve(self,
+                folder: Union[str, Path],
+                filename: str) -> Path:
+        """
+        Gives the path to read a folder file from using the folder's manifest.
+
+        Parameters
+        ----------
+        folder : path-like object
+            The record folder.
+        filename : str
+            The name of the file.
+
+        Returns
+        -------
+        pathlib.Path
+            The blob path if the file is listed in the manifest and its blob
+            exists, otherwise the path to the file in the folder.
+        """
+        entry = self.load_manifest(folder).get(filename, None)
+        if entry is not None:
+            blob = self.blob_path(entry['sha256'])
+            if blob.is_file():
+                return blob
+        return Path(folder, filename)
+
+    def disk_usage(self) -> int:
+        """int : The bytes used by the folder files and blobs, counting each inode once and excluding manifests"""
+        seen = set()
+        total = 0
+        paths = [path for folder in self.folders() for path in folder.iterdir()]
+        if self.blob_dir.is_dir():
+            paths += list(self.blob_dir.glob('*/*'))
+        for path in paths:
+            if path.name.startswith('.') or path.is_symlink() or not path.is_file():
+                continue
+            info = path.stat()
+            if (info.st_dev, info.st_ino) not in seen:
+                seen.add((info.st_dev, info.st_ino))
+                total += info.st_size
+        return total
+
+    def dedupe(self, verbose: bool = False) -> dict:
+        """
+        Converts all record folders in the database to use the store, linking
+        files with identical content to the same blob.
+
+        Parameters
+        ----------
+        verbose : bool, optional
+            If True, info messages will be printed.  Default value is False.
+
+        Returns
+        -------
+        dict
+            The number of 'folders' and 'files' processed, the number of
+            'blobs' stored, the disk usage in bytes 'before' and 'after', and
+            the bytes 'saved'.
+        """
+        before = self.disk_usage()
+        numfiles = 0
+        folders = self.folders()
+        for folder in folders:
+            numfiles += len(self.add_folder(folder))
+        after = self.disk_usage()
+
+        report = {'folders': len(folders), 'files': numfiles,
+                  'blobs': len(self.blobs()), 'before': before,
+                  'after': after, 'saved': before - after}
+        if verbose:
+            print(f"{numfiles} files in {len(folders)} folders stored as {report['blobs']} blobs")
+            print(f"{report['saved']} bytes saved")
+        return report
+
+    def gc(self, verbose: bool = False) -> dict:
+        """
+        Removes blobs that are not listed in any folder manifest.
+
+        Parameters
+        ----------
+        verbose : bool, optional
+            If True, info messages will be printed.  Default value is False.
+
+        Returns
+        -------
+        dict
+            The number of blobs 'removed' and the bytes 'freed'.  Bytes are
+            only freed if no folder file is still hardlinked to the blob.
+        """
+        referenced = set()
+        for folder in self.folders():
+            for entry in self.load_manifest(folder).values():
+                referenced.add(entry['sha256'].lower())
+
+        removed = 0
+        freed = 0
+        for sha256 in self.blobs():
+            if sha256 in referenced:
+                continue
+            blob = self.blob_path(sha256)
+            info = blob.stat()
+            blob.unlink()
+            removed += 1
+            if info.st_nlink == 1:
+                freed += info.st_size
+
+        if verbose:
+            print(f'{removed} unreferenced blobs removed, {freed} bytes freed')
+        return {'removed': removed, 'freed': freed}
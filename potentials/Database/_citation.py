@@ -9,8 +9,7 @@ import numpy as np
 # https://pandas.pydata.org/
 import pandas as pd
 
-# https://github.com/sckott/habanero
-from habanero import cn
+# habanero is imported when a citation is fetched from CrossRef
 
 # https://github.com/usnistgov/yabadaba
 from yabadaba.record import Record
@@ -85,8 +84,9 @@ def get_citations(self,
     
     Returns
     -------
-    numpy.NDArray of Record subclasses
-        The retrived records.
+    RecordList of Record subclasses
+        The retrived records.  Each record is only built from its model when
+        it is first accessed.
     pandas.DataFrame
         A table of the records' metadata.  Returned if return_df = True.
     """
@@ -355,6 +355,8 @@ def fetch_citation(self,
             pass
     
     # Fetch from CrossRef if database search failed/skipped
+    # https://github.com/sckott/habanero
+    from habanero import cn
     bibtex = cn.content_negotiation(ids=doi, format="bibtex")
     if verbose:
         print('Citation retrieved from CrossRef')
@@ -55,8 +55,9 @@ def get_faqs(self,
     
     Returns
     -------
-    numpy.NDArray of Record subclasses
-        The retrived records.
+    RecordList of Record subclasses
+        The retrived records.  Each record is only built from its model when
+        it is first accessed.
     pandas.DataFrame
         A table of the records' metadata.  Returned if return_df = True.
     """
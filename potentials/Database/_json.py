@@ -0,0 +1,79 @@
+# coding: utf-8
+# Standard libraries
+import datetime
+import json
+from typing import Any
+
+# https://numpy.org/
+import numpy as np
+
+class JSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for record metadata.  date and datetime values are written
+    as tagged objects that decode_object converts back, and numpy values are
+    written as the equivalent Python values.
+    """
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, datetime.datetime):
+            return {'__datetime__': obj.isoformat()}
+        if isinstance(obj, datetime.date):
+            return {'__date__': obj.isoformat()}
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        return super().default(obj)
+
+def decode_object(obj: dict) -> Any:
+    """
+    Converts the tagged objects written by JSONEncoder back to date and
+    datetime values.
+
+    Parameters
+    ----------
+    obj : dict
+        A decoded JSON object.
+
+    Returns
+    -------
+    dict, datetime.date or datetime.datetime
+        The converted value, or obj if it is not a tagged object.
+    """
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return datetime.date.fromisoformat(obj['__date__'])
+    return obj
+
+def dumps(obj: Any) -> str:
+    """
+    Encodes record metadata as a JSON str.
+
+    Parameters
+    ----------
+    obj : any
+        The content to encode.
+
+    Returns
+    -------
+    str
+        The JSON content.
+    """
+    return json.dumps(obj, cls=JSONEncoder)
+
+def loads(content: str) -> Any:
+    """
+    Decodes record metadata from a JSON str written by dumps.
+
+    Parameters
+    ----------
+    content : str
+        The JSON content.
+
+    Returns
+    -------
+    any
+        The decoded content.
+    """
+    return json.loads(content, object_hook=decode_object)
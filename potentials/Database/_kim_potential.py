@@ -2,7 +2,6 @@
 # Standard Python libraries
 from pathlib import Path
 import subprocess
-from copy import deepcopy
 from typing import Optional, Tuple, Union
 
 # https://numpy.org/
@@ -11,12 +10,33 @@ import numpy as np
 # https://pandas.pydata.org/
 import pandas as pd
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba import load_query
-
 # Local imports
 from ..tools import aslist
-from .. import settings, load_record
+from .. import settings
+from ._record_list import RecordList
+
+def contains_all(series: pd.Series,
+                 values: Union[str, list]) -> pd.Series:
+    """
+    Checks which list elements of a Series contain all of the given values.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        Series with list elements.
+    values : str or list
+        The values to check for.
+
+    Returns
+    -------
+    pandas.Series
+        Boolean map of elements that contain all values.
+    """
+    values = aslist(values)
+    exploded = series.explode()
+    found = exploded[exploded.isin(values)]
+    counts = found.groupby(level=0).nunique()
+    return counts.reindex(series.index, fill_value=0) == len(set(values))
 
 @property
 def kim_models(self) -> list:
@@ -112,8 +132,9 @@ def get_kim_lammps_potentials(self,
     
     Returns
     -------
-    numpy.NDArray of Record subclasses
-        The retrived records.
+    RecordList of Record subclasses
+        The retrived records.  Each record is only built from its model when
+        it is first accessed.
     pandas.DataFrame
         A table of the records' metadata.  Returned if return_df = True.
     """
@@ -130,9 +151,9 @@ def get_kim_lammps_potentials(self,
         if verbose:
             print('No KIM potentials added: list of models is empty')
         if return_df:
-            return np.array([]), pd.DataFrame({'name':[]})
+            return RecordList(), pd.DataFrame({'name':[]})
         else:
-            return np.array([])
+            return RecordList()
 
     # Get potential_LAMMPS_KIM records
     records1, df1 = self.get_records(
@@ -142,68 +163,69 @@ def get_kim_lammps_potentials(self,
         atom_style=atom_style, pair_style=pair_style, status=status,
         symbols=symbols, elements=elements)
     
-    # Build list of records based on kim_models and expand potentials
+    # Build table of candidate entries from kim_models and expand potentials
+    candidates = []
+    if len(records1) > 0:
+
+        # Match installed kim ids to the records by shortcode
+        fullids = pd.Series([m for m in kim_models if '__MO_' in m], dtype=object)
+        shortcodes = fullids.str.split('_').str[-3:-1].str.join('_')
+        counts = df1.name.value_counts()
+        unique = df1[df1.name.isin(counts[counts == 1].index)]
+        recindex = pd.Series(unique.index, index=unique.name.values)
+        matches = shortcodes.map(recindex)
+        
+        for fullid, i in zip(fullids[matches.notna()], matches[matches.notna()]):
+            dbrecord = records1[int(i)]
+
+            # Capture records as is if associated with one potential
+            if len(dbrecord.potentials) == 1:
+                candidates.append({'fullid': fullid, 'i': int(i), 'potkey': None,
+                                   'multi': False})
+            
+            # List each potential for multi-potential records
+            else:
+                for potential in dbrecord.potentials:
+                    candidates.append({
+                        'fullid': fullid, 'i': int(i), 'potkey': potential.key,
+                        'potid': potential.id, 'multi': True,
+                        'symbols': [atom.symbol for atom in potential.atoms],
+                        'elements': [atom.element for atom in potential.atoms]})
+    candidates = pd.DataFrame(candidates, columns=['fullid', 'i', 'potkey', 'potid',
+                                                   'multi', 'symbols', 'elements'])
+
+    # Limit multi-potential entries based on search parameters
+    if len(candidates) > 0:
+        multi = candidates.multi.astype(bool)
+        mask = pd.Series(True, index=candidates.index)
+        if potkey is not None:
+            mask &= candidates.potkey.isin(aslist(potkey))
+        if potid is not None:
+            mask &= candidates.potid.isin(aslist(potid))
+        if symbols is not None:
+            mask &= contains_all(candidates.symbols, symbols)
+        if elements is not None:
+            mask &= contains_all(candidates.elements, elements)
+        keep = ~multi | mask
+
+        # Filter by key and id
+        if key is not None:
+            keep &= candidates.fullid.str[-19:].isin(aslist(key))
+        if id is not None:
+            keep &= candidates.fullid.isin(aslist(id))
+        candidates = candidates[keep]
+
+    # Build shallow copies sharing each record's loaded model
     records2 = []
     df2 = []
-    if len(records1) > 0:
-        for fullid in kim_models:
-            if '__MO_' in fullid:
-                shortcode = '_'.join(fullid.split('_')[-3:-1])
-
-                matches = df1[df1.name == shortcode]
-                if len(matches) == 1:
-                    dbrecord = records1[matches.index.tolist()[0]]
-                    record = load_record('potential_LAMMPS_KIM', model=dbrecord.model, id=fullid)
-
-                    # Capture records as is if associated with one potential
-                    if len(record.potentials) == 1:
-                        records2.append(record)
-                        df2.append(record.metadata())
-
-                    else:
-                        # Loop over potential keys
-                        for potential in record.potentials:
-                            record.select_potential(potkey=potential.key)
-
-                            # Limit based on search parameters
-                            if potkey is not None and record.potkey not in aslist(potkey):
-                                continue
-                            if potid is not None and record.potid not in aslist(potid):
-                                continue
-                            if symbols is not None:
-                                nomatch = False
-                                for symbol in aslist(symbols):
-                                    if symbol not in record.symbols:
-                                        nomatch = True
-                                        break
-                                if nomatch:
-                                    continue
-                            if elements is not None:
-                                nomatch = False
-                                record_elements = record.elements()
-                                for element in aslist(elements):
-                                    if element not in record_elements:
-                                        nomatch = True
-                                        break
-                                if nomatch:
-                                    continue
-
-                            # Capture copy of the record
-                            records2.append(deepcopy(record))
-                            df2.append(record.metadata())
-
-    records2 = np.array(records2)
+    for fullid, i, entrypotkey in zip(candidates.fullid, candidates.i,
+                                      candidates.potkey):
+        record = records1[int(i)].copy_potential(id=fullid, potkey=entrypotkey)
+        records2.append(record)
+        df2.append(record.metadata())
     df2 = pd.DataFrame(df2)
 
-    # Filter by key and id if needed
-    if len(records2) > 0:
-        matches = (
-            load_query('str_match', name='key').pandas(df2, key)
-            &load_query('str_match', name='id').pandas(df2, id)
-        )
-        df2 = df2[matches]
-        records2 = records2[matches]
-        df2.reset_index(drop=True)
+    records2 = RecordList(df2, records2)
 
     if verbose:
         print(f'Built {len(records2)} lammps potentials for KIM models')
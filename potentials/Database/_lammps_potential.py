@@ -1,5 +1,7 @@
 # coding: utf-8
 # Standard libraries
+from functools import partial
+import os
 from pathlib import Path
 import shutil
 import tempfile
@@ -16,6 +18,11 @@ from yabadaba.record import Record
 
 # Local imports
 from .. import settings
+from ..record._download import download_artifacts
+from ._record_list import RecordList
+from ._archive import archive_formats, build_archive, open_archive
+from ._artifact_store import ArtifactStore
+from ._staging import stage_file, staging_modes
 
 def get_lammps_potentials(self,
                           name: Union[str, list, None] = None,
@@ -110,8 +117,9 @@ def get_lammps_potentials(self,
     
     Returns
     -------
-    numpy.NDArray of Record subclasses
-        The retrived records.
+    RecordList of Record subclasses
+        The retrived records.  Each record is only built from its model when
+        it is first accessed.
     pandas.DataFrame
         A table of the records' metadata.  Returned if return_df = True.
     """
@@ -132,13 +140,15 @@ def get_lammps_potentials(self,
         atom_style=atom_style, pair_style=pair_style, status=status,
         symbols=symbols, elements=elements)
 
-    # Set pot_dir values based on pot_dir_style
+    # Set pot_dir values based on pot_dir_style as records are built
     if pot_dir_style == 'id':
-        for record in records:
+        def set_pot_dir(record):
             record.pot_dir = record.id
+        records.apply(set_pot_dir)
     elif pot_dir_style == 'local':
-        for record in records:
+        def set_pot_dir(record):
             record.pot_dir = Path(self.local_database.host, 'potential_LAMMPS', record.id)
+        records.apply(set_pot_dir)
 
     # Get KIM LAMMPS records
     krecords, kdf = self.get_kim_lammps_potentials(
@@ -151,7 +161,7 @@ def get_lammps_potentials(self,
 
     # Add KIM LAMMPS records to the lists
     if len(krecords) > 0:
-        records = np.hstack([records, krecords])
+        records = RecordList.concat([records, krecords])
         df = pd.concat([df, kdf], ignore_index=True, sort=False)
 
     # Sort by name
@@ -489,6 +499,9 @@ def download_lammps_potentials(self,
                                overwrite: bool = False,
                                return_records: bool = False,
                                downloadfiles: bool = False,
+                               max_workers: int = 8,
+                               dedupe: bool = False,
+                               archive_format: str = 'tar',
                                verbose: bool = False) -> Optional[np.ndarray]:
     """
     Downloads PotentialLAMMPS and PotentialLAMMPSKIM records and any associated
@@ -536,12 +549,33 @@ def download_lammps_potentials(self,
         value is False.
     downloadfiles : bool, optional
         If True, then any parameter files associated with the potentials will
-        also be downloaded.  Default value is False.
+        also be downloaded.  If any files fail to download, the first error is
+        raised after the other downloads finish, and the potentials with
+        failed files are not deduplicated or archived.  Default value is
+        False.
+    max_workers : int, optional
+        The maximum number of parameter files to download at the same time
+        when downloadfiles is True.  Default value is 8.
+    dedupe : bool, optional
+        If True and the local database is of style local, the downloaded
+        files are stored once by SHA-256 checksum with each potential's folder
+        linking to them.  The linked files are shared, so writing to one in
+        place changes it in every folder.  See dedupe_artifacts.  Default
+        value is False.
+    archive_format : str, optional
+        The archive format used to store downloaded files in local databases
+        of styles other than local.  'tar' (default) stores gzipped tar
+        archives.  'zip' allows single files to be read without reading the
+        whole archive, but the archives are stored under the database's tar
+        names and can only be read by get_lammps_potential_files.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
     """
 
+    if archive_format not in archive_formats:
+        raise ValueError(f'Invalid archive format {archive_format}: must be one of {archive_formats}')
+
     # Download and get matching potential_LAMMPS records
     records = self.download_records(
         style='potential_LAMMPS', name=name, overwrite=overwrite,
@@ -557,31 +591,67 @@ def download_lammps_potentials(self,
 
         if self.local_database.style == 'local':
             # Download directly to local style database
+            tasks = []
             for lammps_potential in records:
                 pot_dir = Path(self.local_database.host, 'potential_LAMMPS', lammps_potential.id)
-                nd, ns = lammps_potential.download_files(pot_dir=pot_dir, overwrite=overwrite)
-                num_downloaded += nd
-                num_skipped += ns
+                lammps_potential.pot_dir = pot_dir
+                if len(lammps_potential.artifacts) > 0 and not pot_dir.is_dir():
+                    pot_dir.mkdir(parents=True)
+                for artifact in lammps_potential.artifacts:
+                    tasks.append((artifact, pot_dir))
+            summary = download_artifacts(tasks, overwrite=overwrite,
+                                         verbose=verbose,
+                                         max_workers=max_workers)
+            num_downloaded = summary['downloaded']
+            num_skipped = summary['skipped']
+            failed = summary['failed']
+            failed_dirs = [pot_dir for artifact, pot_dir in tasks
+                           if any([artifact is f[0] for f in failed])]
             if verbose:
                 if num_downloaded > 0:
                     print(f'{num_downloaded} parameter files downloaded')
                 if num_skipped > 0:
                     print(f'{num_skipped} existing parameter files skipped')
+
+            # Store identical files once
+            if dedupe is True:
+                store = self.local_artifact_store
+                for lammps_potential in records:
+                    pot_dir = Path(lammps_potential.pot_dir)
+                    if pot_dir.is_dir() and pot_dir not in failed_dirs:
+                        store.add_folder(pot_dir)
         
         else:
             # Download and then archive to other database styles
             with tempfile.TemporaryDirectory() as tmpdirname:
+                tasks = []
                 for lammps_potential in records:
-                    pot_id = lammps_potential.id
-                    pot_dir = Path(tmpdirname, pot_id)
-                    #tar_name = Path(tmpdirname, f'{pot_id}.tar.gz')
-                    lammps_potential.download_files(pot_dir=pot_dir)
+                    pot_dir = Path(tmpdirname, lammps_potential.id)
+                    lammps_potential.pot_dir = pot_dir
+                    if len(lammps_potential.artifacts) > 0:
+                        pot_dir.mkdir(parents=True)
+                    for artifact in lammps_potential.artifacts:
+                        tasks.append((artifact, pot_dir))
+                summary = download_artifacts(tasks, verbose=verbose,
+                                             max_workers=max_workers)
+                failed = summary['failed']
+                failed_dirs = [pot_dir for artifact, pot_dir in tasks
+                               if any([artifact is f[0] for f in failed])]
+
+                # Archive only potentials with all files downloaded
+                for lammps_potential in records:
+                    if Path(lammps_potential.pot_dir) in failed_dirs:
+                        continue
                     try:
-                        self.local_database.add_tar(record=lammps_potential, root_dir=tmpdirname)
+                        self.local_database.add_tar(record=lammps_potential,
+                                                    tar=build_archive(tmpdirname, lammps_potential.id,
+                                                                      archive_format))
                         num_downloaded += 1
                     except:
                         if overwrite is True:
-                            self.local_database.update_tar(record=lammps_potential, root_dir=tmpdirname)
+                            self.local_database.update_tar(record=lammps_potential,
+                                                           tar=build_archive(tmpdirname, lammps_potential.id,
+                                                                             archive_format))
                             num_downloaded += 1
                         else:
                             num_skipped += 1
@@ -591,6 +661,10 @@ def download_lammps_potentials(self,
                 if num_skipped > 0:
                     print(f'{num_skipped} potentials were skipped for already having parameter files')
 
+        # Raise the first error after all other downloads finish
+        if len(failed) > 0:
+            raise failed[0][1]
+
     # Download matching potential_LAMMPS_KIM records 
     if include_kim:
         kimrecords = self.download_records(
@@ -601,7 +675,7 @@ def download_lammps_potentials(self,
             status=status, symbols=symbols, elements=elements)
 
         if return_records:
-            return np.hstack([records, kimrecords])
+            return RecordList.concat([records, kimrecords])
     
     elif return_records:
         return records
@@ -613,11 +687,15 @@ def get_lammps_potential_files(self,
                                download: bool = True,
                                pot_dir: Optional[Path] = None,
                                overwrite: bool = False,
-                               verbose: bool = False):
+                               max_workers: int = 4,
+                               staging: str = 'copy',
+                               cache: bool = True,
+                               verbose: bool = False) -> dict:
     """
     Retrieves the potential parameter files for a LAMMPS potential and saves
     them to the pot_dir of the potential object.  If local is True and the
-    files are already in the localpath, they will be copied from there.  If
+    files are already in the localpath, they will be copied or linked from
+    there.  If
     remote is True and no files are found in local, then the files will be
     downloaded.
     
@@ -643,18 +721,49 @@ def get_lammps_potential_files(self,
         lines properly point to the copied/downloaded files.
     overwrite : bool, optional
         If False (default), then the files will not be copied/downloaded if
-        similarly named files already exist in the pot_dir.
+        similarly named files already exist in the pot_dir.  If True, existing
+        files that match their artifact's sha256 checksum are still kept, as
+        are all files if pot_dir is the database's own folder for the
+        potential.
+    max_workers : int, optional
+        The maximum number of parameter files to download at the same time.
+        Default value is 4.
+    staging : str, optional
+        How files found in a database folder are placed in pot_dir: 'copy'
+        (default), 'symlink', 'hardlink' or 'reflink'.  Links that cannot be
+        made, such as hardlinks across filesystems, fall back to copying.
+        Files read from archives or downloaded are always written as new
+        files unless an artifact cache is used.
+    cache : bool, optional
+        If True (default) and an artifact cache has been set with
+        set_artifact_cache, the files are added to the cache once from the
+        database folder, archive or url and staged to pot_dir from there
+        using the staging mode.  Concurrent processes sharing the cache wait
+        for each other instead of fetching the same files.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
+
+    Returns
+    -------
+    dict
+        The method used for each artifact filename: the staging mode used
+        for folder files, 'extract' for archive files, 'download' for
+        downloaded files, or 'existing' for files already in pot_dir.  Files
+        staged through an artifact cache report the staging mode used.
     """
+    if staging not in staging_modes:
+        raise ValueError(f'Invalid staging mode {staging}: must be one of {staging_modes}')
 
     # Set local, and remote as given here or during init
     if local is None:
         local = self.local
     if remote is None:
         remote = self.remote
+    artifact_cache = self.artifact_cache if cache is True else None
+    store = None
     
+    report = {}
     artifacts = lammps_potential.artifacts
     if len(artifacts) > 0:
 
@@ -666,78 +775,130 @@ def get_lammps_potential_files(self,
             pot_dir.mkdir(parents=True)
 
         dirpath = None
-        tar = None
+        archive = None
         
-        # Check if local has folder or tar for the potential
+        # Check if local has folder or archive for the potential
         if local is True:
             try:
                 dirpath = self.local_database.get_folder(record=lammps_potential)
             except:
                 try:
-                    tar = self.local_database.get_tar(record=lammps_potential)
+                    archive = open_archive(self.local_database, lammps_potential)
                 except:
                     pass
 
-        # Check if remote has folder or tar for the potential
-        if remote is True and dirpath is None and tar is None:
+        # Check if remote has folder or archive for the potential
+        if remote is True and dirpath is None and archive is None:
             try:
                 dirpath = self.remote_database.get_folder(record=lammps_potential)
             except:
                 try:
-                    tar = self.remote_database.get_tar(record=lammps_potential)
+                    archive = open_archive(self.remote_database, lammps_potential)
                 except:
                     pass
 
+        # Read folder files through the folder's artifact store manifest
+        in_place = False
+        if dirpath is not None:
+            store = ArtifactStore(Path(dirpath).parent.parent)
+
+            # Never replace the database folder's own files with themselves
+            in_place = os.path.samefile(pot_dir, dirpath)
+
         # Loop over listed artifacts
+        tasks = []
+        extracts = {}
         for artifact in artifacts:
             dest_name = Path(pot_dir, artifact.filename)
 
-            # Check if destination file already exists
-            if overwrite is True or not dest_name.exists():
+            # Check if destination file already exists and is not verified
+            if ((overwrite is True and not in_place and not artifact.verify(pot_dir))
+                or not dest_name.exists()):
                 copied = False
 
+                # Never write new content through a link to a database file
+                if dest_name.is_symlink() or dest_name.exists():
+                    dest_name.unlink()
+
+                # Stage through the artifact cache, populating it if needed
+                if artifact_cache is not None:
+                    source = None
+                    source_name = None if store is None else store.resolve(dirpath, artifact.filename)
+                    member = f'{lammps_potential.id}/{artifact.filename}'
+                    if source_name is not None and source_name.is_file():
+                        source = partial(shutil.copy2, source_name)
+                    elif archive is not None and member in archive:
+                        source = partial(archive.extract, member)
+                    mode = artifact_cache.stage(artifact, pot_dir, staging,
+                                                source=source, download=download,
+                                                verbose=verbose)
+                    if mode is not None:
+                        report[artifact.filename] = mode
+                    continue
+
                 # Check dirpath
                 if dirpath is not None:
                     
-                    # Copy from the local if it exists there
-                    source_name = Path(dirpath, artifact.filename)
+                    # Copy or link from the local if it exists there
+                    source_name = store.resolve(dirpath, artifact.filename)
                     if source_name.is_file():
-                        shutil.copy2(source_name, dest_name)
+                        mode = stage_file(source_name, dest_name, staging)
+                        report[artifact.filename] = mode
                         copied = True
                         if verbose:
-                            print(f'{artifact.filename} copied to {pot_dir}')
+                            action = 'copied' if mode == 'copy' else f'{mode}ed'
+                            print(f'{artifact.filename} {action} to {pot_dir}')
                     else:
                         if verbose:
                             print(f'{artifact.filename} missing from database folder')
 
-                # Check tar
-                if tar is not None:
-                    try:
-                        fr = tar.extractfile(f'{lammps_potential.id}/{artifact.filename}')
-                    except:
-                        if verbose:
-                            print(f'{artifact.filename} missing from database archive')
-                    else:
-                        with open(dest_name, 'wb') as fw:
-                            fw.write(fr.read())
-                        fr.close()
-                        copied = True
-                        if verbose:
-                            print(f'{artifact.filename} copied to {pot_dir}')    
+                # Extract from the archive after all artifacts are checked
+                if archive is not None and copied is False:
+                    extracts[f'{lammps_potential.id}/{artifact.filename}'] = artifact
+                    continue
 
                 # Download using the artifact's url
                 if download is True and copied is False:
-                    artifact.download(pot_dir, overwrite=overwrite, verbose=verbose)
+                    tasks.append((artifact, pot_dir))
+                    report[artifact.filename] = 'download'
             
             else:
+                report[artifact.filename] = 'existing'
                 if verbose:
                     print(f'{artifact.filename} already in {pot_dir}')
 
+        # Extract all archive files together, downloading any missing ones
+        if archive is not None:
+            extracted = archive.extract_many({member: Path(pot_dir, artifact.filename)
+                                              for member, artifact in extracts.items()})
+            archive.close()
+            for member, artifact in extracts.items():
+                if member in extracted:
+                    report[artifact.filename] = 'extract'
+                    if verbose:
+                        print(f'{artifact.filename} copied to {pot_dir}')
+                else:
+                    if verbose:
+                        print(f'{artifact.filename} missing from database archive')
+                    if download is True:
+                        tasks.append((artifact, pot_dir))
+                        report[artifact.filename] = 'download'
+
+        # Download all files not copied at the same time
+        summary = download_artifacts(tasks, overwrite=overwrite,
+                                     verbose=verbose, max_workers=max_workers)
+        if len(summary['failed']) > 0:
+            raise summary['failed'][0][1]
+
+    return report
+
 def save_lammps_potential(self,
                           lammps_potential: Record,
                           filenames: Optional[list] = None,
                           downloadfiles: bool = False,
                           overwrite: bool = False,
+                          dedupe: bool = False,
+                          archive_format: str = 'tar',
                           verbose: bool = False):
     """
     Saves a LAMMPS potential to the local.
@@ -755,6 +916,17 @@ def save_lammps_potential(self,
     overwrite : bool, optional
         If False (default), then any existing records/artifacts will be
         skipped.  If True, then the existing contents will be replaced.
+    dedupe : bool, optional
+        If True and the local database is of style local, the saved files are
+        stored once by SHA-256 checksum with the potential's folder linking to
+        them.  The linked files are shared, so writing to one in place changes
+        it in every folder.  See dedupe_artifacts.  Default value is False.
+    archive_format : str, optional
+        The archive format used to store files in local databases of styles
+        other than local.  'tar' (default) stores gzipped tar archives.  'zip'
+        allows single files to be read without reading the whole archive,
+        but the archives are stored under the database's tar names and can
+        only be read by get_lammps_potential_files.
     verbose : bool, optional
         If True, informational print statements will be generated.
 
@@ -769,6 +941,8 @@ def save_lammps_potential(self,
     # Check for conflicting parameters
     if filenames is not None and downloadfiles is True:
         raise ValueError('Cannot give filenames with downloadfiles=True')
+    if archive_format not in archive_formats:
+        raise ValueError(f'Invalid archive format {archive_format}: must be one of {archive_formats}')
 
     self.save_record(record=lammps_potential, overwrite=overwrite,
                      verbose=verbose)
@@ -804,12 +978,16 @@ def save_lammps_potential(self,
                     shutil.copy2(filename, pot_dir)
                 
                 try:
-                    self.local_database.add_tar(record=lammps_potential, root_dir=tmpdirname)
+                    self.local_database.add_tar(record=lammps_potential,
+                                                tar=build_archive(tmpdirname, lammps_potential.id,
+                                                                  archive_format))
                     if verbose:
                         print('files saved to local archive')
                 except:
                     if overwrite is True:
-                        self.local_database.update_tar(record=lammps_potential, root_dir=tmpdirname)
+                        self.local_database.update_tar(record=lammps_potential,
+                                                       tar=build_archive(tmpdirname, lammps_potential.id,
+                                                                         archive_format))
                         if verbose:
                             print('files updated in local archive')
                     else:
@@ -843,18 +1021,32 @@ def save_lammps_potential(self,
                             print('files skipped as local folder exists')
             else:
                 try:
-                    self.local_database.add_tar(record=lammps_potential, root_dir=tmpdirname)
+                    self.local_database.add_tar(record=lammps_potential,
+                                                tar=build_archive(tmpdirname, lammps_potential.id,
+                                                                  archive_format))
                     if verbose:
                         print('files downloaded and saved to local archive')
                 except:
                     if overwrite is True:
-                        self.local_database.update_tar(record=lammps_potential, root_dir=tmpdirname)
+                        self.local_database.update_tar(record=lammps_potential,
+                                                       tar=build_archive(tmpdirname, lammps_potential.id,
+                                                                         archive_format))
                         if verbose:
                             print('files downloaded and updated in local archive')
                     else:
                         if verbose:
                             print('files skipped as local archive exists')
 
+    # Store identical files once
+    if (dedupe is True and self.local_artifact_store is not None
+        and (filenames is not None or downloadfiles is True)):
+        try:
+            dirpath = self.local_database.get_folder(record=lammps_potential)
+        except NotADirectoryError:
+            pass
+        else:
+            self.local_artifact_store.add_folder(dirpath)
+
 def upload_lammps_potential(self,
                             lammps_potential: Record,
                             workspace: Union[str, pd.Series, None] = None,
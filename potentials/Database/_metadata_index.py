@@ -0,0 +1,292 @@
+# coding: utf-8
+# Standard libraries
+import os
+from pathlib import Path
+import sqlite3
+from typing import Optional, Union
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# https://github.com/usnistgov/yabadaba
+from yabadaba import load_record
+from yabadaba.record import Record
+from yabadaba.tools import aslist
+
+# Local imports
+from . import _json
+
+class MetadataIndex():
+    """
+    Persistent SQLite index of record metadata for a local-style database.
+    Record metadata is stored along with the modification time and size of
+    each record file so that the index can be brought up to date by only
+    reading new and changed records.  Common LAMMPS potential fields are
+    stored in indexed columns allowing queries to be filtered in SQL without
+    loading any record models.
+    """
+
+    # Increment when the table layout or stored metadata changes
+    version = 2
+
+    # Record styles that are indexed
+    styles = ('potential_LAMMPS', 'potential_LAMMPS_KIM')
+
+    # Metadata fields stored in columns and matched against any given value
+    strfields = ('name', 'key', 'id', 'potkey', 'potid', 'units',
+                 'atom_style', 'pair_style', 'status')
+
+    # Metadata list fields stored in tables and required to contain all values
+    listfields = ('symbols', 'elements')
+
+    def __init__(self,
+                 host: Union[str, Path],
+                 filename: str = 'metadata_index.sqlite'):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        host : path-like object
+            The host directory of the local database.
+        filename : str, optional
+            The name of the index file to use in the host directory.  Default
+            value is 'metadata_index.sqlite'.
+        """
+        self.__host = Path(host)
+        self.__path = Path(host, filename)
+
+    @property
+    def host(self) -> Path:
+        """pathlib.Path : The host directory of the local database"""
+        return self.__host
+
+    @property
+    def path(self) -> Path:
+        """pathlib.Path : The path to the index file"""
+        return self.__path
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Opens a connection to the index file, (re)building the tables if the
+        file is new or was created by a different index version.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The open connection.
+        """
+        conn = sqlite3.connect(self.path)
+        try:
+            version = conn.execute("SELECT value FROM info WHERE key='version'").fetchone()[0]
+        except (sqlite3.Error, TypeError):
+            version = None
+
+        if version != self.version:
+            with conn:
+                for table in ['info', 'records', 'symbols', 'elements']:
+                    conn.execute(f'DROP TABLE IF EXISTS {table}')
+                conn.execute('CREATE TABLE info (key TEXT PRIMARY KEY, value)')
+                conn.execute('INSERT INTO info VALUES (?, ?)', ('version', self.version))
+
+                columns = ', '.join([f'{field} TEXT' for field in self.strfields[1:]])
+                conn.execute(f'CREATE TABLE records (style TEXT, name TEXT, {columns}, '
+                             'mtime INTEGER, size INTEGER, metadata TEXT, '
+                             'PRIMARY KEY (style, name))')
+                for field in self.strfields[1:]:
+                    conn.execute(f'CREATE INDEX records_{field} ON records (style, {field})')
+                for field in self.listfields:
+                    conn.execute(f'CREATE TABLE {field} (style TEXT, name TEXT, value TEXT)')
+                    conn.execute(f'CREATE INDEX {field}_value ON {field} (style, value)')
+                    conn.execute(f'CREATE INDEX {field}_name ON {field} (style, name)')
+        return conn
+
+    def __insert(self,
+                 conn: sqlite3.Connection,
+                 record: Record,
+                 stat: os.stat_result):
+        """Adds or replaces one record's entries"""
+        meta = record.metadata()
+        self.__delete(conn, record.style, record.name)
+
+        values = [record.style, record.name]
+        for field in self.strfields[1:]:
+            value = meta.get(field, None)
+            values.append(None if value is None else str(value))
+        values += [stat.st_mtime_ns, stat.st_size, _json.dumps(meta)]
+        conn.execute(f'INSERT INTO records VALUES ({", ".join(["?"] * len(values))})',
+                     values)
+
+        for field in self.listfields:
+            rows = [(record.style, record.name, str(value))
+                    for value in aslist(meta.get(field, None)) if value is not None]
+            conn.executemany(f'INSERT INTO {field} VALUES (?, ?, ?)', rows)
+
+    def __delete(self,
+                 conn: sqlite3.Connection,
+                 style: str,
+                 name: str):
+        """Removes one record's entries"""
+        for table in ('records',) + self.listfields:
+            conn.execute(f'DELETE FROM {table} WHERE style=? AND name=?',
+                         (style, name))
+
+    def sync(self,
+             style: str,
+             database,
+             refresh: bool = False) -> int:
+        """
+        Brings the index for a record style up to date with the record files.
+        Only records whose files are new or have changed modification times or
+        sizes are loaded.
+
+        Parameters
+        ----------
+        style : str
+            The record style to update.
+        database : yabadaba.database.LocalDatabase
+            The local database that the index is for.
+        refresh : bool, optional
+            If True, all records of the style are reindexed.  Default value is
+            False.
+
+        Returns
+        -------
+        int
+            The number of records added, changed or removed.
+        """
+        style_dir = Path(self.host, style)
+        ext = f'.{database.format}'
+
+        # Stat all record files
+        files = {}
+        if style_dir.is_dir():
+            with os.scandir(style_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(ext) and entry.is_file():
+                        files[entry.name[:-len(ext)]] = entry.stat()
+
+        with self.connect() as conn:
+            indexed = {}
+            if not refresh:
+                for name, mtime, size in conn.execute(
+                        'SELECT name, mtime, size FROM records WHERE style=?', (style,)):
+                    indexed[name] = (mtime, size)
+            else:
+                for table in ('records',) + self.listfields:
+                    conn.execute(f'DELETE FROM {table} WHERE style=?', (style,))
+
+            count = 0
+            for name in indexed.keys() - files.keys():
+                self.__delete(conn, style, name)
+                count += 1
+
+            for name, stat in files.items():
+                if indexed.get(name, None) != (stat.st_mtime_ns, stat.st_size):
+                    fname = Path(style_dir, f'{name}{ext}')
+                    self.__insert(conn, load_record(style, model=fname, name=name), stat)
+                    count += 1
+        conn.close()
+
+        return count
+
+    def update(self,
+               record: Record,
+               database):
+        """
+        Updates the index entries for one record after it has been saved to
+        the local database.
+
+        Parameters
+        ----------
+        record : Record
+            The saved record.
+        database : yabadaba.database.LocalDatabase
+            The local database that the index is for.
+        """
+        if record.style not in self.styles or not self.path.is_file():
+            return
+        fname = Path(self.host, record.style, f'{record.name}.{database.format}')
+        with self.connect() as conn:
+            if fname.is_file():
+                self.__insert(conn, record, fname.stat())
+            else:
+                self.__delete(conn, record.style, record.name)
+        conn.close()
+
+    def remove(self,
+               style: str,
+               name: str):
+        """
+        Removes the index entries for one record after it has been deleted
+        from the local database.
+
+        Parameters
+        ----------
+        style : str
+            The record's style.
+        name : str
+            The record's name.
+        """
+        if style not in self.styles or not self.path.is_file():
+            return
+        with self.connect() as conn:
+            self.__delete(conn, style, name)
+        conn.close()
+
+    def query(self,
+              style: str,
+              database,
+              refresh: bool = False,
+              **kwargs) -> pd.DataFrame:
+        """
+        Gets the metadata for matching records.  The index is synced before
+        the query is made.
+
+        Parameters
+        ----------
+        style : str
+            The record style to search.
+        database : yabadaba.database.LocalDatabase
+            The local database that the index is for.
+        refresh : bool, optional
+            If True, all records of the style are reindexed first.  Default
+            value is False.
+        **kwargs : any, optional
+            Any of the record-specific metadata keywords that can be searched
+            for.  Keywords in strfields and listfields are applied in SQL,
+            then all keywords are applied with the record's pandasfilter.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The metadata of the matching records, sorted by name.
+        """
+        self.sync(style, database, refresh=refresh)
+
+        # Build SQL filters for the indexed fields
+        where = ['style=?']
+        params = [style]
+        for field in self.strfields:
+            if kwargs.get(field, None) is not None:
+                values = [str(value) for value in aslist(kwargs[field])]
+                where.append(f'{field} IN ({", ".join(["?"] * len(values))})')
+                params += values
+        for field in self.listfields:
+            if kwargs.get(field, None) is not None:
+                for value in aslist(kwargs[field]):
+                    where.append(f'name IN (SELECT name FROM {field} WHERE style=? AND value=?)')
+                    params += [style, str(value)]
+
+        with self.connect() as conn:
+            sql = f'SELECT metadata FROM records WHERE {" AND ".join(where)} ORDER BY name'
+            meta = [_json.loads(row[0]) for row in conn.execute(sql, params)]
+        conn.close()
+
+        if len(meta) == 0:
+            return pd.DataFrame(columns=load_record(style).metadatakeys)
+        df = pd.DataFrame(meta)
+
+        # Apply the full record filter for any non-indexed fields
+        mask = load_record(style).pandasfilter(df, **kwargs)
+        return df[mask].reset_index(drop=True)
@@ -0,0 +1,222 @@
+# coding: utf-8
+# Standard libraries
+from collections import OrderedDict
+from functools import partial
+import json
+from pathlib import Path
+import time
+from typing import Optional, Tuple, Union
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# https://github.com/usnistgov/yabadaba
+from yabadaba import load_record
+
+# Local imports
+from . import _json
+from ._record_list import RecordList
+
+class QueryCache():
+    """
+    In-process cache of remote database query results with time-to-live
+    expiration and least-recently-used eviction.  Results are stored as the
+    record models and metadata rather than Record objects so that each hit
+    returns new records that can be freely modified.
+    """
+    def __init__(self,
+                 ttl: float = 300.0,
+                 maxsize: int = 128,
+                 path: Union[str, Path, None] = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        ttl : float, optional
+            The number of seconds that cached results remain valid.  Default
+            value is 300.
+        maxsize : int, optional
+            The maximum number of query results to keep.  The least recently
+            used results are removed first.  Default value is 128.
+        path : path-like object, optional
+            If given, the cache will be loaded from and saved to this file
+            allowing results to persist between sessions.
+        """
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.__ttl = ttl
+        self.__maxsize = maxsize
+        self.__path = None if path is None else Path(path)
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        if self.__path is not None:
+            self.load()
+
+    @property
+    def ttl(self) -> float:
+        """float : The number of seconds that cached results remain valid"""
+        return self.__ttl
+
+    @property
+    def maxsize(self) -> int:
+        """int : The maximum number of query results to keep"""
+        return self.__maxsize
+
+    @property
+    def path(self) -> Optional[Path]:
+        """pathlib.Path or None : The file the cache persists to"""
+        return self.__path
+
+    @property
+    def hits(self) -> int:
+        """int : The number of queries answered from the cache"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """int : The number of queries sent to the database"""
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __repr__(self) -> str:
+        return f'QueryCache({len(self)} entries, {self.hits} hits, {self.misses} misses)'
+
+    @staticmethod
+    def key(host: str,
+            style: str,
+            **kwargs) -> str:
+        """
+        Generates a normalized cache key for a query.  Parameters with None
+        values are ignored and list values are sorted so that equivalent
+        queries share a key.
+
+        Parameters
+        ----------
+        host : str
+            The database host.
+        style : str
+            The record style queried.
+        **kwargs : any, optional
+            The query parameters.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        terms = {}
+        for k, v in kwargs.items():
+            if v is None:
+                continue
+            if isinstance(v, (list, tuple, set)):
+                v = sorted([str(x) for x in v])
+                if len(v) == 1:
+                    v = v[0]
+            terms[k] = v
+        return json.dumps([str(host), style, terms], sort_keys=True, default=str)
+
+    def get_records(self,
+                    database,
+                    style: str,
+                    **kwargs) -> Tuple[RecordList, pd.DataFrame]:
+        """
+        Gets records from a database, using cached results when available.
+
+        Parameters
+        ----------
+        database : yabadaba.database.Database
+            The database to query.
+        style : str
+            The record style to search.
+        **kwargs : any, optional
+            Any other parameters for the database's get_records method.
+
+        Returns
+        -------
+        records : RecordList
+            The matching records.
+        df : pandas.DataFrame
+            The matching records' metadata.
+        """
+        key = self.key(database.host, style, **kwargs)
+        now = time.time()
+
+        # Check for a valid cached result
+        entry = self.__entries.get(key, None)
+        if entry is not None and now - entry[0] < self.ttl:
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            timestamp, models, df = entry
+
+        # Query the database and cache the result
+        else:
+            self.__misses += 1
+            records, df = database.get_records(style, return_df=True, **kwargs)
+            models = [(record.style, record.name, record.model.json())
+                      for record in records]
+            self.__entries[key] = (now, models, df)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+            if self.path is not None:
+                self.save()
+
+        # Build new records on access
+        items = [partial(load_record, recstyle, model=model, name=name,
+                         database=database)
+                 for recstyle, name, model in models]
+        df = df.copy()
+        return RecordList(df, items), df
+
+    def clear(self):
+        """Removes all cached results and resets the hit and miss counters"""
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+        if self.path is not None and self.path.is_file():
+            self.path.unlink()
+
+    def save(self):
+        """Saves the unexpired cached results to the cache file"""
+        if self.path is None:
+            raise ValueError('no path set for the cache')
+        now = time.time()
+        entries = []
+        for k, (timestamp, models, df) in self.__entries.items():
+            if now - timestamp < self.ttl:
+                entries.append([k, timestamp, models,
+                                {'columns': df.columns.tolist(),
+                                 'data': df.values.tolist()}])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmppath = Path(f'{self.path}.tmp')
+        with open(tmppath, 'w', encoding='UTF-8') as f:
+            f.write(_json.dumps(entries))
+        tmppath.replace(self.path)
+
+    def load(self):
+        """Loads the unexpired cached results from the cache file"""
+        if self.path is None:
+            raise ValueError('no path set for the cache')
+        if not self.path.is_file():
+            return
+        try:
+            with open(self.path, encoding='UTF-8') as f:
+                entries = _json.loads(f.read())
+            entries = [(k, timestamp, [tuple(model) for model in models],
+                        pd.DataFrame(df['data'], columns=df['columns']))
+                       for k, timestamp, models, df in entries]
+        except Exception:
+            # Ignore unreadable cache files
+            return
+        now = time.time()
+        for k, timestamp, models, df in entries:
+            if now - timestamp < self.ttl:
+                self.__entries[k] = (timestamp, models, df)
+        while len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
@@ -1,5 +1,6 @@
 # coding: utf-8
 # Standard Python libraries
+from functools import partial
 import io
 from pathlib import Path
 from typing import Callable, Optional, Tuple, Union
@@ -17,6 +18,10 @@ from DataModelDict import DataModelDict as DM
 from yabadaba.record import Record
 from yabadaba import load_record
 
+# Local imports
+from ._metadata_index import MetadataIndex
+from ._record_list import RecordList
+
 def get_records(self,
                 style: Optional[str] = None,
                 name: Union[str, list, None] = None,
@@ -62,8 +67,9 @@ def get_records(self,
 
     Returns
     -------
-    numpy.NDArray of Record subclasses
-        The retrived records.
+    RecordList of Record subclasses
+        The retrived records.  Each record is only built from its model when
+        it is first accessed.
     pandas.DataFrame
         A table of the records' metadata.  Returned if return_df = True.
     
@@ -92,29 +98,58 @@ def get_records(self,
                 raise ValueError('local database must be of style local to refresh cache')
             else:
                 kwargs['refresh_cache'] = refresh_cache
-        l_recs, l_df = self.local_database.get_records(style, name=name, return_df=True, **kwargs)
+        
+        if self.local_index is not None and style in MetadataIndex.styles:
+            # Query indexed styles from the metadata index
+            kwargs.pop('refresh_cache', None)
+            l_df = self.local_index.query(style, self.local_database,
+                                          refresh=refresh_cache, name=name,
+                                          **kwargs)
+        elif self.local_database.style == 'local':
+            # Query other styles from the metadata cache
+            l_df = self.local_database.get_records_df(style, name=name, **kwargs)
+        else:
+            l_df = None
+        
+        if l_df is not None:
+            # Only build the records when accessed
+            items = []
+            for recname in l_df.name:
+                fname = Path(self.local_database.host, style,
+                             f'{recname}.{self.local_database.format}')
+                items.append(partial(load_record, style, model=fname,
+                                     database=self.local_database))
+            l_recs = RecordList(l_df, items)
+        else:
+            l_recs, l_df = self.local_database.get_records(style, name=name, return_df=True, **kwargs)
+            l_recs = RecordList(l_df, l_recs)
         if len(l_recs) == 0:
             l_df = pd.DataFrame({'name':[]})
         if verbose:
             print(f'Found {len(l_recs)} matching {style} records in local library')
     else:
-        l_recs = np.array([])
+        l_recs = RecordList()
         l_df = pd.DataFrame({'name':[]})
     
     # Get remote records
     if remote:
         try:
-            r_recs, r_df = self.remote_database.get_records(style, name=name,
-                                                            return_df=True, **kwargs)
+            if self.remote_cache is not None:
+                r_recs, r_df = self.remote_cache.get_records(self.remote_database,
+                                                             style, name=name, **kwargs)
+            else:
+                r_recs, r_df = self.remote_database.get_records(style, name=name,
+                                                                return_df=True, **kwargs)
+                r_recs = RecordList(r_df, r_recs)
         except Exception as e:
-            r_recs = np.array([])
+            r_recs = RecordList()
             r_df = pd.DataFrame({'name':[]})
             if verbose:
                 print(f'Remote access failed: {e}')
         if verbose:
             print(f'Found {len(r_recs)} matching {style} records in remote library')
     else:
-        r_recs = np.array([])
+        r_recs = RecordList()
         r_df = pd.DataFrame({'name':[]})
 
     # Combine results
@@ -132,7 +167,7 @@ def get_records(self,
             print(f' - {len(newr_recs)} remote records are new')
         
         # Combine local and new remote
-        records = np.hstack([l_recs, newr_recs])
+        records = RecordList.concat([l_recs, newr_recs])
         df = pd.concat([l_df, newr_df], ignore_index=True, sort=False)
 
     # Sort by name
@@ -397,13 +432,26 @@ def remote_query(self,
     
     Returns
     -------
-    numpy.NDArray of Record subclasses
-        The retrived records.
+    RecordList of Record subclasses
+        The retrived records.  Each record is only built from its model when
+        it is first accessed.
     pandas.DataFrame
         A table of the records' metadata.  Returned if return_df = True.
     """
-    return self.remote_database.get_records(style=style, return_df=return_df,
-                                            query=query, keyword=keyword, name=name)
+    if self.remote_cache is not None:
+        records, df = self.remote_cache.get_records(self.remote_database, style,
+                                                    query=query, keyword=keyword,
+                                                    name=name)
+    else:
+        records, df = self.remote_database.get_records(style=style, return_df=True,
+                                                       query=query, keyword=keyword,
+                                                       name=name)
+        records = RecordList(df, records)
+    
+    if return_df:
+        return records, df
+    else:
+        return records
 
 def download_records(self,
                      style: Optional[str] = None,
@@ -437,7 +485,7 @@ def download_records(self,
 
     Returns
     -------
-    numpy.NDArray of Record subclasses
+    RecordList of Record subclasses
         The retrived records.  Only returned if return_records=True.
     
     Raises
@@ -453,7 +501,9 @@ def download_records(self,
         raise ValueError('remote database info not set: initialize with remote=True or call set_remote_database')
     
     # Get matching remote records
-    records = self.remote_database.get_records(style, name=name, **kwargs)
+    records, df = self.remote_database.get_records(style, name=name,
+                                                   return_df=True, **kwargs)
+    records = RecordList(df, records)
     if verbose:
         print(f'Found {len(records)} matching {style} records in remote library')
     
@@ -470,6 +520,9 @@ def download_records(self,
                 num_changed += 1
             else:
                 num_skipped += 1
+                continue
+        if self.local_index is not None:
+            self.local_index.update(record, self.local_database)
     
     if verbose:
         print(num_added, 'new records added to local')
@@ -522,6 +575,9 @@ def save_record(self,
                                               verbose=verbose)
         else:
             raise ValueError('Matching record already exists: use overwrite=True to change it') from e
+    
+    if self.local_index is not None:
+        self.local_index.update(record, self.local_database)
 
 def upload_record(self,
                   record: Optional[Record] = None,
@@ -618,6 +674,11 @@ def delete_record(self,
     if local:
         self.local_database.delete_record(record=record, name=name, style=style,
                                           verbose=verbose)
+        if self.local_index is not None:
+            if record is not None:
+                self.local_index.remove(record.style, record.name)
+            elif style is not None:
+                self.local_index.remove(style, name)
     if remote:
         self.remote_database.delete_record(record=record, name=name, style=style,
                                            verbose=verbose)
@@ -0,0 +1,168 @@
+# coding: utf-8
+# Standard libraries
+from typing import Any, Callable, Iterator, Optional, Union
+
+# https://numpy.org/
+import numpy as np
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# https://github.com/usnistgov/yabadaba
+from yabadaba.record import Record
+
+class RecordList():
+    """
+    Lazy list of records returned by the Database get methods.  The metadata
+    DataFrame for the records is available immediately, while each Record
+    object is only built from its model the first time it is accessed.
+    Supports len(), iteration, and numpy-style indexing by int, slice, list of
+    ints or boolean mask.  Converting to a numpy array builds all records.
+    """
+    def __init__(self,
+                 df: Optional[pd.DataFrame] = None,
+                 items: Optional[list] = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame, optional
+            The metadata for the records with one row per record.
+        items : list, optional
+            The records in the same order as the rows of df.  Each item is
+            either a Record or a function that takes no arguments and returns
+            the Record.
+        """
+        if df is None:
+            df = pd.DataFrame({'name':[]})
+        if items is None:
+            items = []
+        if len(df) != len(items):
+            raise ValueError('df and items must have the same length')
+        self.__df = df.reset_index(drop=True)
+        self.__items = list(items)
+
+    @classmethod
+    def concat(cls, recordlists: list) -> 'RecordList':
+        """
+        Joins RecordLists together without building any records.
+
+        Parameters
+        ----------
+        recordlists : list
+            The RecordList objects to join.
+
+        Returns
+        -------
+        RecordList
+            The joined records.
+        """
+        recordlists = [r for r in recordlists if len(r) > 0]
+        if len(recordlists) == 0:
+            return cls()
+        df = pd.concat([r.df for r in recordlists], ignore_index=True, sort=False)
+        items = []
+        for r in recordlists:
+            items.extend(r.__items)
+        return cls(df, items)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """pandas.DataFrame : The metadata of the records"""
+        return self.__df
+
+    @property
+    def shape(self) -> tuple:
+        """tuple : The array-equivalent shape"""
+        return (len(self),)
+
+    @property
+    def size(self) -> int:
+        """int : The number of records"""
+        return len(self)
+
+    @property
+    def ndim(self) -> int:
+        """int : The array-equivalent number of dimensions"""
+        return 1
+
+    @property
+    def num_built(self) -> int:
+        """int : The number of records that have been built so far"""
+        return sum([isinstance(item, Record) for item in self.__items])
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __repr__(self) -> str:
+        return f'RecordList({len(self)} records, {self.num_built} built)'
+
+    def __build(self, i: int) -> Record:
+        """Builds record i if needed and returns it"""
+        item = self.__items[i]
+        if not isinstance(item, Record):
+            item = item()
+            self.__items[i] = item
+        return item
+
+    def __getitem__(self, index: Any) -> Union[Record, 'RecordList']:
+        # Single records are built and returned
+        if isinstance(index, (int, np.integer)):
+            return self.__build(index)
+
+        # Everything else returns a new lazy RecordList
+        if isinstance(index, slice):
+            indices = range(len(self))[index]
+        else:
+            index = np.asarray(index)
+            if index.dtype == bool:
+                if len(index) != len(self):
+                    raise IndexError('boolean index does not match number of records')
+                indices = np.flatnonzero(index)
+            elif len(index) == 0:
+                indices = []
+            else:
+                indices = index.astype(int)
+        return RecordList(self.__df.iloc[list(indices)],
+                          [self.__items[i] for i in indices])
+
+    def __iter__(self) -> Iterator[Record]:
+        for i in range(len(self)):
+            yield self.__build(i)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        array = np.empty(len(self), dtype=object)
+        for i, record in enumerate(self):
+            array[i] = record
+        return array
+
+    def tolist(self) -> list:
+        """Builds all records and returns them as a list"""
+        return list(self)
+
+    def apply(self, func: Callable[[Record], Any]) -> 'RecordList':
+        """
+        Applies a function to each record as it is built.  Records that have
+        already been built are passed to the function immediately.
+
+        Parameters
+        ----------
+        func : function
+            A function that takes a Record and modifies it in place.
+
+        Returns
+        -------
+        RecordList
+            This RecordList, allowing calls to be chained.
+        """
+        for i, item in enumerate(self.__items):
+            if isinstance(item, Record):
+                func(item)
+            else:
+                def build(item=item):
+                    record = item()
+                    func(record)
+                    return record
+                self.__items[i] = build
+        return self
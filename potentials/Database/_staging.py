@@ -0,0 +1,88 @@
+# coding: utf-8
+# Standard libraries
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import Union
+
+# The Linux ioctl request for cloning a file's extents (FICLONE)
+_FICLONE = 0x40049409
+
+staging_modes = ('copy', 'symlink', 'hardlink', 'reflink')
+
+def stage_file(source: Union[str, Path],
+               dest: Union[str, Path],
+               mode: str = 'copy') -> str:
+    """
+    Places a copy of or a link to a source file at dest.  Linking modes that
+    are not possible for the two locations, such as hardlinks across
+    filesystems or reflinks on filesystems without copy-on-write support,
+    fall back to a regular copy.
+
+    Parameters
+    ----------
+    source : path-like object
+        The file to stage.
+    dest : path-like object
+        The path to stage the file to.  Any existing file or link at dest is
+        atomically replaced.
+    mode : str, optional
+        'copy' (default) copies the file contents and metadata, 'symlink'
+        creates a symbolic link to the absolute source path, 'hardlink'
+        creates a hard link to the source, and 'reflink' creates a
+        copy-on-write clone of the source.
+
+    Returns
+    -------
+    str
+        The mode that was actually used.
+    """
+    if mode not in staging_modes:
+        raise ValueError(f'Invalid staging mode {mode}: must be one of {staging_modes}')
+    source = Path(source)
+    dest = Path(dest)
+
+    # Stage to a temporary name then replace dest so that other processes
+    # never see a partial file and existing links are never written through
+    tmpdest = dest.with_name(f'.{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    if tmpdest.is_symlink() or tmpdest.exists():
+        tmpdest.unlink()
+    used = _stage(source, tmpdest, mode)
+    os.replace(tmpdest, dest)
+    return used
+
+def _stage(source: Path, dest: Path, mode: str) -> str:
+    """Creates dest using mode, falling back to a copy"""
+    if mode == 'symlink':
+        try:
+            os.symlink(source.resolve(), dest)
+            return 'symlink'
+        except OSError:
+            pass
+
+    elif mode == 'hardlink':
+        try:
+            os.link(source, dest)
+            return 'hardlink'
+        except OSError:
+            pass
+
+    elif mode == 'reflink':
+        try:
+            _reflink(source, dest)
+            return 'reflink'
+        except (ImportError, OSError):
+            if dest.exists():
+                dest.unlink()
+
+    shutil.copy2(source, dest)
+    return 'copy'
+
+def _reflink(source: Path, dest: Path):
+    """Clones source to dest using the FICLONE ioctl"""
+    import fcntl
+
+    with open(source, 'rb') as fr, open(dest, 'wb') as fw:
+        fcntl.ioctl(fw.fileno(), _FICLONE, fr.fileno())
+    shutil.copystat(source, dest)
@@ -0,0 +1,368 @@
+# coding: utf-8
+# Standard libraries
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+# https://github.com/usnistgov/yabadaba
+from yabadaba.record import Record
+
+# Local imports
+from .. import settings
+from ..record._download import download_artifacts
+
+# The record styles synchronized by sync_all, in order
+sync_styles = ('Citation', 'Potential', 'potential_LAMMPS', 'potential_LAMMPS_KIM')
+
+def record_sha256(record: Record) -> str:
+    """
+    Computes the SHA-256 checksum of a record's content.
+
+    Parameters
+    ----------
+    record : Record
+        The record.
+
+    Returns
+    -------
+    str
+        The hex digest of the record model's compact JSON.
+    """
+    try:
+        model = record.model
+    except AttributeError:
+        model = record.build_model()
+    return hashlib.sha256(model.json().encode('UTF-8')).hexdigest()
+
+def artifact_entries(record: Record) -> list:
+    """
+    Lists the filename, url and sha256 of each artifact of a record.
+
+    Parameters
+    ----------
+    record : Record
+        The record.
+
+    Returns
+    -------
+    list
+        The artifact entries, or an empty list if the record style has no
+        artifacts.
+    """
+    return [{'filename': artifact.filename, 'url': artifact.url,
+             'sha256': artifact.sha256}
+            for artifact in getattr(record, 'artifacts', [])]
+
+def load_sync_manifest(path: Union[str, Path]) -> dict:
+    """
+    Reads a sync manifest file.
+
+    Parameters
+    ----------
+    path : path-like object
+        The manifest file.
+
+    Returns
+    -------
+    dict
+        The manifest entries of each record name by record style.  Empty if
+        the file does not exist.
+    """
+    path = Path(path)
+    if not path.is_file():
+        return {}
+    with open(path, encoding='UTF-8') as f:
+        return json.load(f)['records']
+
+def save_sync_manifest(path: Union[str, Path],
+                       records: dict):
+    """
+    Writes a sync manifest file.
+
+    Parameters
+    ----------
+    path : path-like object
+        The manifest file.
+    records : dict
+        The manifest entries of each record name by record style.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmppath = Path(f'{path}.tmp')
+    with open(tmppath, 'w', encoding='UTF-8') as f:
+        json.dump({'version': 1, 'records': records}, f, indent=1, sort_keys=True)
+    os.replace(tmppath, path)
+
+def sync_all(self,
+             status: Union[str, list, None] = None,
+             downloadfiles: bool = True,
+             include_kim: bool = True,
+             dry_run: bool = False,
+             manifest: Optional[Path] = None,
+             report: Optional[Path] = None,
+             max_workers: int = 8,
+             dedupe: bool = False,
+             verbose: bool = False) -> dict:
+    """
+    Updates the local with only the potential-related records and parameter
+    files that are new or have changed in the remote since the last sync.
+    The content checksum of each remote record and the listed artifacts of
+    each LAMMPS potential are compared to a manifest saved by the previous
+    sync, so unchanged records are not rewritten and unchanged files are not
+    downloaded again.  Records that are not in the manifest are compared to
+    the existing local records.
+
+    Parameters
+    ----------
+    status : str, list or None, optional
+        Only potential_LAMMPS and potential_LAMMPS_KIM records with the given
+        status(es) will be synchronized.  If None (default), then all are.
+    downloadfiles : bool, optional
+        If True (default), the parameter files of new and changed
+        potential_LAMMPS records are also downloaded, along with any missing
+        from a local-style local database.
+    include_kim : bool, optional
+        If True (default), potential_LAMMPS_KIM records are also
+        synchronized.
+    dry_run : bool, optional
+        If True, the changes are identified and reported but nothing is
+        transferred and the manifest is not updated.  Default value is False.
+    manifest : path-like object, optional
+        The manifest file.  If not given, will use "sync_manifest.json" in the
+        host directory of a local-style local database, or in the settings
+        directory otherwise.
+    report : path-like object, optional
+        If given, the sync report is also saved to this file as JSON.
+    max_workers : int, optional
+        The maximum number of parameter files to download at the same time.
+        Default value is 8.
+    dedupe : bool, optional
+        If True and the local database is of style local, the downloaded
+        files are stored once by SHA-256 checksum.  See
+        download_lammps_potentials.  Default value is False.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+
+    Returns
+    -------
+    dict
+        The sync report, listing by record style the names of the records
+        that were 'added' and 'updated', the number 'unchanged', and the
+        names of local records 'missing' from the remote, which are not
+        deleted.  The 'files' listed as 'downloaded' or 'failed' are given
+        as "<record name>/<filename>".
+    """
+    if self.local_database is None:
+        raise ValueError('local database info not set: initialize with local=True or call set_local_database')
+    if self.remote_database is None:
+        raise ValueError('remote database info not set: initialize with remote=True or call set_remote_database')
+
+    local_style = self.local_database.style == 'local'
+    if manifest is None:
+        if local_style:
+            manifest = Path(self.local_database.host, 'sync_manifest.json')
+        else:
+            manifest = Path(settings.directory, 'sync_manifest.json')
+    entries = load_sync_manifest(manifest)
+
+    summary = {'started': datetime.datetime.now().isoformat(timespec='seconds'),
+               'dry_run': dry_run, 'manifest': str(manifest),
+               'records': {}, 'files': {'downloaded': [], 'failed': []}}
+
+    styles = list(sync_styles)
+    if not include_kim:
+        styles.remove('potential_LAMMPS_KIM')
+
+    file_records = []
+    for style in styles:
+        kwargs = {}
+        if style in ['potential_LAMMPS', 'potential_LAMMPS_KIM']:
+            kwargs['status'] = status
+        remote_records = self.remote_database.get_records(style, **kwargs)
+        old_entries = entries.get(style, {})
+        new_entries = {}
+        changes = {'added': [], 'updated': [], 'unchanged': 0, 'missing': []}
+
+        for record in remote_records:
+            entry = {'sha256': record_sha256(record)}
+            old_entry = old_entries.get(record.name, None)
+
+            # Restore local-style records deleted since the last sync
+            if (old_entry is not None and local_style
+                and not Path(self.local_database.host, style,
+                             f'{record.name}.{self.local_database.format}').is_file()):
+                old_entry = None
+
+            # Compare records not in the manifest to the local records
+            if old_entry is None:
+                try:
+                    local_record = self.local_database.get_record(style=style, name=record.name)
+                except Exception:
+                    pass
+                else:
+                    old_entry = {'sha256': record_sha256(local_record)}
+
+            # Transfer new and changed records
+            if old_entry is None:
+                changes['added'].append(record.name)
+            elif old_entry['sha256'] != entry['sha256']:
+                changes['updated'].append(record.name)
+            else:
+                changes['unchanged'] += 1
+            if not dry_run:
+                if old_entry is None:
+                    self.local_database.add_record(record=record)
+                elif old_entry['sha256'] != entry['sha256']:
+                    self.local_database.update_record(record=record)
+                if old_entry is None or old_entry['sha256'] != entry['sha256']:
+                    if self.local_index is not None:
+                        self.local_index.update(record, self.local_database)
+
+            # Keep the previous artifact entries until the files are synced
+            if style == 'potential_LAMMPS':
+                entry['artifacts'] = None if old_entry is None else old_entry.get('artifacts', None)
+                if downloadfiles:
+                    file_records.append(record)
+            new_entries[record.name] = entry
+
+        changes['missing'] = sorted(set(old_entries) - set(new_entries))
+        for name in changes['missing']:
+            new_entries[name] = old_entries[name]
+        summary['records'][style] = changes
+        entries[style] = new_entries
+
+        if verbose:
+            print(f"{style}: {len(changes['added'])} added, {len(changes['updated'])} updated, "
+                  f"{changes['unchanged']} unchanged, {len(changes['missing'])} missing from remote")
+
+    # Sync parameter files
+    if len(file_records) > 0:
+        self._sync_lammps_potential_files(file_records, entries['potential_LAMMPS'],
+                                         summary['files'], dry_run=dry_run,
+                                         max_workers=max_workers, dedupe=dedupe,
+                                         verbose=verbose)
+
+    summary['finished'] = datetime.datetime.now().isoformat(timespec='seconds')
+    if not dry_run:
+        save_sync_manifest(manifest, entries)
+    if report is not None:
+        Path(report).parent.mkdir(parents=True, exist_ok=True)
+        with open(report, 'w', encoding='UTF-8') as f:
+            json.dump(summary, f, indent=4)
+
+    return summary
+
+def _sync_lammps_potential_files(self,
+                                 records: list,
+                                 entries: dict,
+                                 files: dict,
+                                 dry_run: bool = False,
+                                 max_workers: int = 8,
+                                 dedupe: bool = False,
+                                 verbose: bool = False):
+    """
+    Downloads the parameter files of LAMMPS potentials whose artifacts
+    differ from their manifest entries or, for local-style databases, are
+    missing from the record folder.  Used by sync_all.
+
+    Parameters
+    ----------
+    records : list
+        The remote potential_LAMMPS records.
+    entries : dict
+        The manifest entries by record name.  The artifacts of records whose
+        files are all synced are updated.
+    files : dict
+        The sync report 'files' lists to append to.
+    dry_run : bool, optional
+        If True, the files are only listed as 'downloaded' in the report.
+    max_workers : int, optional
+        The maximum number of parameter files to download at the same time.
+        Default value is 8.
+    dedupe : bool, optional
+        If True and the local database is of style local, the downloaded
+        files are stored once by SHA-256 checksum.  See
+        download_lammps_potentials.  Default value is False.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+    """
+    local_style = self.local_database.style == 'local'
+
+    # Identify the artifacts that changed or are missing.  Unknown artifacts
+    # are assumed to match if their files exist in a local-style folder.
+    pending = {}
+    for record in records:
+        current = artifact_entries(record)
+        known = entries[record.name]['artifacts']
+        if known is not None:
+            known = {entry['filename']: entry for entry in known}
+
+        stale = []
+        for artifact, entry in zip(record.artifacts, current):
+            if local_style:
+                pot_dir = Path(self.local_database.host, record.style, record.name)
+                if not Path(pot_dir, artifact.filename).is_file():
+                    stale.append(artifact)
+                    continue
+            elif known is None:
+                stale.append(artifact)
+                continue
+            if known is not None and known.get(artifact.filename, None) != entry:
+                stale.append(artifact)
+
+        if len(stale) == 0:
+            entries[record.name]['artifacts'] = current
+        else:
+            pending[record.name] = (record, stale, current)
+
+    if dry_run:
+        for name, (record, stale, current) in pending.items():
+            files['downloaded'] += [f'{name}/{artifact.filename}' for artifact in stale]
+        return
+
+    if local_style:
+        # Download changed files directly into the record folders
+        tasks = []
+        for name, (record, stale, current) in pending.items():
+            pot_dir = Path(self.local_database.host, record.style, name)
+            pot_dir.mkdir(parents=True, exist_ok=True)
+            tasks += [(artifact, pot_dir) for artifact in stale]
+        summary = download_artifacts(tasks, overwrite=True, verbose=verbose,
+                                     max_workers=max_workers)
+        failed = {}
+        for artifact, err in summary['failed']:
+            failed[id(artifact)] = err
+
+        for name, (record, stale, current) in pending.items():
+            ok = True
+            for artifact in stale:
+                if id(artifact) in failed:
+                    ok = False
+                    files['failed'].append(f'{name}/{artifact.filename}')
+                    if verbose:
+                        print(f'Failed to download {artifact.url}: {failed[id(artifact)]}')
+                else:
+                    files['downloaded'].append(f'{name}/{artifact.filename}')
+            if ok:
+                entries[name]['artifacts'] = current
+                if dedupe is True:
+                    self.local_artifact_store.add_folder(Path(self.local_database.host, record.style, name))
+
+    else:
+        # Rebuild the archives of changed potentials
+        for name, (record, stale, current) in pending.items():
+            try:
+                self.save_lammps_potential(record, downloadfiles=True, overwrite=True,
+                                           dedupe=dedupe)
+            except Exception as err:
+                files['failed'] += [f'{name}/{artifact.filename}' for artifact in stale]
+                if verbose:
+                    print(f'Failed to download files for {name}: {err}')
+            else:
+                files['downloaded'] += [f'{name}/{artifact.filename}' for artifact in stale]
+                entries[name]['artifacts'] = current
@@ -2,12 +2,6 @@
 # Standard libraries
 from typing import Optional
 
-# https://ipython.org/
-from IPython.display import display, clear_output, HTML
-
-# https://ipywidgets.readthedocs.io/en/latest/
-import ipywidgets as widgets
-
 # https://numpy.org/
 import numpy as np
 import numpy.typing as npt
@@ -35,6 +29,12 @@ def widget_search_potentials(self,
         If not given, will be generated from potentials if given or by
         calling get_potentials with status='active'.
     """
+    # https://ipython.org/
+    from IPython.display import display, clear_output, HTML
+
+    # https://ipywidgets.readthedocs.io/en/latest/
+    import ipywidgets as widgets
+
     # Build potentials and/or potentials_df if needed
     if potentials is None:
         potentials, potentials_df = self.get_potentials(return_df=True)
@@ -175,6 +175,12 @@ def widget_lammps_potential(self,
         If given a dict, the selected potential can be retrieved under the
         'lammps_potential' key.
     """
+    # https://ipython.org/
+    from IPython.display import display, clear_output, HTML
+
+    # https://ipywidgets.readthedocs.io/en/latest/
+    import ipywidgets as widgets
+
     
     if results is None:
         results = {}
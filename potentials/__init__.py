@@ -1,31 +1,50 @@
-# coding: utf-8
-# Standard Python libraries
-from importlib import resources
-
-# Read version from VERSION file
-if hasattr(resources, 'files'):
-    __version__ = resources.files('potentials').joinpath('VERSION').read_text(encoding='UTF-8')
-else:
-    __version__ = resources.read_text('potentials', 'VERSION', encoding='UTF-8').strip()
-
-from . import tools
-from .Settings import settings
-
-from . import value
-
-# Import records and load local record styles
-from . import record
-from .record import recordmanager, load_record
-
-# Import database methods
-from .Database import Database, load_database
-
-from . import buildrecord
-from .buildrecord import build_lammps_potential
-
-from . import paramfile
-
-__all__ = ['__version__', 'tools', 'settings', 'paramfile', 'value',
-           'record', 'load_record', 'recordmanager', 'buildrecord',
-           'Database', 'load_database',  'build_lammps_potential',]
-__all__.sort()
+# coding: utf-8
+# Standard Python libraries
+from importlib import import_module, resources
+
+# Read version from VERSION file
+if hasattr(resources, 'files'):
+    __version__ = resources.files('potentials').joinpath('VERSION').read_text(encoding='UTF-8')
+else:
+    __version__ = resources.read_text('potentials', 'VERSION', encoding='UTF-8').strip()
+
+from .Settings import settings
+
+# Import records and register the local record styles with yabadaba so that
+# they can be loaded by style name
+from . import value
+from . import record
+from .record import recordmanager, load_record
+
+# Import database methods
+from .Database import Database, load_database
+
+# The other submodules and objects are only imported when first accessed so
+# that importing the package does not import their dependencies.  Values are
+# (module, attribute) with None for the module itself.
+_lazy_attributes = {
+    'tools': ('.tools', None),
+    'buildrecord': ('.buildrecord', None),
+    'build_lammps_potential': ('.buildrecord', 'build_lammps_potential'),
+    'paramfile': ('.paramfile', None),
+}
+
+def __getattr__(name: str):
+    try:
+        modulename, attribute = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    obj = import_module(modulename, __name__)
+    if attribute is not None:
+        obj = getattr(obj, attribute)
+    globals()[name] = obj
+    return obj
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_lazy_attributes))
+
+__all__ = ['__version__', 'tools', 'settings', 'paramfile', 'value',
+           'record', 'load_record', 'recordmanager', 'buildrecord',
+           'Database', 'load_database',  'build_lammps_potential',]
+__all__.sort()
@@ -4,7 +4,7 @@ from copy import deepcopy
 import io
 import warnings
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
 # https://scipy.org/
 from scipy.interpolate import CubicSpline
@@ -13,16 +13,22 @@ from scipy.interpolate import CubicSpline
 import numpy as np
 import numpy.typing as npt
 
-# https://matplotlib.org/
-import matplotlib.pyplot as plt
+# https://matplotlib.org/ (imported when plotting)
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 # Local imports
 from .EAMAlloy import EAMAlloy
 from ..tools import aslist, numderivative
+from ._lazy import TableDict, as_table
 class ADP(EAMAlloy):
     """
     Class for building and analyzing LAMMPS setfl adp parameter files 
     """
+
+    # Pair functions listed for all unique symbol pairs after the symbol blocks
+    _pair_functions = ('rphi_r', 'u_r', 'w_r')
+
     def __init__(self,
                  f: Union[str, Path, io.IOBase, None] = None,
                  header: Optional[str] = None,
@@ -89,12 +95,12 @@ class ADP(EAMAlloy):
         # Initialize u terms
         self.__u_r = {}
         self.__u_r_kwargs = {}
-        self.__u_r_table = {}
+        self.__u_r_table = TableDict()
         
         # Initialize w terms
         self.__w_r = {}
         self.__w_r_kwargs = {}
-        self.__w_r_table = {}
+        self.__w_r_table = TableDict()
         
         super().__init__(f=f, header=header, symbol=symbol, number=number,
                          mass=mass, alat=alat, lattice=lattice,
@@ -147,8 +153,8 @@ class ADP(EAMAlloy):
                 return self.__u_r_table[symbolstr]
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__u_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('u_r', symbolstr, self.r, self.__u_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -210,6 +216,9 @@ class ADP(EAMAlloy):
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
 
+        # Remove any cached spline
+        self.spline_cache.invalidate('u_r', symbolstr)
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -220,7 +229,7 @@ class ADP(EAMAlloy):
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__u_r_table[symbolstr] = np.asarray(table)
+                self.__u_r_table[symbolstr] = as_table(table)
                 if symbolstr in self.__u_r:
                     del self.__u_r[symbolstr]
                     del self.__u_r_kwargs[symbolstr]
@@ -283,8 +292,8 @@ class ADP(EAMAlloy):
                 return self.__w_r_table[symbolstr]
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__w_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('w_r', symbolstr, self.r, self.__w_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -346,6 +355,9 @@ class ADP(EAMAlloy):
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
 
+        # Remove any cached spline
+        self.spline_cache.invalidate('w_r', symbolstr)
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -356,7 +368,7 @@ class ADP(EAMAlloy):
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__w_r_table[symbolstr] = np.asarray(table)
+                self.__w_r_table[symbolstr] = as_table(table)
                 if symbolstr in self.__w_r:
                     del self.__w_r[symbolstr]
                     del self.__w_r_kwargs[symbolstr]
@@ -378,6 +390,12 @@ class ADP(EAMAlloy):
             if symbolstr in self.__w_r_table:
                 del self.__w_r_table[symbolstr]
 
+    def _tables(self) -> dict:
+        """Gives the dicts of tabulated values for each function name"""
+        tables = super()._tables()
+        tables.update(u_r=self.__u_r_table, w_r=self.__w_r_table)
+        return tables
+
     def print_overview(self):
         """Prints an overview of set values"""
         super().print_overview()
@@ -400,247 +418,14 @@ class ADP(EAMAlloy):
                 except:
                     print(symbols[0], symbols[1], 'not set')
 
-    def load(self, f: Union[str, Path, io.IOBase]):
-        """
-        Reads in an adp setfl file
-        
-        Parameters
-        ----------
-        f : path-like object or file-like object
-            The parameter file to read in, either as a file path or as an open
-            file-like object.
-        """
-        
-        if hasattr(f, 'readlines'):
-            lines = f.readlines()
-        else:
-            with open(f) as fp:
-                lines = fp.readlines()
-
-        # Read lines 1-3 to header
-        self.header = ''.join(lines[:3]).strip()
-
-        # Read line 4 for symbols
-        symbols = lines[3].split()[1:]
-        nsymbols = len(symbols)
-        if nsymbols != int(lines[3].split()[0]):
-            raise ValueError('Invalid potential file (line 4): inconsistent number of symbols')
-
-        # Set initial dummy symbols info (replaced later)
-        for symbol in symbols:
-            self.set_symbol_info(symbol, 0, 0.0, 0.0, 'NA')
-
-        # Read line 5 for numrho, deltarho, numr, deltar, and cutoffr
-        terms = lines[4].split()
-        try:
-            assert len(terms) == 5
-            numrho =   int(terms[0])
-            deltarho = float(terms[1])
-            numr =     int(terms[2])
-            deltar =   float(terms[3])
-            cutoffr =  float(terms[4])
-        except:
-            print(terms)
-            raise ValueError('Invalid potential file (line 5): numrho, deltarho, numr, deltar, cutoffr')
-        self.set_r(num=numr, cutoff=cutoffr, delta=deltar)
-        self.set_rho(num=numrho, delta=deltarho)
-                    
-        # Read remaining content as space-delimited terms
-        c = 0
-        terms = ' '.join(lines[5:]).split()
-        numsymbols = len(self.symbols)
-        numsets = sum(range(1, numsymbols+1))
-        expected = numsymbols * (4 + self.numrho + self.numr) + 3 * numsets * self.numr
-        if len(terms) != expected:
-            raise ValueError(f'Invalid number of tabulated values: {expected} expected, {len(terms)} found')
-
-        # Read per-symbol data
-        for symbol in symbols:
-            
-            # Read symbol info
-            number = int(terms[c])
-            mass = float(terms[c+1])
-            alat = float(terms[c+2])
-            lattice = str(terms[c+3])
-            self.set_symbol_info(symbol, number, mass, alat, lattice)
-
-            # Read F(rho)
-            start = c + 4
-            end = c + 4 + self.numrho
-            F_rho_table = np.array(terms[start:end],dtype=float)
-            self.set_F_rho(symbol, table=F_rho_table)
-
-            # Read rho(r)
-            start = c + 4 + self.numrho
-            end = c + 4 + self.numrho + self.numr
-            rho_r_table = np.array(terms[start:end],dtype=float)
-            self.set_rho_r(symbol, table=rho_r_table)
-            
-            # Increase c
-            c += 4 + self.numrho + self.numr
-        
-        # Iterate over unique symbol pairs for rphi(r)
-        for i in range(nsymbols):
-            for j in range(0, i+1):
-                symbolpair = [symbols[i], symbols[j]]
-
-                # Read pair data
-                start = c
-                end = c + self.numr
-                rphi_r_table = np.array(terms[start:end], dtype=float)
-                self.set_rphi_r(symbolpair, table=rphi_r_table)
-
-                c += self.numr
-
-        # Iterate over unique symbol pairs for u(r)
-        for i in range(nsymbols):
-            for j in range(0, i+1):
-                symbolpair = [symbols[i], symbols[j]]
-
-                # Read pair data
-                start = c
-                end = c + self.numr
-                u_r_table = np.array(terms[start:end], dtype=float)
-                self.set_u_r(symbolpair, table=u_r_table)
-
-                c += self.numr
-
-        # Iterate over unique symbol pairs for w(r)
-        for i in range(nsymbols):
-            for j in range(0, i+1):
-                symbolpair = [symbols[i], symbols[j]]
-
-                # Read pair data
-                start = c
-                end = c + self.numr
-                w_r_table = np.array(terms[start:end], dtype=float)
-                self.set_w_r(symbolpair, table=w_r_table)
-
-                c += self.numr
-
-    def build(self,
-              f: Union[str, Path, io.IOBase, None] = None,
-              xf: str = '%25.16e',
-              ncolumns: int = 5) -> Optional[str]:
-        """
-        Constructs an adp setfl parameter file.
-        
-        Parameters
-        ----------
-        f : str or file-like object
-            If given, the contents will be written to the file-like object or file name given by a str.
-            If not given, the parameter file contents will be returned as a str.
-        xf : str, optional
-            The c-style formatter to use for floating point numbers.  Default value is '%25.16e'.
-        ncolumns : int, optional
-            Indicates how many columns the tabulated values are split by.  Default value is 5.
-        
-        Returns
-        -------
-        str
-            The parameter file contents (returned if f is not given).
-        """
-
-        # Initialize setfl str
-        setfl = ''
-
-        # Add header
-        header = self.header.splitlines()
-        while len(header) < 3:
-            header.append('')
-        header = '\n'.join(header)+'\n'
-        setfl = header
-
-        # Add symbol header info
-        nsymbols = len(self.symbols)
-        if nsymbols == 0:
-            raise ValueError('No symbols set: no data to write')
-        setfl += str(nsymbols)
-        for symbol in self.symbols:
-            setfl += ' ' + symbol
-        setfl += '\n'
-
-        # Add r and rho header info
-        terms = (self.numrho, self.deltarho, self.numr, self.deltar, self.cutoffr)
-        setfl += f'%i {xf} %i {xf} {xf}\n' % terms
-
-        line = []
-
-        # Loop over symbols
-        for symbol in self.symbols:
-
-            # Add symbol header
-            info = self.symbol_info(symbol)
-            terms = (info['number'], info['mass'], info['alat'], info['lattice'])
-            setfl += f'%i {xf} {xf} %s\n' % terms
-
-            # Tabulate F(rho) and rho(r) values
-            vals = np.hstack([self.F_rho(symbol), self.rho_r(symbol)])
-            for j in range(len(vals)):
-                line.append(xf % vals[j])
-                
-                if (j + 1) % ncolumns == 0:
-                    setfl += ' '.join(line) + '\n'
-                    line = []
-
-            if len(line) > 0:
-                setfl += ' '.join(line) + '\n'
-                line = []
-
-        # Build array of all r*phi(r) values
-        vals = []
-        for i in range(nsymbols):
-            for j in range(i+1):
-                symbolpair = [self.symbols[i], self.symbols[j]]
-                vals.append(self.rphi_r(symbolpair))
-
-        # Build array of all u(r) values
-        for i in range(nsymbols):
-            for j in range(i+1):
-                symbolpair = [self.symbols[i], self.symbols[j]]
-                vals.append(self.u_r(symbolpair))
-
-        # Build array of all w(r) values
-        for i in range(nsymbols):
-            for j in range(i+1):
-                symbolpair = [self.symbols[i], self.symbols[j]]
-                vals.append(self.w_r(symbolpair))
-        vals = np.hstack(vals)
-
-        # Tabulate values
-        for j in range(len(vals)):
-            line.append(xf % (vals[j]))
-            
-            if (j + 1) % ncolumns == 0:
-                setfl += ' '.join(line) + '\n'
-                line = []
-                
-        if len(line) > 0:
-            setfl += ' '.join(line) + '\n'
-            line = []
-
-        # Save or return
-        if f is None:
-            return setfl
-        
-        elif isinstance(f, str):
-            with open(f, 'w') as fp:
-                fp.write(setfl)
-        
-        elif hasattr(f, 'write'):
-            f.write(setfl)
-        
-        else:
-            raise TypeError('f must be a path or a file-like object')
-        
     def plot_u_r(self,
                  symbols: Union[str, list, None] = None,
                  n: int = 0,
                  figsize: Tuple[float, float] = None,
-                 matplotlib_axes: Optional[plt.axes] = None,
+                 matplotlib_axes: Optional['plt.axes'] = None,
                  xlim: Optional[Tuple[float, float]] = None,
                  ylim: Optional[Tuple[float, float]] = None,
-                 ) -> Optional[plt.figure]:
+                 ) -> Optional['plt.figure']:
         """
         Generates a plot of u(r) vs. r.
 
@@ -674,6 +459,8 @@ class ADP(EAMAlloy):
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -725,10 +512,10 @@ class ADP(EAMAlloy):
                  symbols: Union[str, list, None] = None,
                  n: int = 0,
                  figsize: Tuple[float, float] = None,
-                 matplotlib_axes: Optional[plt.axes] = None,
+                 matplotlib_axes: Optional['plt.axes'] = None,
                  xlim: Optional[Tuple[float, float]] = None,
                  ylim: Optional[Tuple[float, float]] = None,
-                 ) -> Optional[plt.figure]:
+                 ) -> Optional['plt.figure']:
         """
         Generates a plot of w(r) vs. r.
 
@@ -762,6 +549,8 @@ class ADP(EAMAlloy):
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
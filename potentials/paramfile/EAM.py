@@ -3,7 +3,7 @@
 import io
 import warnings
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
 # https://scipy.org/
 from scipy.interpolate import CubicSpline
@@ -12,11 +12,16 @@ from scipy.interpolate import CubicSpline
 import numpy as np
 import numpy.typing as npt
 
-# https://matplotlib.org/
-import matplotlib.pyplot as plt
+# https://matplotlib.org/ (imported when plotting)
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 # Local imports
 from ..tools import numderivative
+from ._spline_cache import SplineCache
+from ._setfl import open_input, read_lines, read_values, write_output, write_table
+from ._binary import is_binary, read_binary, read_cached, write_binary
+from ._resample import resample_tables
 
 class EAM():
     """
@@ -128,6 +133,9 @@ class EAM():
         self.__alat = None
         self.__lattice = None
 
+        # Initialize cached splines of tabulated functions
+        self.__spline_cache = SplineCache()
+
         if f is not None:
             self.load(f)
 
@@ -162,6 +170,16 @@ class EAM():
         """The LAMMPS pair_style associated with the class"""
         return 'eam'
 
+    @property
+    def spline_cache(self) -> SplineCache:
+        """
+        SplineCache : The cubic splines of tabulated functions that are used
+        for evaluating the functions at given r or rho values.  Splines are
+        built when first needed and removed when the associated function or
+        the tabulation values change.
+        """
+        return self.__spline_cache
+
     @property
     def hartree(self) -> float:
         """float: conversion constant from Hartree to eV"""
@@ -250,6 +268,9 @@ class EAM():
         else:
             raise ValueError('Either or both cutoff and delta are required')
 
+        # Remove cached splines of the old tabulated values
+        self.spline_cache.clear()
+
         # Change existing tables to spline functions
         if old_r is not None:
             if self.__rho_r_table is not None:
@@ -324,6 +345,9 @@ class EAM():
         else:
             raise ValueError('Either or both cutoff and delta are required')
 
+        # Remove cached splines of the old tabulated values
+        self.spline_cache.clear()
+
         # Change existing tables to spline functions
         if old_rho is not None and self.__F_rho_table is not None:
             self.set_F_rho(table=self.F_rho(), rho=old_rho)
@@ -394,8 +418,8 @@ class EAM():
                 return self.__F_rho_table
             
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.rho, self.__F_rho_table)
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('F_rho', None, self.rho, self.__F_rho_table)
                 v = fxn(rho)
                 v[np.abs(v) <= 1e-100] = 0.0
                 return v
@@ -440,6 +464,9 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        # Remove any cached spline
+        self.spline_cache.invalidate('F_rho')
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -491,8 +518,8 @@ class EAM():
                 return self.__rho_r_table
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rho_r_table)
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('rho_r', None, self.r, self.__rho_r_table)
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -540,6 +567,9 @@ class EAM():
             a general fxn to be used with symbol-specific parameters passed in.
         """
 
+        # Remove any cached spline
+        self.spline_cache.invalidate('rho_r')
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -591,8 +621,8 @@ class EAM():
                 return self.__z_r_table
             
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__z_r_table)
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('z_r', None, self.r, self.__z_r_table)
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -655,6 +685,9 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        # Remove any cached spline
+        self.spline_cache.invalidate(['z_r', 'rphi_r', 'phi_r'])
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -713,8 +746,8 @@ class EAM():
                 return self.__rphi_r_table
             
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rphi_r_table)
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('rphi_r', None, self.r, self.__rphi_r_table)
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -775,6 +808,9 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        # Remove any cached spline
+        self.spline_cache.invalidate(['z_r', 'rphi_r', 'phi_r'])
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -833,8 +869,8 @@ class EAM():
                 return self.__phi_r_table
             
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__phi_r_table)
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('phi_r', None, self.r, self.__phi_r_table)
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -902,6 +938,9 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        # Remove any cached spline
+        self.spline_cache.invalidate(['z_r', 'rphi_r', 'phi_r'])
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -939,6 +978,83 @@ class EAM():
         self.__z_r_kwargs = None
         self.__z_r_table = None
 
+    def resample(self,
+                 numr: Optional[int] = None,
+                 numrho: Optional[int] = None,
+                 cutoffr: Optional[float] = None,
+                 cutoffrho: Optional[float] = None) -> dict:
+        """
+        Changes the r and/or rho values and re-tabulates all tabulated
+        functions on the new values in one pass per grid.  Functions set
+        with fxn are kept and evaluated at the new values when needed.
+        
+        Parameters
+        ----------
+        numr : int, optional
+            The new number of r values.  If not given, numr is unchanged.
+        numrho : int, optional
+            The new number of rho values.  If not given, numrho is unchanged.
+        cutoffr : float, optional
+            The new cutoff r value.  If not given, cutoffr is unchanged.
+        cutoffrho : float, optional
+            The new cutoff rho value.  If not given, cutoffrho is unchanged.
+        
+        Returns
+        -------
+        dict
+            The maximum absolute interpolation error of each re-tabulated
+            function, keyed by the function name and None, e.g.
+            ('rho_r', None).  Errors are found by comparing splines of the
+            new tables with the old tables at the old values.
+        """
+        errors = {}
+
+        # Re-tabulate the r functions
+        if numr is not None or cutoffr is not None:
+            old_r = self.r
+            tables = {}
+            for name, table in [('rho_r', self.__rho_r_table),
+                                ('z_r', self.__z_r_table),
+                                ('rphi_r', self.__rphi_r_table),
+                                ('phi_r', self.__phi_r_table)]:
+                if table is not None:
+                    tables[(name, None)] = table
+            self.__rho_r_table = None
+            self.__z_r_table = None
+            self.__rphi_r_table = None
+            self.__phi_r_table = None
+
+            self.set_r(num=self.numr if numr is None else numr,
+                       cutoff=self.cutoffr if cutoffr is None else cutoffr)
+            newtables, newerrors = resample_tables(old_r, self.r, tables)
+            for (name, key), table in newtables.items():
+                if name == 'rho_r':
+                    self.set_rho_r(table=table)
+                elif name == 'z_r':
+                    self.set_z_r(table=table)
+                elif name == 'rphi_r':
+                    self.set_rphi_r(table=table)
+                else:
+                    self.set_phi_r(table=table)
+            errors.update(newerrors)
+
+        # Re-tabulate F(rho)
+        if numrho is not None or cutoffrho is not None:
+            old_rho = self.rho
+            tables = {}
+            if self.__F_rho_table is not None:
+                tables[('F_rho', None)] = self.__F_rho_table
+            self.__F_rho_table = None
+
+            self.set_rho(num=self.numrho if numrho is None else numrho,
+                         cutoff=self.cutoffrho if cutoffrho is None else cutoffrho)
+            newtables, newerrors = resample_tables(old_rho, self.rho, tables)
+            for (name, key), table in newtables.items():
+                self.set_F_rho(table=table)
+            errors.update(newerrors)
+
+        return errors
+
     def print_overview(self):
         """Prints an overview of set values"""
         print('at#  mass      alat       lat')
@@ -980,75 +1096,130 @@ class EAM():
         else:
             print('\nrho(r):', rho_r)
 
-    def load(self, f: Union[str, Path, io.IOBase]):
+    def load(self,
+             f: Union[str, Path, io.IOBase],
+             cache: bool = False,
+             validate: str = 'mtime'):
         """
-        Reads in an eam funcfl file
+        Reads in an eam funcfl file.  Paths ending in '.npz' are read as
+        binary parameter files created by save_binary().
         
         Parameters
         ----------
         f : path-like object or file-like object
             The parameter file to read in, either as a file path or as an open
             file-like object.
+        cache : bool, optional
+            If True and f is a path, a binary copy of the parameter file is
+            saved next to it as f + '.npz' and used for later loads as long
+            as it matches the text file.  Default value is False.
+        validate : str, optional
+            How a binary copy is checked against the text file when cache is
+            True: 'mtime' (default) compares the modification times and
+            sizes, 'hash' compares the sizes and sha256 checksums.
         """
-        
-        if hasattr(f, 'readlines'):
-            lines = f.readlines()
+        if is_binary(f):
+            info, values = read_binary(f, self.pair_style)
+        elif cache and isinstance(f, (str, Path)):
+            info, values = read_cached(f, self.pair_style, self.__parse,
+                                       validate=validate)
         else:
-            with open(f) as fp:
-                lines = fp.readlines()
+            with open_input(f) as fp:
+                info, values = self.__parse(fp)
+        self.__set_values(info, values)
+
+    def load_binary(self,
+                    f: Union[str, Path, io.IOBase],
+                    mmap: bool = False):
+        """
+        Reads in a binary parameter file created by save_binary().  The
+        tabulated functions are set as views of the file's values.
+        
+        Parameters
+        ----------
+        f : path-like object or file-like object
+            The binary parameter file to read in.
+        mmap : bool, optional
+            If True, the values are memory-mapped rather than read into
+            memory.  Requires f to be a path.  Default value is False.
+        """
+        info, values = read_binary(f, self.pair_style, mmap=mmap)
+        self.__set_values(info, values)
+
+    def save_binary(self, f: Union[str, Path, io.IOBase]):
+        """
+        Saves the potential as a binary parameter file, which is an
+        uncompressed .npz file that can be read by load_binary() much
+        faster than the text format.
+        
+        Parameters
+        ----------
+        f : path-like object or file-like object
+            The file to save to.
+        """
+        info = dict(header=self.header, **self.symbol_info(),
+                    numrho=self.numrho, deltarho=self.deltarho,
+                    numr=self.numr, deltar=self.deltar, cutoffr=self.cutoffr)
+        values = np.hstack([self.F_rho(), self.z_r(), self.rho_r()])
+        write_binary(f, self.pair_style, info, values)
+
+    def __parse(self, fp: io.IOBase) -> Tuple[dict, np.ndarray]:
+        """Reads the text parameter file into the info and values to set"""
+        lines = read_lines(fp, 3)
 
         # Read line 1 to header
-        self.header = lines[0].strip()
+        header = lines[0].strip()
 
         # Read line 2 for element number, mass, alat and lattice
         terms = lines[1].split()
-        number = int(terms[0])
-        mass = float(terms[1])
-        alat = float(terms[2])
-        lattice = str(terms[3])
-        self.set_symbol_info(number, mass, alat, lattice)
+        info = dict(header=header,
+                    number=int(terms[0]),
+                    mass=float(terms[1]),
+                    alat=float(terms[2]),
+                    lattice=str(terms[3]))
 
         # Read line 3 for numrho, deltarho, numr, deltar, and cutoffr
         terms = lines[2].split()
         try:
             assert len(terms) == 5
-            numrho =   int(terms[0])
-            deltarho = float(terms[1])
-            numr =     int(terms[2])
-            deltar =   float(terms[3])
-            cutoffr =  float(terms[4])
+            info['numrho'] = int(terms[0])
+            info['deltarho'] = float(terms[1])
+            info['numr'] = int(terms[2])
+            info['deltar'] = float(terms[3])
+            info['cutoffr'] = float(terms[4])
+            assert info['numrho'] > 0 and info['numr'] > 0
         except:
-            print(terms)
-            raise ValueError('Invalid potential file (line 5): numrho, deltarho, numr, deltar, cutoffr')
-        self.set_r(num=numr, cutoff=cutoffr, delta=deltar)
-        self.set_rho(num=numrho, delta=deltarho)
+            raise ValueError('Invalid potential file (line 3): numrho, deltarho, numr, deltar, cutoffr')
 
         # Read remaining content as space-delimited terms
-        c = 0
-        terms = ' '.join(lines[3:]).split()
-        expected = self.numrho + 2 * self.numr
-        if len(terms) != expected:
-            raise ValueError(f'Invalid number of tabulated values')
+        values, _ = read_values(fp, info['numrho'] + 2 * info['numr'])
+
+        return info, values
+
+    def __set_values(self,
+                     info: dict,
+                     values: np.ndarray):
+        """Sets the header, symbols, grids and tables from parsed content"""
+        numrho = info['numrho']
+        numr = info['numr']
+
+        self.header = info['header']
+        self.set_symbol_info(info['number'], info['mass'], info['alat'],
+                             info['lattice'])
+        self.set_r(num=numr, cutoff=info['cutoffr'], delta=info['deltar'])
+        self.set_rho(num=numrho, delta=info['deltarho'])
 
         # Read F(rho)
-        start = c
-        end = c + self.numrho
-        F_rho_table = np.array(terms[start:end],dtype=float)
-        self.set_F_rho(table=F_rho_table)
-        c += self.numrho
-        
+        c = 0
+        self.set_F_rho(table=values[c:c + numrho])
+        c += numrho
+
         # Read z(r)
-        start = c
-        end = c + self.numr
-        z_r_table = np.array(terms[start:end],dtype=float)
-        self.set_z_r(table=z_r_table)
-        c += self.numr    
+        self.set_z_r(table=values[c:c + numr])
+        c += numr
 
         # Read rho(r)
-        start = c
-        end = c + self.numr
-        rho_r_table = np.array(terms[start:end], dtype=float)
-        self.set_rho_r(table=rho_r_table)
+        self.set_rho_r(table=values[c:c + numr])
 
     def build(self,
               f: Union[str, Path, io.IOBase, None] = None,
@@ -1073,59 +1244,33 @@ class EAM():
             The parameter file contents (returned if f is not given).
         """
 
-        # Initialize funcfl str
-        funcfl = ''
+        def writer(fp):
+            # Add header
+            fp.write(self.header + '\n')
 
-        # Add header
-        funcfl = self.header + '\n'
+            # Add symbol header
+            info = self.symbol_info()
+            terms = (info['number'], info['mass'], info['alat'], info['lattice'])
+            fp.write(f'%i {xf} {xf} %s\n' % terms)
 
-        # Add symbol header
-        info = self.symbol_info()
-        terms = (info['number'], info['mass'], info['alat'], info['lattice'])
-        funcfl += f'%i {xf} {xf} %s\n' % terms
-
-        # Add r and rho header info
-        terms = (self.numrho, self.deltarho, self.numr, self.deltar, self.cutoffr)
-        funcfl += f'%i {xf} %i {xf} {xf}\n' % terms
-
-        line = []
-
-        # Build array of all values
-        vals = np.hstack([self.F_rho(), self.z_r(), self.rho_r()])
-        
-        # Tabulate values
-        for j in range(len(vals)):
-            line.append(xf % vals[j])
-            
-            if (j + 1) % ncolumns == 0:
-                funcfl += ' '.join(line) + '\n'
-                line = []
+            # Add r and rho header info
+            terms = (self.numrho, self.deltarho, self.numr, self.deltar, self.cutoffr)
+            fp.write(f'%i {xf} %i {xf} {xf}\n' % terms)
 
-        if len(line) > 0:
-            funcfl += ' '.join(line) + '\n'
-            line = []
+            # Tabulate values
+            vals = np.hstack([self.F_rho(), self.z_r(), self.rho_r()])
+            write_table(fp, vals, xf=xf, ncolumns=ncolumns)
 
         # Save or return
-        if f is None:
-            return funcfl
-        
-        elif isinstance(f, str):
-            with open(f, 'w') as fp:
-                fp.write(funcfl)
-        
-        elif hasattr(f, 'write'):
-            f.write(funcfl)
-        
-        else:
-            raise TypeError('f must be a path or a file-like object')
+        return write_output(f, writer)
 
     def plot_F_rho(self,
                    n: int = 0,
                    figsize: Tuple[float, float] = None,
-                   matplotlib_axes: Optional[plt.axes] = None,
+                   matplotlib_axes: Optional['plt.axes'] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
-                   ) -> Optional[plt.figure]:
+                   ) -> Optional['plt.figure']:
         """
         Generates a plot of F(rho) vs. rho.
 
@@ -1154,6 +1299,8 @@ class EAM():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1189,10 +1336,10 @@ class EAM():
     def plot_rho_r(self,
                    n: int = 0,
                    figsize: Tuple[float, float] = None,
-                   matplotlib_axes: Optional[plt.axes] = None,
+                   matplotlib_axes: Optional['plt.axes'] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
-                   ) -> Optional[plt.figure]:
+                   ) -> Optional['plt.figure']:
         """
         Generates a plot of rho(r) vs. r.
 
@@ -1221,6 +1368,8 @@ class EAM():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1256,10 +1405,10 @@ class EAM():
     def plot_rphi_r(self,
                     n: int = 0,
                     figsize: Tuple[float, float] = None,
-                    matplotlib_axes: Optional[plt.axes] = None,
+                    matplotlib_axes: Optional['plt.axes'] = None,
                     xlim: Optional[Tuple[float, float]] = None,
                     ylim: Optional[Tuple[float, float]] = None,
-                    ) -> Optional[plt.figure]:
+                    ) -> Optional['plt.figure']:
         """
         Generates a plot of r*phi(r) vs. r.
 
@@ -1288,6 +1437,8 @@ class EAM():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1323,10 +1474,10 @@ class EAM():
     def plot_phi_r(self,
                    n: int = 0,
                    figsize: Tuple[float, float] = None,
-                   matplotlib_axes: Optional[plt.axes] = None,
+                   matplotlib_axes: Optional['plt.axes'] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
-                   ) -> Optional[plt.figure]:
+                   ) -> Optional['plt.figure']:
         """
         Generates a plot of phi(r) vs. r.
 
@@ -1355,6 +1506,8 @@ class EAM():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1390,10 +1543,10 @@ class EAM():
     def plot_z_r(self, 
                  n: int = 0,
                  figsize: Tuple[float, float] = None,
-                 matplotlib_axes: Optional[plt.axes] = None,
+                 matplotlib_axes: Optional['plt.axes'] = None,
                  xlim: Optional[Tuple[float, float]] = None,
                  ylim: Optional[Tuple[float, float]] = None,
-                 ) -> Optional[plt.figure]:
+                 ) -> Optional['plt.figure']:
         """
         Generates a plot of z(r) vs. r.
 
@@ -1422,6 +1575,8 @@ class EAM():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
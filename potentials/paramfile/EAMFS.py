@@ -4,7 +4,7 @@ from copy import deepcopy
 import io
 import warnings
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
 # https://scipy.org/
 from scipy.interpolate import CubicSpline
@@ -13,13 +13,17 @@ from scipy.interpolate import CubicSpline
 import numpy as np
 import numpy.typing as npt
 
-# https://matplotlib.org/
-import matplotlib.pyplot as plt
+# https://matplotlib.org/ (imported when plotting)
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 # Local imports
 from ..tools import aslist, numderivative
+from ._spline_cache import SplineCache
+from ._setfl_mixin import SetflMixin
+from ._lazy import TableDict, as_table
 
-class EAMFS():
+class EAMFS(SetflMixin):
     """
     Class for building and analyzing LAMMPS setfl eam/fs parameter files 
     """
@@ -90,20 +94,20 @@ class EAMFS():
         # Initialize F terms
         self.__F_rho = {}
         self.__F_rho_kwargs = {}
-        self.__F_rho_table = {}
+        self.__F_rho_table = TableDict()
         
         # Initialize rho terms
         self.__rho_r = {}
         self.__rho_r_kwargs = {}
-        self.__rho_r_table = {}
+        self.__rho_r_table = TableDict()
         
         # Initialize phi terms
         self.__phi_r = {}
         self.__phi_r_kwargs = {}
-        self.__phi_r_table = {}
+        self.__phi_r_table = TableDict()
         self.__rphi_r = {}
         self.__rphi_r_kwargs = {}
-        self.__rphi_r_table = {}
+        self.__rphi_r_table = TableDict()
         
         # Initialize symbol terms
         self.__symbol = []
@@ -112,6 +116,9 @@ class EAMFS():
         self.__alat = {}
         self.__lattice = {}
 
+        # Initialize cached splines of tabulated functions
+        self.__spline_cache = SplineCache()
+
         if f is not None:
             self.load(f)
 
@@ -147,6 +154,16 @@ class EAMFS():
         """The LAMMPS pair_style associated with the class"""
         return 'eam/fs'
 
+    @property
+    def spline_cache(self) -> SplineCache:
+        """
+        SplineCache : The cubic splines of tabulated functions that are used
+        for evaluating the functions at given r or rho values.  Splines are
+        built when first needed and removed when the associated function or
+        the tabulation values change.
+        """
+        return self.__spline_cache
+
     @property
     def header(self) -> str:
         return self.__header
@@ -225,6 +242,9 @@ class EAMFS():
         else:
             raise ValueError('Either or both cutoff and delta are required')
 
+        # Remove cached splines of the old tabulated values
+        self.spline_cache.clear()
+
         # Change existing tables to spline functions
         if old_r is not None:
             for symbolstr in list(self.__rho_r_table.keys()):
@@ -300,6 +320,9 @@ class EAMFS():
         else:
             raise ValueError('Either or both cutoff and delta are required')
 
+        # Remove cached splines of the old tabulated values
+        self.spline_cache.clear()
+
         # Change existing tables to spline functions
         if old_rho is not None:
             for symbol in list(self.__F_rho_table.keys()):
@@ -426,8 +449,8 @@ class EAMFS():
                 return self.__F_rho_table[symbol]
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.rho, self.__F_rho_table[symbol])
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('F_rho', symbol, self.rho, self.__F_rho_table[symbol])
                 v = fxn(rho)
                 v[np.abs(v) <= 1e-100] = 0.0
                 return v
@@ -479,6 +502,9 @@ class EAMFS():
         if symbol not in self.symbols:
             raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
 
+        # Remove any cached spline
+        self.spline_cache.invalidate('F_rho', symbol)
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -489,7 +515,7 @@ class EAMFS():
                     raise ValueError('Number of table and rho values not the same')
                 
                 # Save tabulated values
-                self.__F_rho_table[symbol] = np.asarray(table)
+                self.__F_rho_table[symbol] = as_table(table)
                 if symbol in self.__F_rho:
                     del self.__F_rho[symbol]
                     del self.__F_rho_kwargs[symbol]
@@ -553,8 +579,8 @@ class EAMFS():
                 return self.__rho_r_table[symbolstr]
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rho_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('rho_r', symbolstr, self.r, self.__rho_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -618,6 +644,9 @@ class EAMFS():
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(symbols)
 
+        # Remove any cached spline
+        self.spline_cache.invalidate('rho_r', symbolstr)
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -628,7 +657,7 @@ class EAMFS():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rho_r_table[symbolstr] = np.asarray(table)
+                self.__rho_r_table[symbolstr] = as_table(table)
                 if symbolstr in self.__rho_r:
                     del self.__rho_r[symbolstr]
                     del self.__rho_r_kwargs[symbolstr]
@@ -691,8 +720,8 @@ class EAMFS():
                 return self.__rphi_r_table[symbolstr]
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rphi_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('rphi_r', symbolstr, self.r, self.__rphi_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -762,6 +791,9 @@ class EAMFS():
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
 
+        # Remove any cached spline
+        self.spline_cache.invalidate(['rphi_r', 'phi_r'], symbolstr)
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -772,7 +804,7 @@ class EAMFS():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rphi_r_table[symbolstr] = np.asarray(table)
+                self.__rphi_r_table[symbolstr] = as_table(table)
                 if symbolstr in self.__rphi_r:
                     del self.__rphi_r[symbolstr]
                     del self.__rphi_r_kwargs[symbolstr]
@@ -842,8 +874,8 @@ class EAMFS():
                 return self.__phi_r_table[symbolstr]
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__phi_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.spline_cache.get('phi_r', symbolstr, self.r, self.__phi_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -915,6 +947,9 @@ class EAMFS():
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
 
+        # Remove any cached spline
+        self.spline_cache.invalidate(['rphi_r', 'phi_r'], symbolstr)
+
         # Handle tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -925,7 +960,7 @@ class EAMFS():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__phi_r_table[symbolstr] = np.asarray(table)
+                self.__phi_r_table[symbolstr] = as_table(table)
                 if symbolstr in self.__phi_r:
                     del self.__phi_r[symbolstr]
                     del self.__phi_r_kwargs[symbolstr]
@@ -954,6 +989,18 @@ class EAMFS():
         if symbolstr in self.__rphi_r_table:
             del self.__rphi_r_table[symbolstr]
 
+    def _symbol_functions(self,
+                          symbol: str,
+                          symbols: list) -> list:
+        """F(rho) and all rho(r) are listed for each symbol"""
+        return [('F_rho', symbol)] + [('rho_r', [symbol, symbol2])
+                                      for symbol2 in symbols]
+
+    def _tables(self) -> dict:
+        """Gives the dicts of tabulated values for each function name"""
+        return {'F_rho': self.__F_rho_table, 'rho_r': self.__rho_r_table,
+                'rphi_r': self.__rphi_r_table, 'phi_r': self.__phi_r_table}
+
     def print_overview(self):
         """Prints an overview of set values"""
         print('sym at#  mass      alat       lat')
@@ -999,215 +1046,14 @@ class EAMFS():
                 except:
                     print(symbols[0], symbols[1], 'not set')
 
-    def load(self, f: Union[str, Path, io.IOBase]):
-        """
-        Reads in an eam/fs setfl file.
-        
-        Parameters
-        ----------
-        f : path-like object or file-like object
-            The parameter file to read in, either as a file path or as an open
-            file-like object.
-        """
-        
-        if hasattr(f, 'readlines'):
-            lines = f.readlines()
-        else:
-            with open(f) as fp:
-                lines = fp.readlines()
-
-        # Read lines 1-3 to header
-        self.header = ''.join(lines[:3]).strip()
-
-        # Read line 4 for symbols
-        symbols = lines[3].split()[1:]
-        nsymbols = len(symbols)
-        if nsymbols != int(lines[3].split()[0]):
-            raise ValueError('Invalid potential file (line 4): inconsistent number of symbols')
-
-        # Set initial dummy symbols info (replaced later)
-        for symbol in symbols:
-            self.set_symbol_info(symbol, 0, 0.0, 0.0, 'NA')
-
-        # Read line 5 for numrho, deltarho, numr, deltar, and cutoffr
-        terms = lines[4].split()
-        try:
-            assert len(terms) == 5
-            numrho =   int(terms[0])
-            deltarho = float(terms[1])
-            numr =     int(terms[2])
-            deltar =   float(terms[3])
-            cutoffr =  float(terms[4])
-        except:
-            print(terms)
-            raise ValueError('Invalid potential file (line 5): numrho, deltarho, numr, deltar, cutoffr')
-        self.set_r(num=numr, cutoff=cutoffr, delta=deltar)
-        self.set_rho(num=numrho, delta=deltarho)
-                    
-        # Read remaining content as space-delimited terms
-        c = 0
-        terms = ' '.join(lines[5:]).split()
-        numsymbols = len(self.symbols)
-        numsets = sum(range(1, numsymbols+1))
-        expected = numsymbols * (4 + self.numrho) + numsymbols**2 * self.numr + numsets * self.numr
-        if len(terms) != expected:
-            raise ValueError(f'Invalid number of tabulated values')
-
-        # Read per-symbol data
-        for symbol in symbols:
-            
-            # Read symbol info
-            number = int(terms[c])
-            mass = float(terms[c+1])
-            alat = float(terms[c+2])
-            lattice = str(terms[c+3])
-            self.set_symbol_info(symbol, number, mass, alat, lattice)
-
-            # Read F(rho)
-            start = c + 4
-            end = c + 4 + self.numrho
-            F_rho_table = np.array(terms[start:end],dtype=float)
-            self.set_F_rho(symbol, table=F_rho_table)
-            c += 4 + self.numrho
-
-            # Read rho(r)
-            for symbol2 in symbols:
-                start = c
-                end = c + self.numr
-                rho_r_table = np.array(terms[start:end],dtype=float)
-                self.set_rho_r([symbol, symbol2], table=rho_r_table)
-                c += self.numr
-        
-        # Iterate over unique symbol pairs
-        for i in range(nsymbols):
-            for j in range(0, i+1):
-                symbolpair = [symbols[i], symbols[j]]
-
-                # Read pair data
-                start = c
-                end = c + self.numr
-                rphi_r_table = np.array(terms[start:end], dtype=float)
-                self.set_rphi_r(symbolpair, table=rphi_r_table)
-
-                c += self.numr
-
-    def build(self,
-              f: Union[str, Path, io.IOBase, None] = None,
-              xf: str = '%25.16e',
-              ncolumns: int = 5) -> Optional[str]:
-        """
-        Constructs an eam/fs setfl parameter file.
-        
-        Parameters
-        ----------
-        f : str or file-like object
-            If given, the contents will be written to the file-like object or file name given by a str.
-            If not given, the parameter file contents will be returned as a str.
-        xf : str, optional
-            The c-style formatter to use for floating point numbers.  Default value is '%25.16e'.
-        ncolumns : int, optional
-            Indicates how many columns the tabulated values are split by.  Default value is 5.
-        
-        Returns
-        -------
-        str
-            The parameter file contents (returned if f is not given).
-        """
-
-        # Initialize setfl str
-        setfl = ''
-
-        # Add header
-        header = self.header.splitlines()
-        while len(header) < 3:
-            header.append('')
-        header = '\n'.join(header)+'\n'
-        setfl = header
-
-        # Add symbol header info
-        nsymbols = len(self.symbols)
-        if nsymbols == 0:
-            raise ValueError('No symbols set: no data to write')
-        setfl += str(nsymbols)
-        for symbol in self.symbols:
-            setfl += ' ' + symbol
-        setfl += '\n'
-
-        # Add r and rho header info
-        terms = (self.numrho, self.deltarho, self.numr, self.deltar, self.cutoffr)
-        setfl += f'%i {xf} %i {xf} {xf}\n' % terms
-
-        line = []
-
-        # Loop over symbols
-        for symbol in self.symbols:
-
-            # Add symbol header
-            info = self.symbol_info(symbol)
-            terms = (info['number'], info['mass'], info['alat'], info['lattice'])
-            setfl += f'%i {xf} {xf} %s\n' % terms
-
-            # Build array of F(rho) and rho(r) values
-            vals = []
-            vals.append(self.F_rho(symbol))
-            for symbol2 in self.symbols:
-                vals.append(self.rho_r([symbol, symbol2]))
-            vals = np.hstack(vals)
-
-            # Tabulate values
-            for j in range(len(vals)):
-                line.append(xf % vals[j])
-                
-                if (j + 1) % ncolumns == 0:
-                    setfl += ' '.join(line) + '\n'
-                    line = []
-
-            if len(line) > 0:
-                setfl += ' '.join(line) + '\n'
-                line = []
-
-        # Build array of all r*phi(r) values
-        vals = []
-        for i in range(nsymbols):
-            for j in range(i+1):
-                symbolpair = [self.symbols[i], self.symbols[j]]
-                vals.append(self.rphi_r(symbolpair))
-        vals = np.hstack(vals)
-
-        # Tabulate values
-        for j in range(len(vals)):
-            line.append(xf % (vals[j]))
-            
-            if (j + 1) % ncolumns == 0:
-                setfl += ' '.join(line) + '\n'
-                line = []
-                
-        if len(line) > 0:
-            setfl += ' '.join(line) + '\n'
-            line = []
-
-        # Save or return
-        if f is None:
-            return setfl
-        
-        elif isinstance(f, str):
-            with open(f, 'w') as fp:
-                fp.write(setfl)
-        
-        elif hasattr(f, 'write'):
-            f.write(setfl)
-        
-        else:
-            raise TypeError('f must be a path or a file-like object')
-    
     def plot_F_rho(self,
                    symbols: Union[str, list, None] = None,
                    n: int = 0,
                    figsize: Tuple[float, float] = None,
-                   matplotlib_axes: Optional[plt.axes] = None,
+                   matplotlib_axes: Optional['plt.axes'] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
-                   ) -> Optional[plt.figure]:
+                   ) -> Optional['plt.figure']:
         """
         Generates a plot of F(rho) vs. rho.
 
@@ -1239,6 +1085,8 @@ class EAMFS():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1285,10 +1133,10 @@ class EAMFS():
                    symbols: Union[str, list, None] = None,
                    n: int = 0,
                    figsize: Tuple[float, float] = None,
-                   matplotlib_axes: Optional[plt.axes] = None,
+                   matplotlib_axes: Optional['plt.axes'] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
-                   ) -> Optional[plt.figure]:
+                   ) -> Optional['plt.figure']:
         """
         Generates a plot of rho(r) vs. r.
 
@@ -1322,6 +1170,8 @@ class EAMFS():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1374,10 +1224,10 @@ class EAMFS():
                     symbols: Union[str, list, None] = None,
                     n: int = 0,
                     figsize: Tuple[float, float] = None,
-                    matplotlib_axes: Optional[plt.axes] = None,
+                    matplotlib_axes: Optional['plt.axes'] = None,
                     xlim: Optional[Tuple[float, float]] = None,
                     ylim: Optional[Tuple[float, float]] = None,
-                    ) -> Optional[plt.figure]:
+                    ) -> Optional['plt.figure']:
         """
         Generates a plot of r*phi(r) vs. r.
 
@@ -1411,6 +1261,8 @@ class EAMFS():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
@@ -1462,10 +1314,10 @@ class EAMFS():
                    symbols: Union[str, list, None] = None,
                    n: int = 0,
                    figsize: Tuple[float, float] = None,
-                   matplotlib_axes: Optional[plt.axes] = None,
+                   matplotlib_axes: Optional['plt.axes'] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
-                   ) -> Optional[plt.figure]:
+                   ) -> Optional['plt.figure']:
         """
         Generates a plot of rho(r) vs. r.
 
@@ -1499,6 +1351,8 @@ class EAMFS():
         matplotlib.pyplot.figure
             The generated figure.  Returned if matplotlib_axes is not given.
         """
+        import matplotlib.pyplot as plt
+
         # Initial plot setup and parameters
         if matplotlib_axes is None:
             if figsize is None:
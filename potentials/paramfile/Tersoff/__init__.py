@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ._text import header_lines, format_column, join_columns
+from ._abop_fitter import ABOPFitter
 
 
 class Tersoff():
@@ -8,6 +10,7 @@ class Tersoff():
 
     # Class imports
     from ._abop import abop
+    from ._abop_fitter import abop_fitter
 
     def __init__(self, symbols, pair_style='tersoff'):
         """
@@ -67,16 +70,13 @@ class Tersoff():
         """
         Generates all the ternary combinations for the element model symbols.
         """
-        symbols = self.symbols
-        e1 = []
-        e2 = []
-        e3 = []
-        for i in range(len(symbols)):
-            for j in range(len(symbols)):
-                for k in range(len(symbols)):
-                    e1.append(symbols[i])
-                    e2.append(symbols[j])
-                    e3.append(symbols[k])
+        symbols = np.asarray(self.symbols, dtype=object)
+        n = len(symbols)
+
+        # e1 varies slowest and e3 fastest
+        e1 = np.repeat(symbols, n * n)
+        e2 = np.tile(np.repeat(symbols, n), n)
+        e3 = np.tile(symbols, n * n)
 
         return e1, e2, e3
 
@@ -202,47 +202,11 @@ class Tersoff():
         paramstr : str
             The fully compiled comments and potential parameters.
         """
-        # Split headers into separate lines
-        if headers == '':
-            hlines = []
-        else:
-            hlines = headers.splitlines()
-        
-        # Add comment hashtag to non-blank lines that don't already start with it
-        for i in range(len(hlines)):
-            if len(hlines[i].strip()) > 0 and hlines[i].strip()[0] != '#':
-                hlines[i] = '#' + hlines[i]
-        
-        lines = ['' for i in range(len(self.params)+1)]
+        hlines = header_lines(headers)
+        columns = [format_column(key, self.params[key], first=(j == 0))
+                   for j, key in enumerate(self.params.keys())]
+        paramstr = join_columns(hlines, columns, len(self.params))
 
-        # Loop over all keys
-        first = True
-        for key in self.params.keys():
-            l = 3
-            
-            # Add comment hashtag to first header key
-            if first:
-                v = '#' + key
-                first = False
-            else:
-                v = key
-            
-            vals = [v]
-            if len(v) > l:
-                l = len(v)
-            
-            for i in self.params.index:
-                v = str(self.params.loc[i, key])
-                vals.append(v)
-                if len(v) > l:
-                    l = len(v)
-
-            for i in range(len(lines)):
-                lines[i] += f'{vals[i]:{l}} '
-
-        # Compile all parameter lines together
-        paramstr = '\n'.join(hlines + lines)
-        
         return paramstr
 
     def save(self, fname, headers:str = ''):
@@ -4,8 +4,6 @@ from math import sqrt, exp
 import numpy as np
 import pandas as pd
 
-from potentials.tools import atomic_number
-
 @classmethod
 def abop(cls, fname, pair_style=None):
     """
@@ -23,68 +21,16 @@ def abop(cls, fname, pair_style=None):
         will be inferred based on if the extra zbl fields are included in
         the parameter file.
     """
-    # Read abop parameters from a file
-    abop_params, mod_params = read_abop(fname)
-
-    # Find the list of all element symbol models
-    symbols = []
-    for el1 in abop_params.el1:
-        if el1 not in symbols:
-            symbols.append(el1)
-    
-    # Identify the default pair_style to use
-    if pair_style is None:
-        if 'bf' in abop_params:
-            pair_style = 'tersoff/zbl'
-        else:
-            pair_style = 'tersoff'
-    
-    # Initialize the Tersoff object and extract its params
-    obj = cls(symbols, pair_style=pair_style)
-    tersoff = obj.params
-
-    # Loop over each abop_params row
-    for index in abop_params.index:
-        abopi = abop_params.loc[index]
-        el1 = abopi.el1
-        el2 = abopi.el2
-
-        twobody = abop_to_tersoff_2body(abopi, pair_style=pair_style)
-        match2body = (tersoff.e2 == tersoff.e3) & ( ( (tersoff.e1 == el1) & (tersoff.e2 == el2) ) | ( (tersoff.e1 == el2) & (tersoff.e2 == el1) ) )
-        for key in twobody:
-            tersoff.loc[match2body, key] = twobody[key]
-
-        threebody = abop_to_tersoff_3body(abopi, pair_style=pair_style)
-        match3body = ( (tersoff.e1 == el1) & (tersoff.e3 == el2) ) | ( (tersoff.e1 == el2) & (tersoff.e3 == el1) )
-        for key in threebody:
-            tersoff.loc[match3body, key] = threebody[key]
-
-    # Fill in element numbers for ZBL
-    if pair_style == 'tersoff/zbl':
-        for index in tersoff.index:
-            tersoff.loc[index, 'Z_i'] = atomic_number(tersoff.loc[index, 'e1'])
-            tersoff.loc[index, 'Z_j'] = atomic_number(tersoff.loc[index, 'e2'])
-
-    # Loop over 3-body modification parameters
-    for index in mod_params.index:
-        mod = mod_params.loc[index]
-        key, e1, e2, e3, val = mod.tolist()
-        matchmod = ( (tersoff.e1 == e1) & (tersoff.e2 == e2) & (tersoff.e3 == e3) )
-        if key == 'α':
-            tersoff.loc[matchmod, 'lambda3'] = val
-        elif key == 'ω':
-            tersoff.loc[matchmod, 'gamma'] *= val
-
-    return obj
+    return cls.abop_fitter(fname, pair_style=pair_style).tersoff()
 
 def abop_to_tersoff_2body(abop, pair_style='tersoff'):
     """Transform the 2-body abop params to LAMMPS format"""
 
     # Extract ABOP parameters
-    β = abop.β
-    S = abop.S
-    D0 = abop.D0
-    r0 = abop.r0
+    β = abop['β']
+    S = abop['S']
+    D0 = abop['D0']
+    r0 = abop['r0']
     
     # Convert to Tersoff paramters
     tersoff = {}
@@ -99,17 +45,17 @@ def abop_to_tersoff_3body(abop, pair_style='tersoff'):
     """Transform the 3-body abop params to LAMMPS format"""
     # Map abop to tersoff
     tersoff = {}
-    tersoff['gamma'] = abop.γ * abop.ω
-    tersoff['lambda3'] = abop.α
-    tersoff['costheta0'] = - abop.h
-    tersoff['c'] = abop.c
-    tersoff['d'] = abop.d
-    tersoff['Rcut'] = abop.R
-    tersoff['D'] = abop.D
+    tersoff['gamma'] = abop['γ'] * abop['ω']
+    tersoff['lambda3'] = abop['α']
+    tersoff['costheta0'] = - abop['h']
+    tersoff['c'] = abop['c']
+    tersoff['d'] = abop['d']
+    tersoff['Rcut'] = abop['R']
+    tersoff['D'] = abop['D']
 
     if pair_style == 'tersoff/zbl' and 'bf' in abop:
-        tersoff['ZBLcut'] = abop.rf
-        tersoff['ZBLexpscale'] = abop.bf
+        tersoff['ZBLcut'] = abop['rf']
+        tersoff['ZBLexpscale'] = abop['bf']
     
     return tersoff
 
@@ -0,0 +1,303 @@
+from copy import copy
+
+import numpy as np
+import pandas as pd
+
+from potentials.tools import atomic_number
+from ._abop import read_abop, abop_to_tersoff_2body, abop_to_tersoff_3body
+from ._text import header_lines, format_column, join_columns
+
+@classmethod
+def abop_fitter(cls, fname, pair_style=None):
+    """
+    Reads in parameters from the Albe-Nordlund ABOP format and returns an
+    ABOPFitter that can quickly regenerate the LAMMPS Tersoff parameters as
+    the ABOP parameter values are changed.
+
+    Parameters
+    ----------
+    fname : path-like object
+        The name/path of the parameter file to read in.  See the examples
+        for file format information.
+    pair_style : str, optional
+        The specific LAMMPS tersoff pair_style, which can be None,
+        'tersoff' or 'tersoff/zbl'.  If None (default) then the pair_style
+        will be inferred based on if the extra zbl fields are included in
+        the parameter file.
+
+    Returns
+    -------
+    ABOPFitter
+        The fitter initialized with the file's parameters.
+    """
+    # Read abop parameters from a file
+    abop_params, mod_params = read_abop(fname)
+
+    # Find the list of all element symbol models
+    symbols = []
+    for el1 in abop_params.el1:
+        if el1 not in symbols:
+            symbols.append(el1)
+
+    # Identify the default pair_style to use
+    if pair_style is None:
+        if 'bf' in abop_params:
+            pair_style = 'tersoff/zbl'
+        else:
+            pair_style = 'tersoff'
+
+    return ABOPFitter(cls(symbols, pair_style=pair_style), abop_params, mod_params)
+
+class ABOPFitter():
+    """
+    Converts Albe-Nordlund ABOP parameters to LAMMPS Tersoff parameters for
+    fitting loops.  The ABOP definition is parsed once and the Tersoff rows
+    set by each element pair and 3-body modification are precomputed so that
+    new ABOP parameter values only update the affected values and formatted
+    columns rather than rebuilding the full parameter table.
+    """
+
+    # ABOP keys that the 2-body Tersoff parameters depend on
+    twobody_keys = ('D0', 'r0', 'β', 'S')
+
+    def __init__(self, tersoff, abop_params, mod_params=None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        tersoff : Tersoff
+            A Tersoff object with a 'tersoff' or 'tersoff/zbl' pair_style for
+            the symbols in abop_params.  Its parameter values are used for the
+            rows that are not set by the ABOP parameters.
+        abop_params : pandas.DataFrame
+            The 2-body and 3-body ABOP parameters with one row per element
+            pair, as returned by read_abop.
+        mod_params : pandas.DataFrame, optional
+            The 3-body modification parameters, as returned by read_abop.
+        """
+        if tersoff.pair_style not in ['tersoff', 'tersoff/zbl']:
+            raise ValueError(f'invalid/unsupported pair_style {tersoff.pair_style}')
+        if mod_params is None:
+            mod_params = pd.DataFrame()
+
+        self.__template = tersoff
+        self.__pair_style = tersoff.pair_style
+        self.__columns = {key: tersoff.params[key].to_numpy(copy=True)
+                          for key in tersoff.params.keys()}
+        self.__formatted = {}
+
+        # Build the (e1, e2, e3) to row index
+        self.__index = {}
+        for i, triplet in enumerate(zip(self.__columns['e1'],
+                                        self.__columns['e2'],
+                                        self.__columns['e3'])):
+            self.__index[triplet] = i
+        nrows = len(self.__index)
+
+        # Store the ABOP parameter values as arrays
+        self.__pairs = list(zip(abop_params.el1, abop_params.el2))
+        self.__values = {}
+        for key in abop_params.keys():
+            if key not in ['el1', 'el2']:
+                self.__values[key] = abop_params[key].to_numpy(dtype=float, copy=True)
+
+        # Identify the pair that sets each row with later pairs taking priority
+        pair2 = np.full(nrows, -1)
+        pair3 = np.full(nrows, -1)
+        symbols = tersoff.symbols
+        for p, (el1, el2) in enumerate(self.__pairs):
+            for triplet in [(el1, el2, el2), (el2, el1, el1)]:
+                if triplet in self.__index:
+                    pair2[self.__index[triplet]] = p
+            for e2 in symbols:
+                for triplet in [(el1, e2, el2), (el2, e2, el1)]:
+                    if triplet in self.__index:
+                        pair3[self.__index[triplet]] = p
+        self.__rows2 = np.flatnonzero(pair2 >= 0)
+        self.__pair2 = pair2[self.__rows2]
+        self.__rows3 = np.flatnonzero(pair3 >= 0)
+        self.__pair3 = pair3[self.__rows3]
+
+        # Find the rows for the 3-body modifications
+        self.__mods = []
+        for mod in mod_params.itertuples(index=False):
+            key, e1, e2, e3, val = mod
+            if (e1, e2, e3) in self.__index:
+                self.__mods.append((key, self.__index[(e1, e2, e3)], val))
+        self.__modbase = {}
+        for key, row, val in self.__mods:
+            for column in ['lambda3', 'gamma']:
+                self.__modbase[(column, row)] = self.__columns[column][row]
+
+        # Fill in element numbers for ZBL
+        if self.pair_style == 'tersoff/zbl':
+            numbers = {symbol: atomic_number(symbol) for symbol in symbols}
+            for key, ekey in [('Z_i', 'e1'), ('Z_j', 'e2')]:
+                self.__columns[key] = np.array([numbers[e] for e in self.__columns[ekey]],
+                                               dtype=int)
+
+        self.__update_2body()
+        self.__update_3body()
+
+    @property
+    def pair_style(self) -> str:
+        """str: The LAMMPS pair_style for the tersoff potential"""
+        return self.__pair_style
+
+    @property
+    def pairs(self) -> list:
+        """list: The (el1, el2) element pairs in ABOP parameter order"""
+        return list(self.__pairs)
+
+    @property
+    def index(self) -> dict:
+        """dict: The Tersoff parameter row for each (e1, e2, e3) triplet"""
+        return dict(self.__index)
+
+    @property
+    def keys(self) -> list:
+        """list: The ABOP parameter names that can be updated"""
+        return list(self.__values.keys())
+
+    def values(self, key: str) -> np.ndarray:
+        """
+        Returns the current values of an ABOP parameter.
+
+        Parameters
+        ----------
+        key : str
+            The ABOP parameter name.
+
+        Returns
+        -------
+        numpy.ndarray
+            The parameter values for each element pair.
+        """
+        return self.__values[key].copy()
+
+    def update(self, **kwargs):
+        """
+        Changes ABOP parameter values and updates the affected Tersoff values.
+
+        Parameters
+        ----------
+        **kwargs : array-like
+            ABOP parameter names and the new values for each element pair in
+            ABOP parameter order.  Single values are used for all pairs.
+        """
+        npairs = len(self.__pairs)
+        newvalues = {}
+        for key, value in kwargs.items():
+            if key not in self.__values:
+                raise ValueError(f'Unknown parameter {key}')
+            try:
+                newvalues[key] = np.broadcast_to(np.asarray(value, dtype=float), (npairs,))
+            except ValueError as e:
+                raise ValueError(f'{key} must have one value for each of the {npairs} pairs') from e
+
+        twobody = False
+        threebody = False
+        for key, value in newvalues.items():
+            self.__values[key][:] = value
+            if key in self.twobody_keys:
+                twobody = True
+            else:
+                threebody = True
+
+        if twobody:
+            self.__update_2body()
+        if threebody:
+            self.__update_3body()
+
+    def __set_column(self, key, rows, values):
+        """Sets values for rows of a Tersoff column and clears its formatting"""
+        column = self.__columns[key]
+        if not np.array_equal(column[rows], values):
+            column[rows] = values
+            self.__formatted.pop(key, None)
+
+    def __update_2body(self):
+        """Recomputes the Tersoff values set by the 2-body ABOP parameters"""
+        pairvalues = {}
+        for p in range(len(self.__pairs)):
+            abop = {key: self.__values[key][p].item() for key in self.twobody_keys}
+            for key, value in abop_to_tersoff_2body(abop, pair_style=self.pair_style).items():
+                pairvalues.setdefault(key, []).append(value)
+
+        for key, values in pairvalues.items():
+            self.__set_column(key, self.__rows2, np.array(values)[self.__pair2])
+
+    def __update_3body(self):
+        """Recomputes the Tersoff values set by the 3-body ABOP parameters"""
+        # Reset modified values for rows not set by any pair
+        for (column, row), val in self.__modbase.items():
+            self.__set_column(column, row, val)
+
+        pairvalues = abop_to_tersoff_3body(self.__values, pair_style=self.pair_style)
+        for key, values in pairvalues.items():
+            self.__set_column(key, self.__rows3, values[self.__pair3])
+
+        # Apply 3-body modification parameters
+        for key, row, val in self.__mods:
+            if key == 'α':
+                self.__set_column('lambda3', row, val)
+            elif key == 'ω':
+                self.__set_column('gamma', row, self.__columns['gamma'][row] * val)
+
+    def tersoff(self):
+        """
+        Returns a new Tersoff object with the current parameter values.
+
+        Returns
+        -------
+        Tersoff
+            The LAMMPS Tersoff parameters.
+        """
+        obj = copy(self.__template)
+        obj.params = pd.DataFrame({key: column.copy()
+                                   for key, column in self.__columns.items()})
+        return obj
+
+    def text(self, headers: str = '') -> str:
+        """
+        Builds the parameter file contents as a str.  Only columns that have
+        changed since the last call are reformatted.
+
+        Parameters
+        ----------
+        headers : str
+            Any custom header content that you wish to add.  Can be as many
+            lines as you like by including newline characters.  Will
+            automatically add comment hashtag symbols at the beginning of any
+            line if they are needed.
+
+        Returns
+        -------
+        paramstr : str
+            The fully compiled comments and potential parameters.
+        """
+        columns = []
+        for j, key in enumerate(self.__columns):
+            if key not in self.__formatted:
+                self.__formatted[key] = format_column(key, self.__columns[key],
+                                                      first=(j == 0))
+            columns.append(self.__formatted[key])
+
+        return join_columns(header_lines(headers), columns, len(self.__index))
+
+    def save(self, fname, headers: str = ''):
+        """
+        Generates the parameters in the LAMMPS format and saves them to a file.
+
+        Parameters
+        ----------
+        fname : path-like object
+            The name/path of the file to save the parameters to.
+        headers : str
+            Any custom header content that you wish to add.
+        """
+        paramstr = self.text(headers=headers)
+
+        with open(fname, 'w') as f:
+            f.write(paramstr)
@@ -0,0 +1,81 @@
+from typing import Iterable
+
+import numpy as np
+
+def header_lines(headers: str = '') -> list:
+    """
+    Splits custom header content into lines and adds comment hashtag symbols
+    to non-blank lines that don't already start with one.
+    """
+    # Split headers into separate lines
+    if headers == '':
+        hlines = []
+    else:
+        hlines = headers.splitlines()
+
+    # Add comment hashtag to non-blank lines that don't already start with it
+    for i in range(len(hlines)):
+        if len(hlines[i].strip()) > 0 and hlines[i].strip()[0] != '#':
+            hlines[i] = '#' + hlines[i]
+
+    return hlines
+
+def format_column(key: str,
+                  values: Iterable,
+                  first: bool = False) -> list:
+    """
+    Formats a parameter column as str values, starting with the key, that are
+    all padded to the same width (at least 3).
+
+    Parameters
+    ----------
+    key : str
+        The parameter name.
+    values : array-like
+        The parameter values.
+    first : bool, optional
+        Indicates if this is the first column, in which case a comment hashtag
+        symbol is added to the key.
+
+    Returns
+    -------
+    list
+        The padded str key and values.
+    """
+    # Add comment hashtag to first header key
+    if first:
+        key = '#' + key
+
+    vals = [key] + [str(v) for v in np.asarray(values).tolist()]
+    width = max(3, max(map(len, vals)))
+    return [v.ljust(width) for v in vals]
+
+def join_columns(hlines: list,
+                 columns: list,
+                 nrows: int) -> str:
+    """
+    Joins header lines and formatted parameter columns into the parameter file
+    contents.
+
+    Parameters
+    ----------
+    hlines : list
+        The comment header lines.
+    columns : list
+        The columns as returned by format_column.
+    nrows : int
+        The number of parameter rows.
+
+    Returns
+    -------
+    str
+        The fully compiled comments and potential parameters.
+    """
+    # Join the columns row-wise
+    if len(columns) > 0:
+        lines = [' '.join(row) + ' ' for row in zip(*columns)]
+    else:
+        lines = ['' for i in range(nrows+1)]
+
+    # Compile all parameter lines together
+    return '\n'.join(hlines + lines)
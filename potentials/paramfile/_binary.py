@@ -0,0 +1,274 @@
+# coding: utf-8
+# Standard libraries
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import stat
+import struct
+import tempfile
+from typing import Callable, Tuple, Union
+import zipfile
+
+# https://numpy.org/
+import numpy as np
+
+# Increment when the stored info or value ordering changes
+binary_version = 1
+
+def is_binary(f: Union[str, Path, io.IOBase]) -> bool:
+    """
+    Checks if a parameter file input is a path to a binary .npz file.
+
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The parameter file input.
+
+    Returns
+    -------
+    bool
+        True if f is a path ending in '.npz'.
+    """
+    return isinstance(f, (str, Path)) and str(f).endswith('.npz')
+
+def sidecar_path(f: Union[str, Path]) -> Path:
+    """
+    Returns the path of the binary cache file kept next to a text parameter
+    file, which is the text file's path with '.npz' appended.
+    """
+    return Path(f'{f}.npz')
+
+def source_info(path: Union[str, Path],
+                sha256: bool = True) -> dict:
+    """
+    Gets the identifying information for a text parameter file that is used
+    to validate its binary cache file.
+
+    Parameters
+    ----------
+    path : path-like object
+        The text parameter file.
+    sha256 : bool, optional
+        If True (default), the sha256 checksum of the file is included.
+
+    Returns
+    -------
+    dict
+        The file's modification time in ns, size in bytes and, optionally,
+        sha256 checksum.
+    """
+    stat = os.stat(path)
+    info = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+    if sha256:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(2**20), b''):
+                h.update(chunk)
+        info['sha256'] = h.hexdigest()
+    return info
+
+def write_binary(f: Union[str, Path, io.IOBase],
+                 pair_style: str,
+                 info: dict,
+                 values: np.ndarray):
+    """
+    Writes parameter file contents in the binary format: an uncompressed .npz
+    file containing the JSON info as 'info' and all numeric values as a single
+    float64 array 'values'.  Paths are written to a uniquely named temporary
+    file first and then moved into place.
+
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The file to write to.
+    pair_style : str
+        The pair_style of the parameter file.
+    info : dict
+        The non-tabulated content, e.g. header, symbols and grid values.
+    values : numpy.ndarray
+        The numeric values in the order that they appear in the text format.
+    """
+    info = dict(info, pair_style=pair_style, version=binary_version)
+    arrays = dict(info=np.array(json.dumps(info)),
+                  values=np.ascontiguousarray(values, dtype=float))
+
+    if hasattr(f, 'write'):
+        np.savez(f, **arrays)
+    else:
+        # Use a unique temporary file so concurrent writers do not collide
+        fd, tmpname = tempfile.mkstemp(dir=Path(f).parent,
+                                       prefix=f'.{Path(f).name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                np.savez(fp, **arrays)
+            os.chmod(tmpname, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmpname, f)
+        except BaseException:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+            raise
+
+def memmap_member(path: Union[str, Path],
+                  name: str) -> np.ndarray:
+    """
+    Memory-maps an array stored uncompressed in a .npz file.
+
+    Parameters
+    ----------
+    path : path-like object
+        The .npz file.
+    name : str
+        The array name.
+
+    Returns
+    -------
+    numpy.memmap
+        The read-only memory-mapped array.
+    """
+    with zipfile.ZipFile(path) as zf:
+        member = zf.getinfo(f'{name}.npy')
+    if member.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f'{name} is compressed and cannot be memory-mapped')
+
+    with open(path, 'rb') as fp:
+
+        # Skip the zip local file header to the start of the .npy content
+        fp.seek(member.header_offset)
+        local = fp.read(30)
+        namelength, extralength = struct.unpack('<HH', local[26:30])
+        fp.seek(member.header_offset + 30 + namelength + extralength)
+
+        # Read the .npy header
+        version = np.lib.format.read_magic(fp)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fp)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fp)
+        offset = fp.tell()
+
+    order = 'F' if fortran_order else 'C'
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order=order)
+
+def read_info(f: Union[str, Path, io.IOBase]) -> dict:
+    """
+    Reads only the info of a binary parameter file.
+
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The file to read.
+
+    Returns
+    -------
+    dict
+        The non-tabulated content, e.g. header, symbols and grid values, along
+        with the pair_style and format version.
+    """
+    with np.load(f) as npz:
+        info = json.loads(str(npz['info']))
+    if info.get('version', None) != binary_version:
+        raise ValueError('Unsupported binary parameter file version')
+    return info
+
+def read_binary(f: Union[str, Path, io.IOBase],
+                pair_style: str,
+                mmap: bool = False) -> Tuple[dict, np.ndarray]:
+    """
+    Reads parameter file contents in the binary format.
+
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The file to read.
+    pair_style : str
+        The pair_style expected for the file.
+    mmap : bool, optional
+        If True, the values are memory-mapped rather than read into memory.
+        Requires f to be a path.  Default value is False.
+
+    Returns
+    -------
+    info : dict
+        The non-tabulated content, e.g. header, symbols and grid values.
+    values : numpy.ndarray
+        The numeric values in the order that they appear in the text format.
+    """
+    info = read_info(f)
+    if info['pair_style'] != pair_style:
+        raise ValueError(f"Binary parameter file is for pair_style {info['pair_style']}, not {pair_style}")
+
+    if mmap:
+        values = memmap_member(f, 'values')
+    else:
+        if hasattr(f, 'seek'):
+            f.seek(0)
+        with np.load(f) as npz:
+            values = npz['values']
+
+    return info, values
+
+def read_cached(f: Union[str, Path],
+                pair_style: str,
+                parse: Callable[[io.IOBase], Tuple[dict, np.ndarray]],
+                validate: str = 'mtime') -> Tuple[dict, np.ndarray]:
+    """
+    Reads a text parameter file using its binary cache file if the cache
+    matches the text file.  Otherwise, the text file is parsed and a new cache
+    file is written next to it.  Cache files that cannot be read are replaced
+    and cache files that cannot be written are skipped.
+
+    Parameters
+    ----------
+    f : path-like object
+        The text parameter file.
+    pair_style : str
+        The pair_style of the file.
+    parse : function
+        Takes the open text file and returns the info dict and values.
+    validate : str, optional
+        How the cache is checked against the text file: 'mtime' (default)
+        compares the modification times and sizes, 'hash' compares the sizes
+        and sha256 checksums.  Caches written in 'mtime' mode do not include
+        the checksum, so they are rebuilt the first time 'hash' is used.
+
+    Returns
+    -------
+    info : dict
+        The non-tabulated content, e.g. header, symbols and grid values.
+    values : numpy.ndarray
+        The numeric values in the order that they appear in the text format.
+    """
+    if validate not in ['mtime', 'hash']:
+        raise ValueError("validate must be 'mtime' or 'hash'")
+
+    cachepath = sidecar_path(f)
+    source = source_info(f, sha256=(validate == 'hash'))
+
+    # Use the cache if valid
+    if cachepath.is_file():
+        try:
+            info, values = read_binary(cachepath, pair_style)
+            cached = info.pop('source')
+            if validate == 'mtime':
+                keys = ['mtime_ns', 'size']
+            else:
+                keys = ['size', 'sha256']
+            if all([cached.get(key, None) == source[key] for key in keys]):
+                return info, values
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            pass
+
+    # Parse the text file and save the cache
+    with open(f) as fp:
+        info, values = parse(fp)
+    try:
+        write_binary(cachepath, pair_style, dict(info, source=source), values)
+    except OSError:
+        pass
+
+    return info, values
@@ -0,0 +1,255 @@
+# coding: utf-8
+# Standard libraries
+import io
+import os
+from pathlib import Path
+from typing import Any, Callable, Tuple, Union
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+# Local imports
+from ._setfl import read_setfl_header, whitespace_chars
+
+class LazyTable():
+    """
+    A table of values in a text parameter file that is only read and parsed
+    when it is first needed.
+    """
+    def __init__(self,
+                 path: Union[str, Path],
+                 start: int,
+                 end: int,
+                 count: int,
+                 mtime_ns: int):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        path : path-like object
+            The parameter file.
+        start : int
+            The byte offset of the first value.
+        end : int
+            The byte offset after the last value.
+        count : int
+            The number of values.
+        mtime_ns : int
+            The modification time of the file when it was indexed.  Loading
+            fails if the file has changed since.
+        """
+        self.__path = Path(path)
+        self.__start = start
+        self.__end = end
+        self.__count = count
+        self.__mtime_ns = mtime_ns
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __repr__(self) -> str:
+        return f'LazyTable({self.__path}, {self.__count} values)'
+
+    def load(self) -> np.ndarray:
+        """
+        Reads and parses the values.
+
+        Returns
+        -------
+        numpy.ndarray
+            The table values.
+        """
+        if os.stat(self.__path).st_mtime_ns != self.__mtime_ns:
+            raise ValueError(f'{self.__path} has changed since it was loaded')
+        with open(self.__path, 'rb') as fp:
+            fp.seek(self.__start)
+            content = fp.read(self.__end - self.__start)
+        values = np.array(content.split(), dtype=float)
+        if values.size != self.__count:
+            raise ValueError(f'Invalid number of tabulated values: {self.__count} expected, {values.size} found')
+        return values
+
+class TableDict(dict):
+    """
+    Dictionary of tabulated values where LazyTable values are loaded and
+    replaced with the loaded arrays when first accessed.
+    """
+    def __getitem__(self, key: Any) -> np.ndarray:
+        value = super().__getitem__(key)
+        if isinstance(value, LazyTable):
+            value = value.load()
+            super().__setitem__(key, value)
+        return value
+
+def as_table(table: Union[npt.ArrayLike, LazyTable]) -> Union[np.ndarray, LazyTable]:
+    """Converts table values to an array while keeping LazyTables unread"""
+    if isinstance(table, LazyTable):
+        return table
+    return np.asarray(table)
+
+def index_terms(fp: io.IOBase,
+                indices: list,
+                expected: int,
+                chunksize: int = 2**20) -> list:
+    """
+    Finds the byte offsets of whitespace-delimited terms in a single scan of
+    the rest of a file opened in binary mode.  Only one chunk of the file is
+    held in memory at a time.
+
+    Parameters
+    ----------
+    fp : file-like object
+        The file opened in binary mode and positioned where term counting
+        starts.
+    indices : list
+        The sorted term indices to find the offsets of.  An index equal to
+        expected gives the end of the file.
+    expected : int
+        The total number of terms expected.
+    chunksize : int, optional
+        The number of bytes to scan at a time.  Default value is 2**20.
+
+    Returns
+    -------
+    list
+        The byte offsets of the terms at the given indices.
+
+    Raises
+    ------
+    ValueError
+        If the number of terms is not the expected number.
+    """
+    offsets = []
+    n = 0
+    count = 0
+    prevspace = True
+    position = fp.tell()
+    while True:
+        chunk = fp.read(chunksize)
+        if len(chunk) == 0:
+            break
+        space = whitespace_chars[np.frombuffer(chunk, dtype=np.uint8)]
+
+        # Find the positions in the chunk where terms start
+        starts = np.flatnonzero(~space & np.concatenate([[prevspace], space[:-1]]))
+        while n < len(indices) and indices[n] < count + len(starts):
+            offsets.append(position + int(starts[indices[n] - count]))
+            n += 1
+
+        count += len(starts)
+        position += len(chunk)
+        prevspace = bool(space[-1])
+
+    if count != expected:
+        raise ValueError(f'Invalid number of tabulated values: {expected} expected, {count} found')
+    while n < len(indices):
+        offsets.append(position)
+        n += 1
+
+    return offsets
+
+class LazyValues():
+    """
+    Stand-in for the values array of a parsed setfl parameter file.  Slices
+    that match a table return the table's LazyTable, and single indices
+    return the symbol info values, which are read when the file is indexed.
+    """
+    def __init__(self,
+                 scalars: dict,
+                 tables: dict):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        scalars : dict
+            The symbol info values by their value index.
+        tables : dict
+            The LazyTables by their (start, stop) value indices.
+        """
+        self.__scalars = scalars
+        self.__tables = tables
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, LazyTable]:
+        if isinstance(index, slice):
+            try:
+                return self.__tables[(index.start, index.stop)]
+            except KeyError:
+                raise IndexError(f'slice {index.start}:{index.stop} does not match a table')
+        return self.__scalars[index]
+
+def lazy_setfl(path: Union[str, Path],
+               layout: Callable[[list, dict], Tuple[list, list]]
+               ) -> Tuple[dict, LazyValues]:
+    """
+    Indexes a setfl parameter file in a single scan so that its tables can
+    be read individually when needed.  Only the header and symbol info are
+    parsed.
+
+    Parameters
+    ----------
+    path : path-like object
+        The setfl parameter file.
+    layout : function
+        Takes the symbols and grid values and returns the sizes of the tables
+        listed after each symbol's info line, and the sizes of all pair
+        tables in order.
+
+    Returns
+    -------
+    info : dict
+        The header, symbols, lattices and grid values.
+    values : LazyValues
+        Stand-in for the numeric values in the order that they appear in the
+        file.
+    """
+    if not isinstance(path, (str, Path)):
+        raise TypeError('lazy loading requires a file path')
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    with open(path, 'rb') as fp:
+
+        # Read lines 1-5 for header, symbols, and r and rho values
+        lines = [fp.readline() for i in range(5)]
+        header, symbols, grid = read_setfl_header(io.StringIO(b''.join(lines).decode()))
+        symbol_sizes, pair_sizes = layout(symbols, grid)
+
+        # List the blocks as (term index, value index, size, is info)
+        blocks = []
+        t = 0
+        v = 0
+        for symbol in symbols:
+            blocks.append((t, v, 4, True))
+            t += 4
+            v += 3
+            for size in symbol_sizes:
+                blocks.append((t, v, size, False))
+                t += size
+                v += size
+        for size in pair_sizes:
+            blocks.append((t, v, size, False))
+            t += size
+            v += size
+
+        # Find the block offsets in one pass
+        offsets = index_terms(fp, [block[0] for block in blocks] + [t], t)
+
+        # Read the symbol info and create LazyTables for all other blocks
+        scalars = {}
+        tables = {}
+        lattices = []
+        for b, (t, v, size, isinfo) in enumerate(blocks):
+            if isinfo:
+                fp.seek(offsets[b])
+                terms = fp.read(offsets[b + 1] - offsets[b]).split()
+                for i in range(3):
+                    scalars[v + i] = float(terms[i])
+                lattices.append(terms[3].decode())
+            else:
+                tables[(v, v + size)] = LazyTable(path, offsets[b], offsets[b + 1],
+                                                  size, mtime_ns)
+
+    info = dict(header=header, symbols=symbols, lattices=lattices, **grid)
+    return info, LazyValues(scalars, tables)
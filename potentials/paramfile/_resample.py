@@ -0,0 +1,67 @@
+# coding: utf-8
+# Standard libraries
+from typing import Tuple
+
+# https://scipy.org/
+from scipy.interpolate import CubicSpline
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+def resample_tables(x: npt.ArrayLike,
+                    newx: npt.ArrayLike,
+                    tables: dict) -> Tuple[dict, dict]:
+    """
+    Re-tabulates functions sharing the same tabulation points onto new
+    points.  All tables are stacked so that a single cubic spline is built
+    and evaluated for all of them at once.
+
+    The error of each new table is estimated by evaluating a cubic spline
+    of the new table at the old points within the range of the new points
+    and comparing with the old values.
+
+    Parameters
+    ----------
+    x : array-like
+        The old tabulation points.
+    newx : array-like
+        The new tabulation points.
+    tables : dict
+        The tabulated values at x, with any keys.
+
+    Returns
+    -------
+    newtables : dict
+        The tabulated values at newx, with the same keys as tables.
+    errors : dict
+        The maximum absolute error of each new table, with the same keys as
+        tables.
+    """
+    if len(tables) == 0:
+        return {}, {}
+    x = np.asarray(x)
+    newx = np.asarray(newx)
+    keys = list(tables.keys())
+    values = np.array([tables[key] for key in keys], dtype=float)
+
+    # Unchanged points keep the tables as they are
+    if np.array_equal(x, newx):
+        newtables = {key: values[i] for i, key in enumerate(keys)}
+        return newtables, {key: 0.0 for key in keys}
+
+    # Evaluate all tables at the new points
+    newvalues = CubicSpline(x, values, axis=1)(newx)
+    newvalues[np.abs(newvalues) <= 1e-100] = 0.0
+
+    # Compare splines of the new tables with the old values
+    inrange = (x >= newx[0]) & (x <= newx[-1])
+    if inrange.any():
+        check = CubicSpline(newx, newvalues, axis=1)(x[inrange])
+        errors = np.abs(check - values[:, inrange]).max(axis=1)
+    else:
+        errors = np.zeros(len(keys))
+
+    newtables = {key: newvalues[i] for i, key in enumerate(keys)}
+    errors = {key: float(errors[i]) for i, key in enumerate(keys)}
+    return newtables, errors
@@ -0,0 +1,530 @@
+# coding: utf-8
+# Standard libraries
+from contextlib import contextmanager
+import io
+from pathlib import Path
+from typing import Callable, Generator, Iterable, Optional, Tuple, Union
+import warnings
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+# Lookup table of ascii characters that cannot appear in numeric terms
+nonnumeric_chars = np.ones(256, dtype=bool)
+nonnumeric_chars[list(b'0123456789eE.+- \t\n\r\x0b\x0c')] = False
+
+# Lookup table of ascii whitespace characters
+whitespace_chars = np.zeros(256, dtype=bool)
+whitespace_chars[list(b' \t\n\r\x0b\x0c')] = True
+
+@contextmanager
+def open_input(f: Union[str, Path, io.IOBase]) -> Generator[io.IOBase, None, None]:
+    """
+    Handles the input source for the parameter file load methods.
+
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The parameter file to read in, either as a file path or as an open
+        file-like object.
+
+    Returns
+    -------
+    file-like object
+        The open file-like object.  Files opened from paths are closed after.
+    """
+    if hasattr(f, 'readline'):
+        yield f
+    else:
+        with open(f) as fp:
+            yield fp
+
+def read_lines(fp: io.IOBase, n: int) -> list:
+    """
+    Reads the header lines of a parameter file.
+
+    Parameters
+    ----------
+    fp : file-like object
+        The open file-like object to read from.
+    n : int
+        The number of lines to read.
+
+    Returns
+    -------
+    list
+        The n lines read.
+
+    Raises
+    ------
+    ValueError
+        If the file ends before n lines are read.
+    """
+    lines = []
+    for i in range(n):
+        line = fp.readline()
+        if line == '':
+            raise ValueError(f'Invalid potential file: fewer than {n} header lines')
+        lines.append(line)
+    return lines
+
+def read_setfl_header(fp: io.IOBase) -> Tuple[str, list, dict]:
+    """
+    Reads and checks lines 1-5 of a setfl parameter file.
+
+    Parameters
+    ----------
+    fp : file-like object
+        The open file-like object to read from.
+
+    Returns
+    -------
+    header : str
+        The comment lines 1-3.
+    symbols : list
+        The model symbols listed in line 4.
+    grid : dict
+        The numrho, deltarho, numr, deltar and cutoffr values from line 5.
+    """
+    lines = read_lines(fp, 5)
+
+    # Read lines 1-3 to header
+    header = ''.join(lines[:3]).strip()
+
+    # Read line 4 for symbols
+    terms = lines[3].split()
+    symbols = terms[1:]
+    try:
+        assert len(symbols) == int(terms[0])
+    except:
+        raise ValueError('Invalid potential file (line 4): inconsistent number of symbols')
+
+    # Read line 5 for numrho, deltarho, numr, deltar, and cutoffr
+    terms = lines[4].split()
+    try:
+        assert len(terms) == 5
+        grid = {
+            'numrho': int(terms[0]),
+            'deltarho': float(terms[1]),
+            'numr': int(terms[2]),
+            'deltar': float(terms[3]),
+            'cutoffr': float(terms[4]),
+        }
+        assert grid['numrho'] > 0 and grid['numr'] > 0
+    except:
+        raise ValueError('Invalid potential file (line 5): numrho, deltarho, numr, deltar, cutoffr')
+
+    return header, symbols, grid
+
+def find_strings(content: str,
+                 maxcount: int,
+                 chunksize: int = 2**20) -> Optional[list]:
+    """
+    Locates the whitespace-delimited terms in content that are not numbers.
+
+    Parameters
+    ----------
+    content : str
+        The content to search.
+    maxcount : int
+        The search stops once more than maxcount str terms are found.
+    chunksize : int, optional
+        The number of characters to scan at a time.  Default value is 2**20.
+
+    Returns
+    -------
+    list or None
+        The (start, end) character positions of each str term found.  None is
+        returned if content is not pure ascii.
+    """
+    # Scan content in chunks for characters that cannot be in numbers
+    positions = []
+    for offset in range(0, len(content), chunksize):
+        try:
+            chunk = content[offset:offset + chunksize].encode('ascii')
+        except UnicodeEncodeError:
+            return None
+        chars = np.frombuffer(chunk, dtype=np.uint8)
+        positions.extend((np.flatnonzero(nonnumeric_chars[chars]) + offset).tolist())
+
+    spans = []
+    end = 0
+    for i in positions:
+        if i < end:
+            continue
+
+        # Expand to the full term
+        start = i
+        while start > 0 and not content[start - 1].isspace():
+            start -= 1
+        end = i + 1
+        while end < len(content) and not content[end].isspace():
+            end += 1
+
+        # Skip nan and inf terms
+        try:
+            float(content[start:end])
+        except ValueError:
+            spans.append((start, end))
+            if len(spans) > maxcount:
+                break
+
+    return spans
+
+def count_terms(content: str,
+                chunksize: int = 2**20) -> int:
+    """
+    Counts the whitespace-delimited terms in content without splitting it.
+
+    Parameters
+    ----------
+    content : str
+        The content to count terms in.
+    chunksize : int, optional
+        The number of characters to scan at a time.  Default value is 2**20.
+
+    Returns
+    -------
+    int
+        The number of terms.
+    """
+    count = 0
+    prevspace = True
+    for offset in range(0, len(content), chunksize):
+        chunk = content[offset:offset + chunksize].encode('utf-8')
+        space = whitespace_chars[np.frombuffer(chunk, dtype=np.uint8)]
+
+        # Count positions where a term starts
+        count += int(np.count_nonzero(~space[1:] & space[:-1]))
+        if prevspace and not space[0]:
+            count += 1
+        prevspace = bool(space[-1])
+
+    return count
+
+def parse_terms(content: str,
+                first: int,
+                values: np.ndarray,
+                stringindices: list,
+                strings: list) -> int:
+    """
+    Parses the whitespace-delimited terms of one chunk of a parameter file.
+    Numeric terms are parsed directly into values, and str terms at
+    stringindices are appended to strings.
+
+    Parameters
+    ----------
+    content : str
+        The chunk content.  Must start and end at term boundaries.
+    first : int
+        The index of the chunk's first term in the whole file.
+    values : numpy.ndarray
+        The array of all numeric terms to fill.  Terms beyond its size are
+        only counted.
+    stringindices : list
+        The sorted term indices for str terms in the whole file.
+    strings : list
+        The str terms found so far, which is added to.
+
+    Returns
+    -------
+    int
+        The number of terms in content.
+    """
+    pending = stringindices[len(strings):]
+    c = first - len(strings)
+
+    # Find the str terms and parse the numeric sections before/between them
+    spans = find_strings(content, len(pending))
+    if spans is not None:
+        starts = [0] + [span[1] for span in spans]
+        ends = [span[0] for span in spans] + [len(content)]
+        sections = []
+        index = first
+        valid = True
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                text = content[start:end]
+
+                # fromstring gives [-1.] for whitespace-only content
+                if text == '' or text.isspace():
+                    section = np.empty(0)
+                else:
+                    try:
+                        section = np.fromstring(text, sep=' ')
+                    except (ValueError, DeprecationWarning):
+                        valid = False
+                        break
+                sections.append(section)
+                index += section.size
+                if i < len(spans):
+                    if i >= len(pending) or pending[i] != index:
+                        valid = False
+                        break
+                    index += 1
+
+        # Check that no str terms were expected among the numeric ones
+        if valid and len(pending) > len(spans) and pending[len(spans)] < index:
+            valid = False
+        if valid and c + index - first - len(spans) <= values.size:
+            for section in sections:
+                values[c:c + section.size] = section
+                c += section.size
+            strings.extend([content[start:end] for start, end in spans])
+            return index - first
+
+    # Fallback: split the chunk and parse str terms in order
+    terms = content.split()
+    isstring = np.isin(np.arange(first, first + len(terms)), pending)
+    strings.extend([terms[i] for i in np.flatnonzero(isstring)])
+    numeric = [term for term, s in zip(terms, isstring) if not s]
+    n = min(len(numeric), values.size - c)
+    values[c:c + n] = np.array(numeric[:n], dtype=float)
+    return len(terms)
+
+def read_values(fp: io.IOBase,
+                expected: int,
+                stringindices: Optional[list] = None,
+                chunksize: int = 2**22
+                ) -> Tuple[np.ndarray, list]:
+    """
+    Reads the remaining content of a parameter file as space-delimited terms.
+    The content is read in chunks, and the numeric terms of each chunk are
+    parsed directly into a single float array.  Only one chunk of text is
+    held in memory at a time, and the terms are never split into a list of
+    str terms first.
+
+    Parameters
+    ----------
+    fp : file-like object
+        The open file-like object to read from.
+    expected : int
+        The total number of terms expected, including the str terms.
+    stringindices : list, optional
+        The term indices for str terms, such as lattice types, that are
+        interspersed with the numeric terms.
+    chunksize : int, optional
+        The number of characters to read at a time.  Default value is 2**22.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        All numeric terms, i.e. the expected terms with the str terms
+        removed.
+    strings : list
+        The str terms found at stringindices.
+
+    Raises
+    ------
+    ValueError
+        If the number of terms is not the expected number.
+    """
+    if stringindices is None:
+        stringindices = []
+    stringindices = sorted(stringindices)
+    values = np.empty(expected - len(stringindices))
+    strings = []
+    found = 0
+
+    carry = ''
+    while True:
+        chunk = fp.read(chunksize)
+        content = carry + chunk
+        carry = ''
+
+        # Hold back any term split by the end of the chunk
+        if chunk != '':
+            end = len(content)
+            while end > 0 and not content[end - 1].isspace():
+                end -= 1
+            carry = content[end:]
+            content = content[:end]
+
+        found += parse_terms(content, found, values, stringindices, strings)
+        if chunk == '':
+            break
+
+    if found != expected or len(strings) != len(stringindices):
+        raise ValueError(f'Invalid number of tabulated values: {expected} expected, {found} found')
+    return values, strings
+
+def write_table(fp: io.IOBase,
+                vals: npt.ArrayLike,
+                xf: str = '%25.16e',
+                ncolumns: int = 5,
+                chunklines: int = 4096):
+    """
+    Writes tabulated values to an open file-like object with ncolumns values
+    per line.  Lines are formatted in chunks using a single c-style format
+    operation per chunk rather than one per value.
+
+    Parameters
+    ----------
+    fp : file-like object
+        The open file-like object to write to.
+    vals : array-like
+        The values to tabulate.  Multidimensional arrays are flattened.
+    xf : str, optional
+        The c-style formatter to use for floating point numbers.  Default value
+        is '%25.16e'.
+    ncolumns : int, optional
+        Indicates how many columns the tabulated values are split by.  Default
+        value is 5.
+    chunklines : int, optional
+        The number of full lines to format and write at a time.  Default value
+        is 4096.
+    """
+    vals = np.asarray(vals).ravel()
+    nlines, nextra = divmod(vals.size, ncolumns)
+
+    # Write full lines in chunks
+    linefmt = ' '.join([xf] * ncolumns) + '\n'
+    for start in range(0, nlines, chunklines):
+        end = min(start + chunklines, nlines)
+        chunk = vals[start * ncolumns:end * ncolumns].tolist()
+        fp.write((linefmt * (end - start)) % tuple(chunk))
+
+    # Write any remaining partial line
+    if nextra > 0:
+        linefmt = ' '.join([xf] * nextra) + '\n'
+        fp.write(linefmt % tuple(vals[nlines * ncolumns:].tolist()))
+
+def write_output(f: Union[str, Path, io.IOBase, None],
+                 writer: Callable[[io.IOBase], None]) -> Optional[str]:
+    """
+    Handles the output target for the parameter file build methods.
+
+    Parameters
+    ----------
+    f : str, path or file-like object
+        If given, the contents will be written to the file-like object or file
+        name given by a str.  If not given, the parameter file contents will
+        be returned as a str.
+    writer : function
+        Function that takes an open file-like object and writes the parameter
+        file contents to it.
+
+    Returns
+    -------
+    str
+        The parameter file contents (returned if f is not given).
+    """
+    if f is None:
+        fp = io.StringIO()
+        writer(fp)
+        return fp.getvalue()
+
+    elif isinstance(f, (str, Path)):
+        with open(f, 'w') as fp:
+            writer(fp)
+
+    elif hasattr(f, 'write'):
+        writer(f)
+
+    else:
+        raise TypeError('f must be a path or a file-like object')
+
+def write_setfl(fp: io.IOBase,
+                potential,
+                symbol_tables: Callable[[str], list],
+                pair_tables: Iterable[Callable],
+                xf: str = '%25.16e',
+                ncolumns: int = 5):
+    """
+    Writes setfl parameter file contents.  Shared by the eam/alloy, eam/fs and
+    adp formats, which only differ in which tables are listed for each symbol
+    and each symbol pair.
+
+    Parameters
+    ----------
+    fp : file-like object
+        The open file-like object to write to.
+    potential : EAMAlloy, EAMFS or ADP
+        The potential object to write.
+    symbol_tables : function
+        Takes a symbol and returns the list of tables to write after that
+        symbol's info line, e.g. F(rho) and rho(r).
+    pair_tables : list of functions
+        Each function takes a symbol pair and returns the associated table.
+        All unique symbol pairs are written for the first function, then for
+        the second function, etc.
+    xf : str, optional
+        The c-style formatter to use for floating point numbers.  Default value
+        is '%25.16e'.
+    ncolumns : int, optional
+        Indicates how many columns the tabulated values are split by.  Default
+        value is 5.
+    """
+    symbols = potential.symbols
+    nsymbols = len(symbols)
+
+    # Add header
+    header = potential.header.splitlines()
+    while len(header) < 3:
+        header.append('')
+    fp.write('\n'.join(header) + '\n')
+
+    # Add symbol header info
+    fp.write(' '.join([str(nsymbols)] + symbols) + '\n')
+
+    # Add r and rho header info
+    terms = (potential.numrho, potential.deltarho, potential.numr,
+             potential.deltar, potential.cutoffr)
+    fp.write(f'%i {xf} %i {xf} {xf}\n' % terms)
+
+    # Loop over symbols
+    for symbol in symbols:
+
+        # Add symbol header
+        info = potential.symbol_info(symbol)
+        terms = (info['number'], info['mass'], info['alat'], info['lattice'])
+        fp.write(f'%i {xf} {xf} %s\n' % terms)
+
+        # Tabulate per-symbol values
+        write_table(fp, np.hstack(symbol_tables(symbol)), xf=xf,
+                    ncolumns=ncolumns)
+
+    # Tabulate all pair values as one continuous block
+    vals = []
+    for pair_table in pair_tables:
+        for i in range(nsymbols):
+            for j in range(i+1):
+                vals.append(pair_table([symbols[i], symbols[j]]))
+    if len(vals) > 0:
+        write_table(fp, np.hstack(vals), xf=xf, ncolumns=ncolumns)
+
+def setfl_values(potential,
+                 symbol_tables: Callable[[str], list],
+                 pair_tables: Iterable[Callable]) -> np.ndarray:
+    """
+    Collects all numeric values of setfl parameter file contents, excluding
+    the grid values, in the order that write_setfl writes them.
+
+    Parameters
+    ----------
+    potential : EAMAlloy, EAMFS or ADP
+        The potential object.
+    symbol_tables : function
+        Takes a symbol and returns the list of tables listed after that
+        symbol's info line, e.g. F(rho) and rho(r).
+    pair_tables : list of functions
+        Each function takes a symbol pair and returns the associated table.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values.
+    """
+    symbols = potential.symbols
+    vals = []
+    for symbol in symbols:
+        info = potential.symbol_info(symbol)
+        vals.append([info['number'], info['mass'], info['alat']])
+        vals.extend(symbol_tables(symbol))
+    for pair_table in pair_tables:
+        for i in range(len(symbols)):
+            for j in range(i+1):
+                vals.append(pair_table([symbols[i], symbols[j]]))
+    return np.hstack(vals).astype(float)
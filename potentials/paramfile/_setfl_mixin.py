@@ -0,0 +1,303 @@
+# coding: utf-8
+# Standard libraries
+import io
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# https://numpy.org/
+import numpy as np
+
+# Local imports
+from ._setfl import (open_input, read_setfl_header, read_values,
+                     setfl_values, write_output, write_setfl)
+from ._binary import is_binary, read_binary, read_cached, write_binary
+from ._lazy import lazy_setfl
+from ._resample import resample_tables
+
+class SetflMixin():
+    """
+    Reading, writing and resampling shared by the setfl parameter file
+    classes EAMAlloy, EAMFS and ADP.  The classes only differ in which tables
+    are listed for each symbol and symbol pair, which they give with
+    _symbol_functions, _pair_functions and _tables.
+    """
+
+    # Tabulated functions of rho.  All other functions are of r.
+    _rho_functions = ('F_rho',)
+
+    # Pair functions listed for all unique symbol pairs after the symbol blocks
+    _pair_functions = ('rphi_r',)
+
+    def _symbol_functions(self,
+                          symbol: str,
+                          symbols: list) -> list:
+        """
+        Lists the functions tabulated after a symbol's info line as (name,
+        key) pairs, where key is the symbol or symbol pair to get and set the
+        function with.
+        """
+        raise NotImplementedError('Not implemented for this class')
+
+    def _tables(self) -> dict:
+        """Gives the dicts of tabulated values for each function name"""
+        raise NotImplementedError('Not implemented for this class')
+
+    def __symbol_tables(self, symbol: str) -> list:
+        """The tables listed after a symbol's info line"""
+        return [getattr(self, name)(key)
+                for name, key in self._symbol_functions(symbol, self.symbols)]
+
+    def __layout(self,
+                 symbols: list,
+                 grid: dict) -> Tuple[list, list]:
+        """Sizes of the tables listed for each symbol and of the pair tables"""
+        def size(name):
+            return grid['numrho'] if name in self._rho_functions else grid['numr']
+
+        if len(symbols) > 0:
+            symbol_sizes = [size(name) for name, key
+                            in self._symbol_functions(symbols[0], symbols)]
+        else:
+            symbol_sizes = []
+        numsets = sum(range(1, len(symbols)+1))
+        pair_sizes = [size(name) for name in self._pair_functions
+                      for i in range(numsets)]
+        return symbol_sizes, pair_sizes
+
+    def resample(self,
+                 numr: Optional[int] = None,
+                 numrho: Optional[int] = None,
+                 cutoffr: Optional[float] = None,
+                 cutoffrho: Optional[float] = None) -> dict:
+        """
+        Changes the r and/or rho values and re-tabulates all tabulated
+        functions on the new values in one pass per grid.  Functions set
+        with fxn are kept and evaluated at the new values when needed.
+
+        Parameters
+        ----------
+        numr : int, optional
+            The new number of r values.  If not given, numr is unchanged.
+        numrho : int, optional
+            The new number of rho values.  If not given, numrho is unchanged.
+        cutoffr : float, optional
+            The new cutoff r value.  If not given, cutoffr is unchanged.
+        cutoffrho : float, optional
+            The new cutoff rho value.  If not given, cutoffrho is unchanged.
+
+        Returns
+        -------
+        dict
+            The maximum absolute interpolation error of each re-tabulated
+            function, keyed by the function name and symbol string, e.g.
+            ('rphi_r', 'Al-Ni').  Errors are found by comparing splines of
+            the new tables with the old tables at the old values.
+        """
+        errors = {}
+
+        # Re-tabulate the r functions, then the rho functions
+        for grid, num, cutoff in [('r', numr, cutoffr), ('rho', numrho, cutoffrho)]:
+            if num is None and cutoff is None:
+                continue
+
+            # Take the tables before the grid changes
+            old_x = getattr(self, grid)
+            tables = {}
+            for name, table in self._tables().items():
+                if (name in self._rho_functions) == (grid == 'rho'):
+                    for key in list(table.keys()):
+                        tables[(name, key)] = table[key]
+                    table.clear()
+
+            if grid == 'r':
+                self.set_r(num=self.numr if num is None else num,
+                           cutoff=self.cutoffr if cutoff is None else cutoff)
+            else:
+                self.set_rho(num=self.numrho if num is None else num,
+                             cutoff=self.cutoffrho if cutoff is None else cutoff)
+
+            newtables, newerrors = resample_tables(old_x, getattr(self, grid), tables)
+            for (name, key), table in newtables.items():
+                if '-' in key:
+                    key = key.split('-')
+                getattr(self, f'set_{name}')(key, table=table)
+            errors.update(newerrors)
+
+        return errors
+
+    def load(self,
+             f: Union[str, Path, io.IOBase],
+             cache: bool = False,
+             validate: str = 'mtime',
+             lazy: bool = False):
+        """
+        Reads in a setfl file of the class's pair_style.  Paths ending in
+        '.npz' are read as binary parameter files created by save_binary().
+
+        Parameters
+        ----------
+        f : path-like object or file-like object
+            The parameter file to read in, either as a file path or as an open
+            file-like object.
+        cache : bool, optional
+            If True and f is a path, a binary copy of the parameter file is
+            saved next to it as f + '.npz' and used for later loads as long
+            as it matches the text file.  Default value is False.
+        validate : str, optional
+            How a binary copy is checked against the text file when cache is
+            True: 'mtime' (default) compares the modification times and
+            sizes, 'hash' compares the sizes and sha256 checksums.
+        lazy : bool, optional
+            If True, f must be a path to a text parameter file.  The file is
+            indexed in a single scan and each table is only read and parsed
+            when it is first accessed, which keeps memory use low when only
+            some of the tables of a large file are needed.  Default value is
+            False.
+        """
+        if is_binary(f):
+            info, values = read_binary(f, self.pair_style)
+        elif lazy:
+            info, values = lazy_setfl(f, self.__layout)
+        elif cache and isinstance(f, (str, Path)):
+            info, values = read_cached(f, self.pair_style, self.__parse,
+                                       validate=validate)
+        else:
+            with open_input(f) as fp:
+                info, values = self.__parse(fp)
+        self.__set_values(info, values)
+
+    def load_binary(self,
+                    f: Union[str, Path, io.IOBase],
+                    mmap: bool = False):
+        """
+        Reads in a binary parameter file created by save_binary().  The
+        tabulated functions are set as views of the file's values.
+
+        Parameters
+        ----------
+        f : path-like object or file-like object
+            The binary parameter file to read in.
+        mmap : bool, optional
+            If True, the values are memory-mapped rather than read into
+            memory.  Requires f to be a path.  Default value is False.
+        """
+        info, values = read_binary(f, self.pair_style, mmap=mmap)
+        self.__set_values(info, values)
+
+    def save_binary(self, f: Union[str, Path, io.IOBase]):
+        """
+        Saves the potential as a binary parameter file, which is an
+        uncompressed .npz file that can be read by load_binary() much
+        faster than the text format.
+
+        Parameters
+        ----------
+        f : path-like object or file-like object
+            The file to save to.
+        """
+        info = dict(header=self.header, symbols=self.symbols,
+                    lattices=[self.symbol_info(symbol)['lattice']
+                              for symbol in self.symbols],
+                    numrho=self.numrho, deltarho=self.deltarho,
+                    numr=self.numr, deltar=self.deltar, cutoffr=self.cutoffr)
+        pair_tables = [getattr(self, name) for name in self._pair_functions]
+        values = setfl_values(self, self.__symbol_tables, pair_tables)
+        write_binary(f, self.pair_style, info, values)
+
+    def __parse(self, fp: io.IOBase) -> Tuple[dict, np.ndarray]:
+        """Reads the text parameter file into the info and values to set"""
+        # Read lines 1-5 for header, symbols, and r and rho values
+        header, symbols, grid = read_setfl_header(fp)
+        nsymbols = len(symbols)
+        symbol_sizes, pair_sizes = self.__layout(symbols, grid)
+
+        # Determine expected number of terms and lattice term positions
+        blocksize = 4 + sum(symbol_sizes)
+        expected = nsymbols * blocksize + sum(pair_sizes)
+        lattice_indices = [i * blocksize + 3 for i in range(nsymbols)]
+
+        # Read remaining content as space-delimited terms
+        values, lattices = read_values(fp, expected, lattice_indices)
+
+        info = dict(header=header, symbols=symbols, lattices=lattices, **grid)
+        return info, values
+
+    def __set_values(self,
+                     info: dict,
+                     values: np.ndarray):
+        """Sets the header, symbols, grids and tables from parsed content"""
+        symbols = info['symbols']
+        nsymbols = len(symbols)
+        symbol_sizes, pair_sizes = self.__layout(symbols, info)
+
+        self.header = info['header']
+
+        # Set initial dummy symbols info (replaced later)
+        for symbol in symbols:
+            self.set_symbol_info(symbol, 0, 0.0, 0.0, 'NA')
+
+        self.set_r(num=info['numr'], cutoff=info['cutoffr'], delta=info['deltar'])
+        self.set_rho(num=info['numrho'], delta=info['deltarho'])
+
+        # Read per-symbol data
+        c = 0
+        for symbol, lattice in zip(symbols, info['lattices']):
+
+            # Read symbol info
+            number = int(values[c])
+            mass = float(values[c+1])
+            alat = float(values[c+2])
+            self.set_symbol_info(symbol, number, mass, alat, lattice)
+            c += 3
+
+            # Read the symbol's tables
+            functions = self._symbol_functions(symbol, symbols)
+            for (name, key), size in zip(functions, symbol_sizes):
+                getattr(self, f'set_{name}')(key, table=values[c:c + size])
+                c += size
+
+        # Iterate over unique symbol pairs for each pair function
+        sizes = iter(pair_sizes)
+        for name in self._pair_functions:
+            for i in range(nsymbols):
+                for j in range(0, i+1):
+                    symbolpair = [symbols[i], symbols[j]]
+                    size = next(sizes)
+                    getattr(self, f'set_{name}')(symbolpair, table=values[c:c + size])
+                    c += size
+
+    def build(self,
+              f: Union[str, Path, io.IOBase, None] = None,
+              xf: str = '%25.16e',
+              ncolumns: int = 5) -> Optional[str]:
+        """
+        Constructs a setfl parameter file of the class's pair_style.
+
+        Parameters
+        ----------
+        f : str or file-like object
+            If given, the contents will be written to the file-like object or file name given by a str.
+            If not given, the parameter file contents will be returned as a str.
+        xf : str, optional
+            The c-style formatter to use for floating point numbers.  Default value is '%25.16e'.
+        ncolumns : int, optional
+            Indicates how many columns the tabulated values are split by.  Default value is 5.
+
+        Returns
+        -------
+        str
+            The parameter file contents (returned if f is not given).
+        """
+
+        # Check that there is data to write
+        if len(self.symbols) == 0:
+            raise ValueError('No symbols set: no data to write')
+
+        pair_tables = [getattr(self, name) for name in self._pair_functions]
+
+        def writer(fp):
+            write_setfl(fp, self, self.__symbol_tables, pair_tables,
+                        xf=xf, ncolumns=ncolumns)
+
+        # Save or return
+        return write_output(f, writer)
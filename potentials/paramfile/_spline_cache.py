@@ -0,0 +1,97 @@
+# coding: utf-8
+# Standard libraries
+from typing import Iterator, Optional, Union
+
+# https://scipy.org/
+from scipy.interpolate import CubicSpline
+
+# https://numpy.org/
+import numpy.typing as npt
+
+class SplineCache():
+    """
+    Stores cubic splines of tabulated functions so that they are only built
+    the first time a function is evaluated at values other than the
+    tabulation points.  Entries are identified by the function name and the
+    symbol key, e.g. ('rphi_r', 'Al-Ni').
+    """
+    def __init__(self):
+        """Class initializer"""
+        self.__splines = {}
+
+    def __contains__(self, item: tuple) -> bool:
+        return item in self.__splines
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(list(self.__splines.keys()))
+
+    def __len__(self) -> int:
+        return len(self.__splines)
+
+    def __repr__(self) -> str:
+        return f'SplineCache({list(self.__splines.keys())})'
+
+    def keys(self) -> list:
+        """list : The (name, key) of each cached spline"""
+        return list(self.__splines.keys())
+
+    def get(self,
+            name: str,
+            key: Optional[str],
+            x: npt.ArrayLike,
+            table: npt.ArrayLike) -> CubicSpline:
+        """
+        Returns the cached spline for a tabulated function, building it first
+        if needed.
+
+        Parameters
+        ----------
+        name : str
+            The function name, e.g. 'F_rho'.
+        key : str or None
+            The symbol or symbol pair string the function is for.  None for
+            single symbol potentials.
+        x : array-like
+            The tabulation points.  Only used if the spline is built.
+        table : array-like
+            The tabulated function values.  Only used if the spline is built.
+
+        Returns
+        -------
+        scipy.interpolate.CubicSpline
+            The spline of the tabulated function.
+        """
+        try:
+            return self.__splines[(name, key)]
+        except KeyError:
+            spline = CubicSpline(x, table)
+            self.__splines[(name, key)] = spline
+            return spline
+
+    def invalidate(self,
+                   name: Union[str, list, None] = None,
+                   key: Optional[str] = None):
+        """
+        Removes cached splines.
+
+        Parameters
+        ----------
+        name : str or list, optional
+            The function name(s) to remove splines for.  If not given, splines
+            for all functions are removed.
+        key : str, optional
+            The symbol or symbol pair string to remove splines for.  If not
+            given, splines for all symbols are removed.
+        """
+        if isinstance(name, str):
+            name = [name]
+        for cachekey in list(self.__splines.keys()):
+            if name is not None and cachekey[0] not in name:
+                continue
+            if key is not None and cachekey[1] != key:
+                continue
+            del self.__splines[cachekey]
+
+    def clear(self):
+        """Removes all cached splines"""
+        self.__splines.clear()
@@ -110,13 +110,13 @@ def eam_to_eam_alloy(eam: Union[str, io.IOBase, EAM, list],
     for eam, symbol in zip(eams, symbols):
         
         # Check r values
-        if np.allclose(eam.r, alloy.r):
+        if eam.numr == alloy.numr and np.allclose(eam.r, alloy.r):
             r = None
         else:
             r = alloy.r
         
         # Check rho values
-        if np.allclose(eam.rho, alloy.rho):
+        if eam.numrho == alloy.numrho and np.allclose(eam.rho, alloy.rho):
             rho = None
         else:
             rho = alloy.rho
@@ -133,14 +133,16 @@ def eam_to_eam_alloy(eam: Union[str, io.IOBase, EAM, list],
         # Copy over elemental r*phi(r)
         alloy.set_rphi_r(symbol, table=eam.rphi_r(r=r))
         
-    # Calculate cross r*phi(r) values
-    for i in range(len(symbols)):
-        for j in range(i):
-            zi = eams[i].z_r(r=alloy.r)
-            zj = eams[j].z_r(r=alloy.r)
-            rphi_r = hartree * bohr * zi * zj
-            alloy.set_rphi_r([symbols[i], symbols[j]], table=rphi_r)
-            
+    # Evaluate each z(r) once on the alloy r grid
+    if len(eams) > 1:
+        z_r = np.array([eam.z_r(r=alloy.r) for eam in eams])
+
+        # Calculate all cross r*phi(r) values together
+        i, j = np.tril_indices(len(eams), -1)
+        rphi_r = hartree * bohr * z_r[i] * z_r[j]
+        for k in range(len(i)):
+            alloy.set_rphi_r([symbols[i[k]], symbols[j[k]]], table=rphi_r[k])
+
     return alloy
 
 def eam_alloy_to_eam_fs(alloy: EAMAlloy) -> EAMFS:
@@ -1,10 +1,13 @@
 # coding: utf-8
 # Standard libraries
 import io
+from pathlib import Path
 from typing import Optional, Union
 
 # Local imports
 from . import EAM, EAMAlloy, EAMFS, ADP
+from ._setfl import count_terms, open_input, read_setfl_header
+from ._binary import is_binary, read_info
 
 def load_eam(f: Union[str, io.IOBase],
              style: Optional[str] = None) -> Union[EAM, EAMAlloy, EAMFS, ADP]:
@@ -21,14 +24,23 @@ def load_eam(f: Union[str, io.IOBase],
         eam pair_style.  'eam/alloy' or 'alloy' will load setfl files for the
         LAMMPS eam/alloy pair_style.  'eam/fs' or 'fs' will load setfl files for
         the eam/fs pair_style.  'ap' will load setfl files for the adp pair_style.
-        If not given, will attempt to load the file using the different styles.
-        
+        If not given, the style will be identified with identify_eam_style().
+    
     Returns
     -------
     EAM, EAMAlloy, EAMFS or ADP
         The loaded parameter file content.
     """
     
+    # Identify style from the file's header and number of terms
+    if style is None:
+        if hasattr(f, 'readline'):
+            start = f.tell()
+            style = identify_eam_style(f)
+            f.seek(start)
+        else:
+            style = identify_eam_style(f)
+    
     # Shortcut to classes for known styles
     if style == 'eam':
         return EAM(f)
@@ -38,47 +50,90 @@ def load_eam(f: Union[str, io.IOBase],
         return EAMFS(f)
     elif style == 'adp':
         return ADP(f)
-    elif style is not None:
+    else:
         raise ValueError('Unknown style')
+
+def identify_eam_style(f: Union[str, Path, io.IOBase]) -> str:
+    """
+    Identifies the format of a LAMMPS-compatible EAM parameter file in a single
+    pass by checking the header lines and comparing the total number of
+    terms to the number each format expects.  The tabulated values are not
+    parsed.
     
-    # Check if f is a file
-    if hasattr(f, 'readlines'):
-        closefile = False
-    else:
-        f = open(f, encoding='UTF-8')
-        closefile = True
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The parameter file to check, either as a file path or as an open
+        file-like object.  Open files are read to the end.  Paths ending in
+        '.npz' are checked as binary parameter files.
     
-    def test_style(f, cls):
-        """Try loading as cls, reset f position if it fails"""
-        try:
-            obj = cls(f)
-        except:
-            f.seek(0)
-        else:
-            if closefile:
-                f.close()
-            return obj
+    Returns
+    -------
+    str
+        The matching style: 'eam', 'eam/alloy', 'eam/fs' or 'adp'.  Setfl
+        files with a single symbol are identical in the eam/alloy and eam/fs
+        formats and are identified as 'eam/alloy'.
+    
+    Raises
+    ------
+    ValueError
+        If the file matches none of the formats, or matches more than one.
+    """
+    # Binary parameter files list their pair_style
+    if is_binary(f):
+        return read_info(f)['pair_style']
+
+    with open_input(f) as fp:
+        lines = [fp.readline() for i in range(5)]
+        nterms = count_terms(fp.read())
     
-    # Test if eam
-    obj = test_style(f, EAM)
-    if obj is not None:
-        return obj
+    styles = []
     
-    # Test if eam/alloy
-    obj = test_style(f, EAMAlloy)
-    if obj is not None:
-        return obj
+    # Check funcfl format: lines 2 and 3 are header lines
+    try:
+        terms = lines[1].split()
+        assert len(terms) >= 4
+        int(terms[0])
+        float(terms[1])
+        float(terms[2])
+        terms = lines[2].split()
+        assert len(terms) == 5
+        numrho = int(terms[0])
+        numr = int(terms[2])
+        float(terms[1])
+        float(terms[3])
+        float(terms[4])
+    except:
+        pass
+    else:
+        count = nterms + len(lines[3].split()) + len(lines[4].split())
+        if count == numrho + 2 * numr:
+            styles.append('eam')
     
-    # Test if eam/fs
-    obj = test_style(f, EAMFS)
-    if obj is not None:
-        return obj
+    # Check setfl formats: lines 4 and 5 are header lines
+    try:
+        header, symbols, grid = read_setfl_header(io.StringIO(''.join(lines)))
+    except ValueError:
+        pass
+    else:
+        nsymbols = len(symbols)
+        numsets = sum(range(1, nsymbols+1))
+        numrho = grid['numrho']
+        numr = grid['numr']
+        expected = {
+            'eam/alloy': nsymbols * (4 + numrho + numr) + numsets * numr,
+            'eam/fs': nsymbols * (4 + numrho + nsymbols * numr) + numsets * numr,
+            'adp': nsymbols * (4 + numrho + numr) + 3 * numsets * numr,
+        }
+        if nsymbols == 1:
+            del expected['eam/fs']
+        for setflstyle, count in expected.items():
+            if nterms == count:
+                styles.append(setflstyle)
     
-    # Test if adp
-    obj = test_style(f, ADP)
-    if obj is not None:
-        return obj
-
-    if closefile:
-        f.close()
-    raise ValueError('Failed to load as any known style')    
\ No newline at end of file
+    if len(styles) == 0:
+        raise ValueError('Failed to load as any known style')
+    elif len(styles) > 1:
+        raise ValueError(f'Ambiguous parameter file: matches styles {styles}')
+    
+    return styles[0]
@@ -1,7 +1,10 @@
 # coding: utf-8
 # Standard Python libraries
+import hashlib
+import os
+import re
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 # https://requests.readthedocs.io/en/master/
 import requests
@@ -49,13 +52,85 @@ class Artifact(Record):
         self._add_value('str', 'url', modelpath='web-link.URL')
         self._add_value('longstr', 'label', modelpath='web-link.label')
         self._add_value('longstr', 'filename', modelpath='web-link.link-text')
+        self._add_value('str', 'sha256', modelpath='sha256')
+
+    def metadata(self) -> dict:
+        """
+        Generates a dict of simple metadata values associated with the record.
+        Useful for quickly comparing records and for building pandas.DataFrames
+        for multiple records of the same style.
+        """
+        meta = super().metadata()
+        
+        # Only include checksums that are set
+        if meta['sha256'] is None:
+            del meta['sha256']
+        
+        return meta
+
+    def file_sha256(self,
+                    targetdir: Union[str, Path]) -> Optional[str]:
+        """
+        Computes the SHA-256 checksum of the artifact's file in a directory.
+
+        Parameters
+        ----------
+        targetdir : path-like object
+            The directory containing the artifact file.
+
+        Returns
+        -------
+        str or None
+            The hex digest of the file's content, or None if the file does
+            not exist.
+        """
+        targetname = Path(targetdir, self.filename)
+        if not targetname.is_file():
+            return None
+        
+        hasher = hashlib.sha256()
+        with open(targetname, 'rb') as f:
+            for chunk in iter(lambda: f.read(2**20), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def verify(self,
+               targetdir: Union[str, Path]) -> bool:
+        """
+        Checks if the artifact's file in a directory matches the artifact's
+        recorded SHA-256 checksum.
+
+        Parameters
+        ----------
+        targetdir : path-like object
+            The directory containing the artifact file.
+
+        Returns
+        -------
+        bool
+            True if the file exists and matches the checksum.  False if the
+            file does not exist, does not match, or no checksum is recorded.
+        """
+        if self.sha256 is None:
+            return False
+        return self.file_sha256(targetdir) == self.sha256.lower()
 
     def download(self,
                  targetdir: Union[str, Path],
                  overwrite: bool = False,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 session: Optional[requests.Session] = None,
+                 timeout: Union[float, Tuple[float, float], None] = (10, 60),
+                 resume: bool = True,
+                 record_sha256: bool = False,
+                 chunksize: int = 2**16) -> bool:
         """
         Downloads the artifact from its URL to the given target directory.
+        The content is streamed in chunks to a partial file next to the
+        target that is only renamed to the target name once the download is
+        complete, so interrupted downloads never leave truncated files.
+        Each process writes to its own partial file, and an incomplete one is
+        left as "<filename>.part" for a later download to resume.
 
         Parameters
         ----------
@@ -63,41 +138,148 @@ class Artifact(Record):
             The directory where the artifact is downloaded to.
         overwrite : bool, optional
             If False (default), then the file will not be downloaded if
-            a similarly named file already exists in targetdir.
+            a similarly named file already exists in targetdir.  If True,
+            existing files are still not downloaded again if they match the
+            artifact's recorded sha256 checksum.
         verbose : bool, optional
             If True, info statements will be printed.  Default
             value is False.
+        session : requests.Session, optional
+            An open session to make the request with, allowing connections to
+            be reused across multiple downloads.  If not given, a single
+            request is made with requests.get().
+        timeout : float or tuple, optional
+            The requests timeout in seconds, either as a single value or as
+            (connect, read) values.  Default value is (10, 60).
+        resume : bool, optional
+            If True (default), a partial file left by an interrupted download
+            will be continued using an HTTP Range request if the server
+            supports it.  The download restarts from the beginning if the
+            server ignores the range or returns a different one.  If False,
+            the download always starts from the beginning.
+        record_sha256 : bool, optional
+            If True, the SHA-256 checksum of the downloaded content will be
+            set as the artifact's sha256 value.  This only changes the record
+            in memory: save or update the parent record in a database to keep
+            the checksum.  Default value is False.
+        chunksize : int, optional
+            The number of bytes to write at a time.  Default value is 2**16.
         
         Returns
         -------
         bool
             True if the file was downloaded, False otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the downloaded content does not match the artifact's recorded
+            sha256 checksum.
         """
         targetname = Path(targetdir, self.filename)
+        partname = Path(targetdir, self.filename + '.part')
+        workname = Path(targetdir, f'{self.filename}.{os.getpid()}.part')
         
-        # Check if targetname exists
-        if overwrite or not targetname.exists():
-            
-            # Get the URL
-            r = requests.get(self.url)
-            
+        # Skip files that already exist or are verified
+        if targetname.exists() and (not overwrite or self.verify(targetdir)):
+            if verbose:
+                print(f'{self.filename} already in {targetdir}')
+            return False
+
+        # Claim any partial download so that other processes do not write to it
+        if resume:
+            try:
+                os.replace(partname, workname)
+            except FileNotFoundError:
+                pass
+        
+        try:
+            return self.__download(targetdir, targetname, workname, resume,
+                                   verbose, session, timeout, record_sha256,
+                                   chunksize)
+        finally:
+            # Leave any incomplete content for a later download to resume
+            if workname.is_file():
+                os.replace(workname, partname)
+
+    def __download(self,
+                   targetdir: Path,
+                   targetname: Path,
+                   workname: Path,
+                   resume: bool,
+                   verbose: bool,
+                   session: Optional[requests.Session],
+                   timeout: Union[float, Tuple[float, float], None],
+                   record_sha256: bool,
+                   chunksize: int) -> bool:
+        """Streams the artifact's content to workname, then moves it to targetname"""
+
+        # Continue any partial download
+        hasher = hashlib.sha256()
+        headers = {}
+        offset = 0
+        if resume and workname.is_file():
+            with open(workname, 'rb') as f:
+                for chunk in iter(lambda: f.read(2**20), b''):
+                    hasher.update(chunk)
+            offset = workname.stat().st_size
+            headers['Range'] = f'bytes={offset}-'
+        
+        # Get the URL
+        if session is None:
+            r = requests.get(self.url, headers=headers, stream=True,
+                             timeout=timeout)
+        else:
+            r = session.get(self.url, headers=headers, stream=True,
+                            timeout=timeout)
+        
+        with r:
             # Print message if URL does not exist
             if r.status_code == 404:
                 print(f'File URL not found: {self.url}')
                 return False
             
+            # Restart if the range is invalid or does not start at the offset
+            if r.status_code == 416 or (r.status_code == 206 and
+                                        _range_start(r) != offset):
+                workname.unlink()
+                return self.__download(targetdir, targetname, workname, False,
+                                       verbose, session, timeout,
+                                       record_sha256, chunksize)
+            
+            # Restart if the server ignores the range
+            if r.status_code != 206:
+                hasher = hashlib.sha256()
+                mode = 'wb'
             else:
-                # Raise any other request errors
-                r.raise_for_status()
-
-                # Save downloaded content
-                with open(targetname, 'wb') as f:
-                    f.write(r.content)
-                if verbose:
-                    print(f'{self.filename} downloaded to {targetdir}')
-                return True
-        else:
-            # Skip files that already exist
-            if verbose:
-                print(f'{self.filename} already in {targetdir}')
-            return False
+                mode = 'ab'
+            
+            # Raise any other request errors
+            r.raise_for_status()
+
+            # Stream downloaded content to the partial file
+            with open(workname, mode) as f:
+                for chunk in r.iter_content(chunk_size=chunksize):
+                    f.write(chunk)
+                    hasher.update(chunk)
+        
+        # Check content against the recorded checksum
+        checksum = hasher.hexdigest()
+        if self.sha256 is not None and checksum != self.sha256.lower():
+            workname.unlink()
+            raise ValueError(f'sha256 checksum mismatch for {self.url}')
+        if record_sha256:
+            self.sha256 = checksum
+
+        # Move the completed file to the target name
+        os.replace(workname, targetname)
+        if verbose:
+            print(f'{self.filename} downloaded to {targetdir}')
+        return True
+
+def _range_start(r) -> Optional[int]:
+    """Returns the first byte position of a partial response's Content-Range"""
+    match = re.match(r'bytes\s+(\d+)-', r.headers.get('Content-Range', ''))
+    if match is None:
+        return None
+    return int(match.group(1))
@@ -21,6 +21,8 @@ from yabadaba.tools import dict_insert
 # local imports
 from ..tools import aslist, atomic_mass
 from .Artifact import Artifact
+from ._download import download_artifacts
+from ._pair_info import CompiledPairInfo
 from .AtomInfo import AtomInfo
 from .CommandLine import CommandLine, PairCoeffLine
 
@@ -599,7 +601,11 @@ class PotentialLAMMPS(Record):
     def download_files(self,
                        pot_dir: Optional[str] = None,
                        overwrite: bool = False,
-                       verbose: bool = False) -> Tuple[int, int]:
+                       verbose: bool = False,
+                       max_workers: int = 4,
+                       session = None,
+                       cache = None,
+                       staging: str = 'copy') -> Tuple[int, int]:
         """
         Downloads all artifact files associated with the potential.  The files
         will be saved to the pot_dir directory.
@@ -617,6 +623,20 @@ class PotentialLAMMPS(Record):
         verbose : bool, optional
             If True, info statements will be printed.  Default
             value is False.
+        max_workers : int, optional
+            The maximum number of files to download at the same time.  Default
+            value is 4.
+        session : requests.Session, optional
+            An open session to use for the downloads.  If not given, a new
+            session is created and closed after.
+        cache : ArtifactCache, optional
+            If given, the files are downloaded once into this shared cache
+            and staged to pot_dir from there.  Processes sharing the cache
+            wait for each other instead of downloading the same files.
+        staging : str, optional
+            How files are placed in pot_dir from the cache: 'copy' (default),
+            'symlink', 'hardlink' or 'reflink'.  Ignored if cache is not
+            given.
         
         Returns
         -------
@@ -635,13 +655,33 @@ class PotentialLAMMPS(Record):
             if not Path(self.pot_dir).is_dir():
                 Path(self.pot_dir).mkdir(parents=True)
 
-            for artifact in self.artifacts:
-                success = artifact.download(self.pot_dir, overwrite=overwrite,
-                                            verbose=verbose)
-                if success:
-                    num_downloaded += 1
-                else:
-                    num_skipped += 1
+            # Stage files from the cache, downloading them into it if needed
+            if cache is not None:
+                for artifact in self.artifacts:
+                    if (Path(self.pot_dir, artifact.filename).exists()
+                        and (not overwrite or artifact.verify(self.pot_dir))):
+                        if verbose:
+                            print(f'{artifact.filename} already in {self.pot_dir}')
+                        num_skipped += 1
+                    elif cache.stage(artifact, self.pot_dir, staging,
+                                     session=session, verbose=verbose) is None:
+                        num_skipped += 1
+                    else:
+                        num_downloaded += 1
+                return num_downloaded, num_skipped
+
+            tasks = [(artifact, self.pot_dir) for artifact in self.artifacts]
+            summary = download_artifacts(tasks, overwrite=overwrite,
+                                         verbose=verbose,
+                                         max_workers=max_workers,
+                                         session=session)
+            
+            # Raise the first error after all other downloads finish
+            if len(summary['failed']) > 0:
+                raise summary['failed'][0][1]
+            
+            num_downloaded = summary['downloaded']
+            num_skipped = summary['skipped']
 
         return num_downloaded, num_skipped
         
@@ -877,6 +917,38 @@ class PotentialLAMMPS(Record):
 
         return info
 
+    def compile_pair_info(self,
+                          pot_dir: Optional[str] = None,
+                          prompt: bool = False,
+                          maxsize: Optional[int] = 4096) -> CompiledPairInfo:
+        """
+        Builds a precomputed form of the record for generating pair_info,
+        pair_data_info and pair_restart_info many times.  The generated
+        content is identical to this record's methods and is cached for each
+        combination of symbols, masses, pot_dir and comments.  The compiled
+        form does not see later changes to the record.
+
+        Parameters
+        ----------
+        pot_dir : str, optional
+            The default directory containing the potential's files.  If not
+            given, the current pot_dir is used.
+        prompt : bool, optional
+            If True, then a screen prompt will appear for radioactive elements
+            with no standard mass to ask for the isotope to use. If False
+            (default), then the most stable isotope will be automatically used.
+        maxsize : int or None, optional
+            The maximum number of generated pair_info strings to keep.  None
+            sets no limit.  Default value is 4096.
+
+        Returns
+        -------
+        CompiledPairInfo
+            The compiled form.
+        """
+        return CompiledPairInfo(self, pot_dir=pot_dir, prompt=prompt,
+                                maxsize=maxsize)
+
     def get_file(self,
                  filename: Union[str, Path],
                  localroot: Union[str, Path, None] = None):
@@ -1,5 +1,6 @@
 # coding: utf-8
 # Standard Python libraries
+import copy
 import io
 from pathlib import Path
 from typing import Optional, Tuple, Union
@@ -438,6 +439,44 @@ class PotentialLAMMPSKIM(Record):
 
 
 
+    def copy_potential(self,
+                       id: Optional[str] = None,
+                       potkey: Optional[str] = None) -> 'PotentialLAMMPSKIM':
+        """
+        Creates a shallow copy of the record that shares the already loaded
+        model content, but has its own id and selected potential.  This is
+        much faster than reloading or deep copying the record when building
+        entries for multiple KIM ids or potentials.  The copy gets its own
+        atoms and dois lists for the selected potential.  All other values,
+        e.g. url, status, potentials and fullkimids, are shared with the
+        original, so setting or modifying them changes all copies.
+
+        Parameters
+        ----------
+        id : str, optional
+            The full KIM model id to set for the copy.  If not given, the id
+            is unchanged.
+        potkey : str, optional
+            Specifies which potential (by potkey value) the copy selects.  If
+            not given, the selected potential is unchanged.
+
+        Returns
+        -------
+        PotentialLAMMPSKIM
+            The shallow copy.
+        """
+        record = copy.copy(self)
+        if id is not None:
+            record.id = id
+        if potkey is not None:
+            record.select_potential(potkey=potkey)
+        
+        # Separate the selected potential's lists from the shared PotentialInfo
+        record.__atoms = list(record.__atoms)
+        if record.__dois is not None:
+            record.__dois = list(record.__dois)
+        return record
+
     def normalize_symbols(self,
                           symbols: Union[str, list]) -> list:
         """
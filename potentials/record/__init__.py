@@ -5,6 +5,9 @@ __all__.sort()
 
 from yabadaba.record import Record, load_record, recordmanager
 
+# Register the local Value styles used by the Record styles
+from .. import value
+
 # Add the modular Record styles
 recordmanager.import_style('Citation', '.Citation', __name__)
 recordmanager.import_style('Potential', '.Potential', __name__)
@@ -0,0 +1,162 @@
+# coding: utf-8
+# Standard Python libraries
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import threading
+import time
+from typing import Iterable, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+# https://requests.readthedocs.io/en/master/
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def new_session(pool_size: int = 8,
+                retries: int = 3,
+                backoff: float = 0.5) -> requests.Session:
+    """
+    Creates a requests Session for downloading artifacts.  Connections are
+    kept alive and reused between requests, and failed connections or
+    temporary server errors are retried with exponential backoff.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        The number of connections to keep open for each host.  Default value
+        is 8.
+    retries : int, optional
+        The number of times a failed request is retried.  Default value is 3.
+    backoff : float, optional
+        The backoff factor for retries: the nth retry waits
+        backoff * 2**(n-1) seconds.  Default value is 0.5.
+
+    Returns
+    -------
+    requests.Session
+        The new session.
+    """
+    retry = Retry(total=retries, backoff_factor=backoff,
+                  status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=['HEAD', 'GET'])
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def download_artifacts(tasks: Iterable[Tuple['Artifact', Union[str, Path]]],
+                       overwrite: bool = False,
+                       verbose: bool = False,
+                       max_workers: int = 8,
+                       max_per_host: int = 4,
+                       retries: int = 3,
+                       backoff: float = 0.5,
+                       session: Optional[requests.Session] = None,
+                       timeout: Union[float, Tuple[float, float], None] = (10, 60),
+                       record_sha256: bool = False) -> dict:
+    """
+    Downloads multiple artifacts concurrently using a pool of worker threads
+    that share one requests Session.
+
+    Parameters
+    ----------
+    tasks : iterable
+        (artifact, targetdir) pairs giving each Artifact to download and the
+        directory to download it to.
+    overwrite : bool, optional
+        If False (default), then files will not be downloaded if similarly
+        named files already exist in their targetdir.
+    verbose : bool, optional
+        If True, a progress message will be printed for each artifact as it
+        finishes along with a final summary.  Default value is False.
+    max_workers : int, optional
+        The maximum number of artifacts to download at the same time.  Default
+        value is 8.
+    max_per_host : int, optional
+        The maximum number of artifacts to download at the same time from any
+        one host.  Default value is 4.
+    retries : int, optional
+        The number of times a failed request is retried.  Only used if session
+        is not given.  Default value is 3.
+    backoff : float, optional
+        The retry backoff factor.  Only used if session is not given.  Default
+        value is 0.5.
+    session : requests.Session, optional
+        The session to use for the downloads.  If not given, a new session is
+        created with new_session() and closed after.
+    timeout : float or tuple, optional
+        The requests timeout in seconds for each download, either as a single
+        value or as (connect, read) values.  Default value is (10, 60).
+    record_sha256 : bool, optional
+        If True, the SHA-256 checksum of each downloaded file will be saved to
+        its artifact's sha256 value.  Default value is False.
+
+    Returns
+    -------
+    dict
+        Summary of the downloads with keys 'downloaded' and 'skipped' giving
+        the number of artifacts downloaded and not downloaded, 'failed' giving
+        a list of (artifact, exception) pairs for downloads that raised errors,
+        and 'time' giving the total time in seconds.
+    """
+    tasks = list(tasks)
+    summary = {'downloaded': 0, 'skipped': 0, 'failed': [], 'time': 0.0}
+    if len(tasks) == 0:
+        return summary
+    start = time.perf_counter()
+
+    # Build a shared session if needed
+    if session is None:
+        pool_size = max(max_workers, max_per_host)
+        thesession = new_session(pool_size=pool_size, retries=retries,
+                                 backoff=backoff)
+    else:
+        thesession = session
+
+    # Limit the number of concurrent requests made to each host
+    host_limits = {}
+    for artifact, targetdir in tasks:
+        host = urlparse(artifact.url).netloc
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(max_per_host)
+
+    def fetch(artifact, targetdir):
+        with host_limits[urlparse(artifact.url).netloc]:
+            return artifact.download(targetdir, overwrite=overwrite,
+                                     session=thesession, timeout=timeout,
+                                     record_sha256=record_sha256)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, artifact, targetdir): (artifact, targetdir)
+                       for artifact, targetdir in tasks}
+
+            for i, future in enumerate(as_completed(futures)):
+                artifact, targetdir = futures[future]
+                try:
+                    success = future.result()
+                except Exception as err:
+                    summary['failed'].append((artifact, err))
+                    status = f'failed ({err})'
+                else:
+                    if success:
+                        summary['downloaded'] += 1
+                        status = f'downloaded to {targetdir}'
+                    else:
+                        summary['skipped'] += 1
+                        status = 'skipped'
+                if verbose:
+                    print(f'[{i+1}/{len(tasks)}] {artifact.filename} {status}',
+                          flush=True)
+    finally:
+        if session is None:
+            thesession.close()
+
+    summary['time'] = time.perf_counter() - start
+    if verbose:
+        print(f"{summary['downloaded']} downloaded, {summary['skipped']} skipped,",
+              f"{len(summary['failed'])} failed in {summary['time']:.1f} seconds")
+
+    return summary
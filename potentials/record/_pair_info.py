@@ -0,0 +1,325 @@
+# coding: utf-8
+# Standard Python libraries
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+# local imports
+from ..tools import aslist, atomic_mass
+
+class CompiledPairInfo():
+    """
+    Precomputed form of a PotentialLAMMPS record for generating its LAMMPS
+    command lines many times.  The comment prints, default masses and the
+    pot_dir-dependent pair_style and extra command lines are built once, and
+    the generated pair_info for each (symbols, masses, pot_dir, comments)
+    combination is kept in an LRU cache.
+
+    The compiled form is a snapshot: create a new one if the record changes.
+    """
+    def __init__(self,
+                 potential,
+                 pot_dir: Optional[str] = None,
+                 prompt: bool = False,
+                 maxsize: Optional[int] = 4096):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        potential : PotentialLAMMPS
+            The record to compile.
+        pot_dir : str, optional
+            The default directory containing the potential's files.  If not
+            given, the record's pot_dir is used.
+        prompt : bool, optional
+            If True, then a screen prompt will appear for radioactive elements
+            with no standard mass to ask for the isotope to use. If False
+            (default), then the most stable isotope will be automatically used.
+        maxsize : int or None, optional
+            The maximum number of generated pair_info strings to keep.  None
+            sets no limit.  Default value is 4096.
+        """
+        if pot_dir is None:
+            pot_dir = potential.pot_dir
+        self.__pot_dir = str(pot_dir)
+
+        self.__symbols = tuple(potential.symbols)
+        self.__allsymbols = bool(potential.allsymbols)
+        self.__masses = dict(zip(self.__symbols,
+                                 potential.masses(list(self.__symbols), prompt=prompt)))
+        self.__units = potential.units
+        self.__atom_style = potential.atom_style
+        self.__print_comments = potential.print_comments
+
+        self.__pair_style = potential.pair_style
+        self.__pair_style_terms = potential.pair_style_terms
+        self.__pair_coeffs = list(potential.pair_coeffs)
+        self.__commands = list(potential.commands)
+
+        self.__pot_dir_lines = lru_cache(maxsize=maxsize)(self.__build_pot_dir_lines)
+        self.__cached_pair_info = lru_cache(maxsize=maxsize)(self.__build_pair_info)
+
+    @property
+    def symbols(self) -> tuple:
+        """tuple : All atom-model symbols."""
+        return self.__symbols
+
+    @property
+    def pot_dir(self) -> str:
+        """str : The default directory containing the potential's files."""
+        return self.__pot_dir
+
+    def cache_info(self):
+        """Returns the hits, misses, maxsize and currsize of the pair_info cache."""
+        return self.__cached_pair_info.cache_info()
+
+    def cache_clear(self):
+        """Removes all generated pair_info strings from the cache."""
+        self.__cached_pair_info.cache_clear()
+        self.__pot_dir_lines.cache_clear()
+
+    def normalize(self,
+                  symbols: Union[str, list, None] = None,
+                  masses: Union[float, list, None] = None
+                  ) -> Tuple[Tuple[str, ...], tuple]:
+        """
+        Normalizes symbols and fills in the default masses in the same way
+        as PotentialLAMMPS.pair_info.
+
+        Parameters
+        ----------
+        symbols : str or list, optional
+            List of atom-model symbols corresponding to the atom types in a
+            system.  If None (default), then all atom-model symbols will
+            be included in the order that they are listed in the data model.
+        masses : float or list, optional
+            Can be given to override the default symbol-based masses for each
+            atom type.  Must be a list of the same length as symbols.  Any
+            values of None in the list indicate that the default value be used
+            for that atom type.
+
+        Returns
+        -------
+        symbols : tuple
+            The normalized symbols.
+        masses : tuple
+            The mass of each atom type.
+        """
+        # Use all symbols if symbols is None
+        if symbols is None:
+            symbols = list(self.__symbols)
+        else:
+            symbols = aslist(symbols)
+
+        # Check length of given masses
+        if masses is not None:
+            masses = aslist(masses)
+            assert len(masses) == len(symbols), 'supplied masses must be same length as symbols'
+        else:
+            masses = []
+
+        # Normalize symbols
+        for symbol in symbols:
+            assert symbol is not None, 'symbols list incomplete: found None value'
+        if self.__allsymbols:
+            for symbol in self.__symbols:
+                if symbol not in symbols:
+                    symbols.append(symbol)
+
+        # Change None mass values to default values
+        masses = masses + [None] * (len(symbols) - len(masses))
+        for i in range(len(masses)):
+            if masses[i] is None:
+                try:
+                    masses[i] = self.__masses[symbols[i]]
+                except KeyError:
+                    raise ValueError(f'{symbols[i]} is not in the list')
+
+        return tuple(symbols), tuple(masses)
+
+    def pair_info(self,
+                  symbols: Union[str, list, None] = None,
+                  masses: Union[float, list, None] = None,
+                  pot_dir: Optional[str] = None,
+                  comments: bool = True) -> str:
+        """
+        Generates the LAMMPS input command lines associated with the Potential
+        and a list of atom-model symbols.
+
+        Parameters
+        ----------
+        symbols : str or list, optional
+            List of atom-model symbols corresponding to the atom types in a
+            system.  If None (default), then all atom-model symbols will
+            be included in the order that they are listed in the data model.
+        masses : float or list, optional
+            Can be given to override the default symbol-based masses for each
+            atom type.  Must be a list of the same length as symbols.  Any
+            values of None in the list indicate that the default value be used
+            for that atom type.
+        pot_dir : str, optional
+            The directory containing the potential's files.  If not given, the
+            compiled default is used.
+        comments : bool, optional
+            Indicates if print command lines detailing information on the potential
+            are to be included.  Default value is True.
+
+        Returns
+        -------
+        str
+            The LAMMPS input command lines that specifies the potential.
+        """
+        symbols, masses = self.normalize(symbols, masses)
+        if pot_dir is None:
+            pot_dir = self.__pot_dir
+        return self.__cached_pair_info(symbols, masses, str(pot_dir), bool(comments))
+
+    def pair_data_info(self,
+                       filename: Union[str, Path],
+                       pbc: npt.ArrayLike,
+                       symbols: Union[str, list, None] = None,
+                       masses: Union[float, list, None] = None,
+                       atom_style: Optional[str] = None,
+                       units: Optional[str] = None,
+                       pot_dir: Optional[str] = None,
+                       comments: bool = True) -> str:
+        """
+        Generates the LAMMPS command lines associated with both a potential
+        and reading an atom data file.
+
+        Parameters
+        ----------
+        filename : path-like object
+            The file path to the atom data file for LAMMPS to read in.
+        pbc : array-like object
+            The three boolean periodic boundary conditions.
+        symbols : str or list, optional
+            List of atom-model symbols corresponding to the atom types in a
+            system.  If None (default), then all atom-model symbols will
+            be included in the order that they are listed in the data model.
+        masses : float or list, optional
+            Can be given to override the default symbol-based masses for each
+            atom type.
+        atom_style : str, optional
+            The LAMMPS atom_style setting to use for the output.  If not given,
+            will use the default value set for the potential.
+        units : str, optional
+            The LAMMPS unit setting to use for the output.  If not given,
+            will use the default value set for the potential.
+        pot_dir : str, optional
+            The directory containing the potential's files.  If not given, the
+            compiled default is used.
+        comments : bool, optional
+            Indicates if print command lines detailing information on the potential
+            are to be included.  Default value is True.
+
+        Returns
+        -------
+        str
+            The LAMMPS input command lines that specifies the potential and a data
+            file to read.
+        """
+        if units is None:
+            units = self.__units
+        if atom_style is None:
+            atom_style = self.__atom_style
+
+        # Add units and atom_style values
+        info = f'units {units}\n'
+        info += f'atom_style {atom_style}\n\n'
+
+        # Set boundary flags to p or m based on pbc values
+        bflags = np.array(['m','m','m'])
+        bflags[pbc] = 'p'
+        info += f'boundary {bflags[0]} {bflags[1]} {bflags[2]}\n'
+
+        # Set read_data command
+        if isinstance(filename, str):
+            info += f'read_data {filename}\n'
+
+        # Set pair_info
+        info += '\n'
+        info += self.pair_info(symbols=symbols, masses=masses, pot_dir=pot_dir,
+                               comments=comments)
+
+        return info
+
+    def pair_restart_info(self,
+                          filename: Union[str, Path],
+                          symbols: Union[str, list, None] = None,
+                          masses: Union[float, list, None] = None,
+                          pot_dir: Optional[str] = None,
+                          comments: bool = True) -> str:
+        """
+        Generates the LAMMPS command lines associated with both a potential
+        and reading a restart file.
+
+        Parameters
+        ----------
+        filename : path-like object
+            The file path to the restart file for LAMMPS to read in.
+        symbols : str or list, optional
+            List of atom-model symbols corresponding to the atom types in a
+            system.  If None (default), then all atom-model symbols will
+            be included in the order that they are listed in the data model.
+        masses : float or list, optional
+            Can be given to override the default symbol-based masses for each
+            atom type.
+        pot_dir : str, optional
+            The directory containing the potential's files.  If not given, the
+            compiled default is used.
+        comments : bool, optional
+            Indicates if print command lines detailing information on the potential
+            are to be included.  Default value is True.
+
+        Returns
+        -------
+        str
+            The LAMMPS input command lines that specifies the potential and a restart
+            file to read.
+        """
+        info = '# Script prepared using atomman Python package\n\n'
+        info += f'read_restart {filename}\n'
+        info += '\n'
+        info += self.pair_info(symbols=symbols, masses=masses, pot_dir=pot_dir,
+                               comments=comments)
+
+        return info
+
+    def __build_pot_dir_lines(self, pot_dir: str) -> Tuple[str, str]:
+        """Builds the pair_style line and the extra command lines for a pot_dir"""
+        pair_style = f'pair_style {self.__pair_style} {self.__pair_style_terms.build_command(pot_dir)}'
+        commands = ''
+        for command_line in self.__commands:
+            commands += command_line.build_command(pot_dir)
+        return pair_style, commands
+
+    def __build_pair_info(self,
+                          symbols: tuple,
+                          masses: tuple,
+                          pot_dir: str,
+                          comments: bool) -> str:
+        """Builds pair_info content for normalized values"""
+        pair_style, commands = self.__pot_dir_lines(pot_dir)
+        symbols = list(symbols)
+        is_eam = self.__pair_style == 'eam'
+
+        lines = []
+        if comments:
+            lines.append(self.__print_comments)
+            lines.append('\n')
+        lines.append(pair_style)
+        for pair_coeff in self.__pair_coeffs:
+            lines.append(pair_coeff.build_command(pot_dir, symbols, is_eam=is_eam))
+        lines.append('\n')
+        for i, mass in enumerate(masses):
+            lines.append(f'mass {i+1} {mass}\n')
+        lines.append('\n')
+        lines.append(commands)
+
+        return ''.join(lines)
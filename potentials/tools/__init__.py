@@ -1,12 +1,37 @@
-# coding: utf-8
-from yabadaba.tools import aslist, iaslist, screen_input
-from DataModelDict import uber_open_rmode
-from .atomic_info import *
-from .atomic_info import __all__ as atomic_info_all
-from .parse_authors import parse_authors
-from .numderivative import numderivative
-
-__all__ = ['aslist', 'iaslist', 'screen_input', 'uber_open_rmode', 'parse_authors',
-           'numderivative']
-__all__.extend(atomic_info_all)
-__all__.sort()
\ No newline at end of file
+# coding: utf-8
+# Standard Python libraries
+from importlib import import_module
+
+from .parse_authors import parse_authors
+from .numderivative import numderivative
+
+# Tools from other packages and the atomic info functions are only imported
+# when first accessed.  Values are the (module, attribute) to import.
+_lazy_attributes = {
+    'aslist': ('yabadaba.tools', 'aslist'),
+    'iaslist': ('yabadaba.tools', 'iaslist'),
+    'screen_input': ('yabadaba.tools', 'screen_input'),
+    'uber_open_rmode': ('DataModelDict', 'uber_open_rmode'),
+    'atomic_number': ('.atomic_info', 'atomic_number'),
+    'atomic_symbol': ('.atomic_info', 'atomic_symbol'),
+    'atomic_mass': ('.atomic_info', 'atomic_mass'),
+    'atomic_masses': ('.atomic_info', 'atomic_masses'),
+}
+
+def __getattr__(name: str):
+    try:
+        modulename, attribute = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(modulename, __name__), attribute)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_lazy_attributes))
+
+__all__ = ['aslist', 'iaslist', 'screen_input', 'uber_open_rmode', 'parse_authors',
+           'numderivative', 'atomic_number', 'atomic_symbol', 'atomic_mass',
+           'atomic_masses']
+__all__.sort()
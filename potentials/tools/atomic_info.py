@@ -9,24 +9,28 @@ import numpy as np
 # https://pandas.pydata.org/
 import pandas as pd
 
-__all__ = ['atomic_number', 'atomic_symbol', 'atomic_mass']
+__all__ = ['atomic_number', 'atomic_symbol', 'atomic_mass', 'atomic_masses']
 class AtomicInfo():
     
     def __init__(self):
         """Class initializer"""
-
-        # atomicdata.csv contains the data processed by the load method from
-        # https://www.nist.gov/pml/atomic-weights-and-isotopic-compositions-relative-atomic-masses
-        # with last update date January 2015
-        if hasattr(resources, 'files'):
-            ftext = resources.files('potentials.tools').joinpath('atomicdata.csv').open('r', encoding='UTF-8')
-        else:
-            ftext = resources.open_text('potentials.tools', 'atomicdata.csv', encoding='UTF-8')
-        self.__data = pd.read_csv(ftext)
+        # The data is read and indexed when first needed
+        self.__data = None
+        self.__numbers = None
     
     @property
     def data(self) -> pd.DataFrame:
         """pandas.DataFrame: Tabulated atomic and ionic data"""
+        if self.__data is None:
+
+            # atomicdata.csv contains the data processed by the load method from
+            # https://www.nist.gov/pml/atomic-weights-and-isotopic-compositions-relative-atomic-masses
+            # with last update date January 2015
+            if hasattr(resources, 'files'):
+                ftext = resources.files('potentials.tools').joinpath('atomicdata.csv').open('r', encoding='UTF-8')
+            else:
+                ftext = resources.open_text('potentials.tools', 'atomicdata.csv', encoding='UTF-8')
+            self.__data = pd.read_csv(ftext)
         return self.__data
     
     @property
@@ -89,6 +93,73 @@ class AtomicInfo():
         data['Mass Number'] = data.apply(make_int, args=['Mass Number'], axis=1)
         
         self.__data = data
+        self.__build_index()
+
+    def __build_index(self):
+        """
+        Builds the lookup tables used by the methods from data so that each
+        lookup is a dict access rather than a search of data.
+        """
+        # symbol -> atomic number and atomic number -> symbol of first rows
+        self.__numbers = {}
+        self.__symbols = {}
+
+        # symbol -> standard atomic weight (None if not set) of first rows
+        self.__weights = {}
+
+        # symbol -> list of mass numbers
+        self.__isotopes = {}
+
+        # (symbol, mass number) -> relative atomic mass (None if not unique)
+        self.__masses = {}
+
+        for symbol, number, mass_number, mass, weight in zip(
+                self.data['Atomic Symbol'].tolist(),
+                self.data['Atomic Number'].tolist(),
+                self.data['Mass Number'].tolist(),
+                self.data['Relative Atomic Mass'].tolist(),
+                self.data['Standard Atomic Weight'].tolist()):
+            number = int(number)
+            mass_number = int(mass_number)
+
+            if symbol not in self.__numbers:
+                self.__numbers[symbol] = number
+                self.__weights[symbol] = self.__parse_weight(weight)
+                self.__isotopes[symbol] = []
+            if number not in self.__symbols:
+                self.__symbols[number] = symbol
+
+            self.__isotopes[symbol].append(mass_number)
+            if (symbol, mass_number) in self.__masses:
+                self.__masses[(symbol, mass_number)] = None
+            else:
+                self.__masses[(symbol, mass_number)] = mass
+
+    @staticmethod
+    def __parse_weight(weight: Union[str, float]) -> Optional[float]:
+        """Converts a standard atomic weight value to a float or None if not set"""
+        if isinstance(weight, float):
+            if pd.notna(weight):
+                return weight
+            return None
+        elif '[' in weight:
+            bounds = weight.strip('[]').split(',')
+            return float(np.mean([float(bound) for bound in bounds]))
+        elif '(' in weight:
+            return float(weight.split('(')[0])
+        elif weight != '':
+            return float(weight)
+        return None
+
+    @staticmethod
+    def __parse_mass(mass: Union[str, float]) -> float:
+        """Converts a relative atomic mass value to a float"""
+        if isinstance(mass, float):
+            return mass
+        elif '(' in mass:
+            return float(mass.split('(')[0])
+        else:
+            raise ValueError('Mass value format not recognized!!!!!!!!!!')
 
     @property
     def most_stable_isotope(self) -> dict:
@@ -145,14 +216,16 @@ class AtomicInfo():
             The corresponding atomic number.
         """
         
+        if self.__numbers is None:
+            self.__build_index()
+
         # Handle old systematic named symbols
         if atomic_symbol in self.renames:
             atomic_symbol = self.renames[atomic_symbol]
         
-        matches = self.data[self.data['Atomic Symbol'] == atomic_symbol]
-        if len(matches) > 0:
-            return matches.iloc[0]['Atomic Number']
-        else:
+        try:
+            return self.__numbers[atomic_symbol]
+        except KeyError:
             raise ValueError(f'No matches for atomic symbol {atomic_symbol} found')
     
     def atomic_symbol(self, atomic_number: int) -> str:
@@ -174,10 +247,12 @@ class AtomicInfo():
         IndexError
             If no matches for the atomic number are found.
         """
-        matches = self.data[self.data['Atomic Number'] == atomic_number]
-        if len(matches) > 0:
-            return matches.iloc[0]['Atomic Symbol']
-        else:
+        if self.__numbers is None:
+            self.__build_index()
+
+        try:
+            return self.__symbols[atomic_number]
+        except KeyError:
             raise IndexError(f'No matches for atomic number {atomic_number} found')
     
     def atomic_mass(self,
@@ -210,6 +285,8 @@ class AtomicInfo():
         ValueError
             For invalid input values or combinations of values.
         """
+        if self.__numbers is None:
+            self.__build_index()
 
         # Try converting atomic_info to an int - fetch atomic_symbol if needed
         try:
@@ -235,27 +312,19 @@ class AtomicInfo():
         
         # Check if there is a standard atomic weight for an element
         if mass_number is None:
-            matches = self.data[self.data['Atomic Symbol'] == atomic_symbol]
-            weight = matches.iloc[0]['Standard Atomic Weight']
-            if isinstance(weight, float):
-                if pd.notna(weight):
-                    return weight
-            elif '[' in weight:
-                return np.array(eval(weight)).mean()
-            elif '(' in weight:
-                return float(weight.split('(')[0])
-            elif weight != '':
-                return float(weight)
-            elif len(matches) == 0:
+            if atomic_symbol not in self.__weights:
                 raise ValueError(f'No matches for atomic symbol {atomic_symbol} found')
+            weight = self.__weights[atomic_symbol]
+            if weight is not None:
+                return weight
         
             # Return isotope mass if only one isotope
-            if len(matches) == 1:
-                return float(matches.iloc[0]['Relative Atomic Mass'].split('(')[0])
+            isotopes = self.__isotopes[atomic_symbol]
+            if len(isotopes) == 1:
+                return self.__parse_mass(self.__masses[(atomic_symbol, isotopes[0])])
             
             if prompt:
                 print(f'No standard atomic weight for {atomic_symbol}.')
-                isotopes = matches['Mass Number'].to_list()
                 print(f'Please select an isotope from {isotopes}:')
                 mass_number = input()
             else:
@@ -265,22 +334,41 @@ class AtomicInfo():
         mass_number = int(mass_number)
                       
         # Find relative atomic mass
-        matches = self.data[(self.data['Atomic Symbol'] == atomic_symbol) 
-                           &(self.data['Mass Number'] == mass_number)]
-        
-        if len(matches) == 1:
-            mass = matches.iloc[0]['Relative Atomic Mass']
-            if isinstance(mass, float):
-                return mass
-            elif '(' in mass:
-                return float(mass.split('(')[0])
-            else:
-                raise ValueError('Mass value format not recognized!!!!!!!!!!')
-
-        elif len(matches) == 0:
+        try:
+            mass = self.__masses[(atomic_symbol, mass_number)]
+        except KeyError:
             raise ValueError(f'No matches for atomic symbol {atomic_symbol} and mass number {mass_number} found')
-        else:
+        if mass is None:
             raise ValueError('Multiple matches found!!!')
+        return self.__parse_mass(mass)
+
+    def atomic_masses(self,
+                      atomic_info: list,
+                      prompt: bool = False) -> np.ndarray:
+        """
+        Returns the atomic masses for a list of elements/isotopes.  Each
+        unique value is only looked up once.
+
+        Parameters
+        ----------
+        atomic_info : list
+            The atomic symbols or numbers identifying the elements/isotopes.
+            Isotopes are given as symbol-mass number, e.g. 'U-235'.
+        prompt : bool, optional
+            If True, then a screen prompt will appear for radioactive elements
+            with no standard mass to ask for the isotope to use. If False
+            (default), then the most stable isotope will be automatically used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The atomic masses in the same order as atomic_info.
+        """
+        masses = {}
+        for info in atomic_info:
+            if info not in masses:
+                masses[info] = self.atomic_mass(info, prompt=prompt)
+        return np.array([masses[info] for info in atomic_info], dtype=float)
         
     def __handle_hydrogen(self,
                           atomic_symbol: str,
@@ -332,4 +420,5 @@ class AtomicInfo():
 atomicinfo = AtomicInfo()
 atomic_number = atomicinfo.atomic_number
 atomic_symbol = atomicinfo.atomic_symbol
-atomic_mass = atomicinfo.atomic_mass
\ No newline at end of file
+atomic_mass = atomicinfo.atomic_mass
+atomic_masses = atomicinfo.atomic_masses
\ No newline at end of file
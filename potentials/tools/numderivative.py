@@ -1,50 +1,128 @@
 # coding: utf-8
 # Standard Python libraries
+from math import factorial
 from typing import Tuple
 
 # https://numpy.org/
 import numpy as np
 import numpy.typing as npt
 
+def central_weights(n: int,
+                    accuracy: int = 2) -> np.ndarray:
+    """
+    Computes the finite difference weights for the central difference
+    approximation of an nth derivative.
+
+    Parameters
+    ----------
+    n : int
+        The derivative order.
+    accuracy : int, optional
+        The order of accuracy of the approximation.  Must be a positive even
+        number.  Default value is 2.
+
+    Returns
+    -------
+    np.NDArray
+        The 2p+1 weights for the values at offsets -p to p from the point
+        that the derivative is evaluated at, to be divided by deltax**n.
+    """
+    if n < 0:
+        raise ValueError('n must be >=0')
+    if accuracy < 2 or accuracy % 2 != 0:
+        raise ValueError('accuracy must be a positive even number')
+    if n == 0:
+        return np.ones(1)
+
+    # Solve sum(w_j * j**k) = k! delta(k, n) for k = 0..2p
+    p = (n + 1) // 2 - 1 + accuracy // 2
+    offsets = np.arange(-p, p + 1)
+    a = offsets[np.newaxis, :] ** np.arange(2 * p + 1)[:, np.newaxis]
+    b = np.zeros(2 * p + 1)
+    b[n] = factorial(n)
+    return np.linalg.solve(a.astype(float), b)
+
 def numderivative(x: npt.ArrayLike,
                   y: npt.ArrayLike,
-                  n: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+                  n: int = 1,
+                  method: str = 'forward',
+                  accuracy: int = 2,
+                  stack: bool = False) -> Tuple[np.ndarray, np.ndarray]:
     """
     Computes the numerical derivative for a tabulated function.
-    
+
     Parameters
     ----------
-    x : array-like 
+    x : array-like
         Coordinates where the function is tabulated.  Needs to be equally
         spaced for the derivatives to be correct.
     y : array-like
-        Function evaluations at the x coordinates.
+        Function evaluations at the x coordinates.  Multiple functions can
+        be given as a 2D array with one function per row.
     n : int, optional
         The number of times the derivative of y is computed.
-    
+    method : str, optional
+        'forward' (default) uses repeated forward differences, which places
+        each derivative halfway between the previous coordinates.  'central'
+        uses central differences evaluated at the given coordinates.
+    accuracy : int, optional
+        The order of accuracy of the central differences.  Must be a positive
+        even number.  Default value is 2.  Only used by the 'central' method.
+    stack : bool, optional
+        If True, the derivatives 0 to n are all computed and returned as a
+        stacked array.  Requires the 'central' method.  Default value is
+        False.
+
     Returns
     -------
     newx : np.NDArray
-        Updated coordinates with N-n values. The coordinates are shifted with each
-        derivative to correspond to the halfway point between previous coordinates.
+        Updated coordinates.  For the 'forward' method, N-n values shifted to
+        the halfway point between previous coordinates for each derivative.
+        For the 'central' method, the N-2p given coordinates where the widest
+        stencil of 2p+1 points fits.
     newy : np.NDArray
-        N-n values for the nth derivative of y.
+        The values for the nth derivative of y at newx.  If stack is True, the
+        values for derivatives 0 to n are stacked along a new first axis.
     """
     x = np.asarray(x)
     y = np.asarray(y)
-    
-    if n == 0:
+    if n < 0:
+        raise ValueError('n must be >=0')
+    if n == 0 and not stack:
         # Return data as given
         return x, y
-    
-    elif n > 0:
-        # Compute the numerical derivative
-        deltax = x[1] - x[0]
-        newx = x[:-1] + deltax / 2
-        newy = (y[1:] - y[:-1]) / deltax
-        
-        # Iterate until n=0
-        return numderivative(newx, newy, n=n-1)
-    
+    deltax = x[1] - x[0]
+
+    if method == 'forward':
+        if stack:
+            raise ValueError("stack requires the 'central' method")
+
+        # Apply nth order forward differences at once
+        newx = x[:len(x) - n] + n * deltax / 2
+        newy = np.diff(y, n=n, axis=-1) / deltax**n
+        return newx, newy
+
+    elif method == 'central':
+        orders = range(n + 1) if stack else [n]
+        weights = [central_weights(m, accuracy) for m in orders]
+        pmax = (len(weights[-1]) - 1) // 2
+        if len(x) <= 2 * pmax:
+            raise ValueError('too few values for the central difference stencil')
+        newx = x[pmax:len(x) - pmax]
+
+        # Sum the weighted shifted values of each nonzero stencil weight
+        newys = []
+        for m, w in zip(orders, weights):
+            p = (len(w) - 1) // 2
+            newy = np.zeros(y.shape[:-1] + newx.shape)
+            for j in np.flatnonzero(w):
+                start = pmax - p + j
+                newy += w[j] * y[..., start:start + len(newx)]
+            newys.append(newy / deltax**m)
+
+        if stack:
+            return newx, np.stack(newys)
+        return newx, newys[0]
+
     else:
-        raise ValueError('n must be >=0')
\ No newline at end of file
+        raise ValueError("method must be 'forward' or 'central'")
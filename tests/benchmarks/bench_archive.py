@@ -0,0 +1,64 @@
+# coding: utf-8
+"""
+Benchmark comparing reading the last member of a gzipped tar archive with
+tarfile.extractfile against reading it from a zip archive built by
+build_archive.
+
+Usage: python bench_archive.py [numfiles] [filesize]
+"""
+# Standard libraries
+from io import BytesIO
+from pathlib import Path
+import sys
+import tarfile
+import tempfile
+import time
+
+# https://numpy.org/
+import numpy as np
+
+# Local imports
+from potentials.Database._archive import ArtifactArchive, build_archive
+
+def best(fxn, repeats=5):
+    """Returns the best time of repeated calls to fxn"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        fxn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    numfiles = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    filesize = int(sys.argv[2]) if len(sys.argv) > 2 else 5000000
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        folder = Path(tmpdir, 'pot')
+        folder.mkdir()
+        for i in range(numfiles):
+            table = rng.random(filesize // 25)
+            np.savetxt(folder / f'file{i}.txt', table, fmt='%.18e')
+        tardata = build_archive(tmpdir, 'pot', 'tar')
+        zipdata = build_archive(tmpdir, 'pot', 'zip')
+        member = f'pot/file{numfiles - 1}.txt'
+        dest = Path(tmpdir, 'out.txt')
+        print(f'{numfiles} files of ~{filesize} bytes: tar.gz {len(tardata)} bytes, zip {len(zipdata)} bytes')
+
+        def tar_extractfile():
+            tar = tarfile.open(fileobj=BytesIO(tardata))
+            fr = tar.extractfile(member)
+            with open(dest, 'wb') as fw:
+                fw.write(fr.read())
+            tar.close()
+
+        def zip_extract():
+            with ArtifactArchive(zipdata) as archive:
+                archive.extract(member, dest)
+
+        print(f'tar.extractfile: {best(tar_extractfile):.4f} s')
+        print(f'zip ArtifactArchive.extract: {best(zip_extract):.4f} s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# coding: utf-8
+"""
+Benchmark comparing the vectorized setfl loader against the previous
+token-based loader, the binary .npz format and lazy loading of a single
+pair table on a synthetic 8-element eam/alloy parameter file.
+
+Usage: python bench_eam_load.py [numr/numrho] [repeats]
+"""
+# Standard libraries
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+import tracemalloc
+
+# https://numpy.org/
+import numpy as np
+
+# Local imports
+from potentials.paramfile import EAMAlloy
+
+symbols = ['Al', 'Co', 'Cr', 'Cu', 'Fe', 'Mn', 'Ni', 'Ti']
+
+def build_file(path: Path, num: int):
+    """Builds a synthetic 8-element eam/alloy parameter file"""
+    rng = np.random.default_rng(42)
+    pot = EAMAlloy(header='synthetic benchmark potential', symbol=symbols,
+                   number=list(range(1, len(symbols)+1)),
+                   mass=list(rng.uniform(10, 100, len(symbols))),
+                   alat=list(rng.uniform(3, 4, len(symbols))),
+                   lattice=['fcc'] * len(symbols),
+                   numr=num, cutoffr=6.0, numrho=num, deltarho=0.01)
+    for symbol in symbols:
+        pot.set_F_rho(symbol, table=rng.normal(size=num))
+        pot.set_rho_r(symbol, table=rng.normal(size=num))
+    for i in range(len(symbols)):
+        for j in range(i+1):
+            pot.set_rphi_r([symbols[i], symbols[j]], table=rng.normal(size=num))
+    pot.build(path)
+
+def legacy_load(path: Path):
+    """The previous loader: readlines, join, split, then array per table"""
+    with open(path) as fp:
+        lines = fp.readlines()
+    nsymbols = int(lines[3].split()[0])
+    terms = lines[4].split()
+    numrho = int(terms[0])
+    numr = int(terms[2])
+    terms = ' '.join(lines[5:]).split()
+    tables = []
+    c = 0
+    for i in range(nsymbols):
+        tables.append(np.array(terms[c+4:c+4+numrho], dtype=float))
+        tables.append(np.array(terms[c+4+numrho:c+4+numrho+numr], dtype=float))
+        c += 4 + numrho + numr
+    for i in range(nsymbols * (nsymbols + 1) // 2):
+        tables.append(np.array(terms[c:c+numr], dtype=float))
+        c += numr
+    return tables
+
+def measure(fxn, path: Path, repeats: int):
+    """Returns best time and peak traced memory for fxn(path)"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        fxn(path)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fxn(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+def main():
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, 'synthetic.eam.alloy')
+        build_file(path, num)
+        size = path.stat().st_size / 1024**2
+        print(f'{len(symbols)} symbols, numr = numrho = {num}, {size:.1f} MB')
+
+        binpath = Path(tmpdir, 'synthetic.eam.alloy.npz')
+        EAMAlloy(path).save_binary(binpath)
+
+        def load_binary(path, mmap=False):
+            pot = EAMAlloy()
+            pot.load_binary(binpath, mmap=mmap)
+            return pot
+
+        def lazy_pair(path):
+            pot = EAMAlloy()
+            pot.load(path, lazy=True)
+            pot.rphi_r(['Al', 'Ni'])
+            return pot
+
+        for name, fxn in [('legacy', legacy_load), ('EAMAlloy.load', EAMAlloy),
+                          ('load_binary', load_binary),
+                          ('mmap', lambda path: load_binary(path, mmap=True)),
+                          ('lazy one pair', lazy_pair)]:
+            best, peak = measure(fxn, path, repeats)
+            print(f'{name:>14}: {best:8.3f} s, peak memory {peak / 1024**2:8.1f} MB')
+
+if __name__ == '__main__':
+    main()
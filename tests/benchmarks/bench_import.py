@@ -0,0 +1,36 @@
+# coding: utf-8
+"""
+Benchmark of the time to import parts of the package, each measured in new
+interpreters.
+
+Usage: python bench_import.py [repeats]
+"""
+# Standard libraries
+import subprocess
+import sys
+import time
+
+statements = [
+    'pass',
+    'import potentials',
+    'from potentials.record.PotentialLAMMPS import PotentialLAMMPS',
+    'from potentials.paramfile import EAMAlloy',
+    'import potentials; potentials.paramfile',
+]
+
+def best(statement: str, repeats: int) -> float:
+    """Returns the best wall time of running the statement in new interpreters"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    for statement in statements:
+        print(f'{best(statement, repeats):6.3f} s  {statement}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# coding: utf-8
+"""
+Benchmark comparing numderivative against the previous recursive forward
+difference implementation, and timing stacked central differences, on a
+large table.
+
+Usage: python bench_numderivative.py [num] [n]
+"""
+# Standard libraries
+import sys
+import time
+
+# https://numpy.org/
+import numpy as np
+
+# Local imports
+from potentials.tools import numderivative
+
+def legacy_numderivative(x, y, n=1):
+    """The previous recursive forward difference implementation"""
+    if n == 0:
+        return x, y
+    deltax = x[1] - x[0]
+    return legacy_numderivative(x[:-1] + deltax / 2, (y[1:] - y[:-1]) / deltax, n=n-1)
+
+def best(fxn, repeats=5):
+    """Returns the best time of repeated calls to fxn"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        fxn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    x = np.linspace(0, 10, num)
+    y = np.sin(x)
+    print(f'{num} values, n = {n}')
+
+    timings = [
+        ('legacy forward', lambda: legacy_numderivative(x, y, n=n)),
+        ('forward', lambda: numderivative(x, y, n=n)),
+        ('central', lambda: numderivative(x, y, n=n, method='central')),
+        ('central 0..n', lambda: numderivative(x, y, n=n, method='central', stack=True)),
+    ]
+    for name, fxn in timings:
+        print(f'{name:>15}: {best(fxn) * 1000:8.2f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# coding: utf-8
+"""
+Benchmark comparing the vectorized Tersoff parameter table construction and
+text formatting against the previous loop-based versions for 2 to 10
+element model symbols.
+
+Usage: python bench_tersoff.py [repeats]
+"""
+# Standard libraries
+import sys
+import time
+
+# https://numpy.org/
+import numpy as np
+
+# Local imports
+from potentials.paramfile.Tersoff import Tersoff
+
+symbols = ['Si', 'C', 'Ge', 'Sn', 'B', 'N', 'Al', 'Ga', 'In', 'P']
+
+def legacy_symbols_list(symbols: list):
+    """The previous triplet generation using triple loops"""
+    e1 = []
+    e2 = []
+    e3 = []
+    for i in range(len(symbols)):
+        for j in range(len(symbols)):
+            for k in range(len(symbols)):
+                e1.append(symbols[i])
+                e2.append(symbols[j])
+                e3.append(symbols[k])
+    return e1, e2, e3
+
+def legacy_text(params) -> str:
+    """The previous text formatting using per-cell loc lookups"""
+    lines = ['' for i in range(len(params)+1)]
+    first = True
+    for key in params.keys():
+        l = 3
+        if first:
+            v = '#' + key
+            first = False
+        else:
+            v = key
+        vals = [v]
+        if len(v) > l:
+            l = len(v)
+        for i in params.index:
+            v = str(params.loc[i, key])
+            vals.append(v)
+            if len(v) > l:
+                l = len(v)
+        for i in range(len(lines)):
+            lines[i] += f'{vals[i]:{l}} '
+    return '\n'.join(lines)
+
+def build(n: int) -> Tersoff:
+    """Builds a tersoff/zbl object with random parameters for n symbols"""
+    rng = np.random.default_rng(42)
+    pot = Tersoff(symbols[:n], pair_style='tersoff/zbl')
+    for key in pot.params.keys()[3:]:
+        if pot.params[key].dtype.kind == 'f':
+            pot.params[key] = rng.uniform(0.1, 1000, len(pot.params))
+    return pot
+
+def best_time(fxn, repeats: int) -> float:
+    """Returns the best time for calling fxn()"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        fxn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f'{"n":>2} {"rows":>5} {"legacy triplets":>16} {"triplets":>10} '
+          f'{"legacy text":>12} {"text":>10}')
+    for n in range(2, 11):
+        pot = build(n)
+        assert legacy_text(pot.params) == pot.text()
+
+        t1 = best_time(lambda: legacy_symbols_list(symbols[:n]), repeats)
+        t2 = best_time(pot._Tersoff__iter_symbols_list, repeats)
+        t3 = best_time(lambda: legacy_text(pot.params), repeats)
+        t4 = best_time(pot.text, repeats)
+        print(f'{n:>2} {len(pot.params):>5} {t1:15.5f}s {t2:9.5f}s '
+              f'{t3:11.4f}s {t4:9.4f}s')
+
+if __name__ == '__main__':
+    main()
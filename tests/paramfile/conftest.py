@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from potentials.paramfile import EAM, EAMFS, ADP
+
+# Symbol values used by the setfl potentials
+symbol_values = {
+    'Al': dict(number=13, mass=26.98, alat=4.05, lattice='fcc'),
+    'Ni': dict(number=28, mass=58.69, alat=3.52, lattice='fcc'),
+}
+
+def build(cls, symbols=('Al', 'Ni'), tables='random', numr=31, cutoffr=5.0,
+          numrho=21, deltarho=0.1):
+    """
+    Builds an EAM-style potential with tables for the given class.  tables
+    sets the table values: 'random' gives reproducible random values, 'smooth'
+    gives smooth functions of r and rho that are scaled for each symbol, and
+    'ones' gives constant values.
+    """
+    rng = np.random.default_rng(1)
+
+    def table(name, x, i=0):
+        if tables == 'random':
+            return rng.normal(size=len(x))
+        if tables == 'ones':
+            return np.ones(len(x))
+        if tables == 'smooth':
+            return {'F_rho': -np.sqrt(x + 1) * (i + 1),
+                    'rho_r': np.exp(-2 * x) * (i + 1),
+                    'z_r': np.exp(-x),
+                    'rphi_r': np.exp(-x) * np.cos(x),
+                    'u_r': np.exp(-3 * x),
+                    'w_r': np.sin(x)}[name]
+        raise ValueError(f'Invalid tables {tables}')
+
+    grid = dict(numr=numr, cutoffr=cutoffr, numrho=numrho, deltarho=deltarho)
+    if cls is EAM:
+        pot = EAM(header='funcfl', **symbol_values['Al'], **grid)
+        pot.set_F_rho(table=table('F_rho', pot.rho))
+        pot.set_z_r(table=table('z_r', pot.r))
+        pot.set_rho_r(table=table('rho_r', pot.r))
+        return pot
+
+    symbols = list(symbols)
+    values = {key: [symbol_values[s][key] for s in symbols]
+              for key in ['number', 'mass', 'alat', 'lattice']}
+    pot = cls(header='setfl', symbol=symbols, **values, **grid)
+    for i, s1 in enumerate(symbols):
+        pot.set_F_rho(s1, table=table('F_rho', pot.rho, i))
+        if cls is EAMFS:
+            for s2 in symbols:
+                pot.set_rho_r([s1, s2], table=table('rho_r', pot.r, i))
+        else:
+            pot.set_rho_r(s1, table=table('rho_r', pot.r, i))
+        for s2 in symbols:
+            pot.set_rphi_r([s1, s2], table=table('rphi_r', pot.r))
+            if cls is ADP:
+                pot.set_u_r([s1, s2], table=table('u_r', pot.r))
+                pot.set_w_r([s1, s2], table=table('w_r', pot.r))
+    return pot
+
+@pytest.fixture
+def build_potential():
+    """Gives the function that builds test potentials: see build"""
+    return build
@@ -0,0 +1,118 @@
+import io
+import os
+
+import numpy as np
+import pytest
+
+from potentials.paramfile import EAM, EAMAlloy, EAMFS, ADP, load_eam
+from potentials.paramfile._binary import read_binary
+
+@pytest.mark.parametrize('cls', [EAM, EAMAlloy, EAMFS, ADP])
+def test_binary_roundtrip(tmp_path, build_potential, cls):
+    pot = build_potential(cls, ['Al', 'Ni'])
+    text = pot.build()
+    fname = tmp_path / 'pot.npz'
+    pot.save_binary(fname)
+
+    # Binary files load directly, by extension and with load_eam
+    pot2 = cls()
+    pot2.load_binary(fname)
+    assert pot2.build() == text
+    assert cls(fname).build() == text
+    assert load_eam(fname).build() == text
+
+    # Memory-mapped values are shared by the tables
+    pot3 = cls()
+    pot3.load_binary(fname, mmap=True)
+    assert pot3.build() == text
+
+    # Styles must match
+    wrong = EAMAlloy if cls is not EAMAlloy else EAM
+    with pytest.raises(ValueError):
+        wrong().load_binary(fname)
+
+def test_sidecar_cache(tmp_path, build_potential):
+    fname = tmp_path / 'AlNi.eam.alloy'
+    pot = build_potential(EAMAlloy, ['Al', 'Ni'])
+    pot.build(fname)
+    text = fname.read_text()
+    cache = tmp_path / 'AlNi.eam.alloy.npz'
+
+    pot = EAMAlloy()
+    pot.load(fname, cache=True)
+    assert cache.is_file()
+    assert pot.build() == text
+
+    # Valid caches are used
+    mtime = cache.stat().st_mtime_ns
+    pot = EAMAlloy()
+    pot.load(fname, cache=True)
+    assert cache.stat().st_mtime_ns == mtime
+    assert pot.build() == text
+
+    # Caches are only checksummed when hash validation is used
+    assert 'sha256' not in read_binary(cache, 'eam/alloy')[0]['source']
+    pot = EAMAlloy()
+    pot.load(fname, cache=True, validate='hash')
+    assert 'sha256' in read_binary(cache, 'eam/alloy')[0]['source']
+    mtime = cache.stat().st_mtime_ns
+    pot = EAMAlloy()
+    pot.load(fname, cache=True, validate='hash')
+    assert cache.stat().st_mtime_ns == mtime
+    assert pot.build() == text
+
+    # Changed text files replace the cache
+    pot = build_potential(EAMAlloy, ['Al'])
+    pot.build(fname)
+    os.utime(fname, ns=(mtime + 10**9, mtime + 10**9))
+    pot = EAMAlloy()
+    pot.load(fname, cache=True)
+    assert pot.symbols == ['Al']
+    assert pot.build() == fname.read_text()
+
+    # File objects are never cached
+    pot = EAMAlloy()
+    pot.load(io.StringIO(text), cache=True)
+    assert pot.symbols == ['Al', 'Ni']
+
+@pytest.mark.parametrize('size', [0, 100, -100])
+def test_sidecar_cache_truncated(tmp_path, build_potential, size):
+    fname = tmp_path / 'AlNi.eam.alloy'
+    pot = build_potential(EAMAlloy, ['Al', 'Ni'])
+    pot.build(fname)
+    text = fname.read_text()
+    cache = tmp_path / 'AlNi.eam.alloy.npz'
+    EAMAlloy().load(fname, cache=True)
+
+    # Truncated caches are rebuilt from the text file
+    content = cache.read_bytes()
+    cache.write_bytes(content[:size])
+    pot = EAMAlloy()
+    pot.load(fname, cache=True)
+    assert pot.build() == text
+    assert cache.read_bytes() == content
+
+def test_write_binary_concurrent(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from potentials.paramfile import _binary
+
+    fname = tmp_path / 'pot.npz'
+    values = np.arange(10**5, dtype=float)
+    def write(i):
+        _binary.write_binary(fname, 'eam/alloy', {'i': i}, values + i)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(write, range(16)))
+
+    # The last writer wins and no temporary files are left behind
+    info, read = read_binary(fname, 'eam/alloy')
+    assert np.array_equal(read, values + info['i'])
+    assert [p.name for p in tmp_path.iterdir()] == ['pot.npz']
+
+    # Failed writes keep the existing file and remove the temporary file
+    def fail(*args, **kwargs):
+        raise OSError('disk full')
+    monkeypatch.setattr(_binary.np, 'savez', fail)
+    with pytest.raises(OSError):
+        write(100)
+    assert [p.name for p in tmp_path.iterdir()] == ['pot.npz']
+    assert read_binary(fname, 'eam/alloy')[0]['i'] == info['i']
@@ -0,0 +1,25 @@
+import numpy as np
+
+from potentials.paramfile import EAM, eam_to_eam_alloy
+
+def test_eam_to_eam_alloy():
+    eams = []
+    for i, numr in enumerate([21, 21, 41]):
+        pot = EAM(header=f'funcfl {i}', number=i+1, mass=1.0+i, alat=4.0,
+                  lattice='fcc', numr=numr, cutoffr=5.0, numrho=11, deltarho=0.1)
+        pot.set_F_rho(table=np.linspace(0, -i, 11))
+        pot.set_z_r(table=np.linspace(i+1, 0, numr))
+        pot.set_rho_r(table=np.linspace(1, 0, numr))
+        eams.append(pot)
+
+    alloy = eam_to_eam_alloy(eams[:2], ['A', 'B'])
+    assert alloy.header == 'funcfl 0\nfuncfl 1\n'
+
+    alloy = eam_to_eam_alloy(eams, ['A', 'B', 'C'], header='three funcfl files')
+    assert alloy.header == 'three funcfl files'
+    assert alloy.numr == 21
+    for s1, z1 in zip(['A', 'B', 'C'], [1, 2, 3]):
+        for s2, z2 in zip(['A', 'B', 'C'], [1, 2, 3]):
+            if s1 != s2:
+                z = z1 * z2 * (1 - alloy.r / 5.0)**2
+                assert np.allclose(alloy.rphi_r([s1, s2]), 27.2 * 0.529 * z)
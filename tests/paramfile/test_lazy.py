@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from potentials.paramfile import EAMAlloy, EAMFS, ADP
+
+@pytest.mark.parametrize('cls', [EAMAlloy, EAMFS, ADP])
+def test_lazy_load(tmp_path, build_potential, cls):
+    fname = tmp_path / 'pot.setfl'
+    build_potential(cls, ['Al', 'Ni']).build(fname)
+    text = fname.read_text()
+
+    pot = cls()
+    pot.load(fname, lazy=True)
+    assert pot.symbols == ['Al', 'Ni']
+    assert pot.symbol_info('Ni')['mass'] == 58.69
+    assert pot.build() == text
+
+def test_lazy_tables(tmp_path, build_potential):
+    fname = tmp_path / 'pot.eam.alloy'
+    build_potential(EAMAlloy, ['Al', 'Ni']).build(fname)
+    eager = EAMAlloy(fname)
+
+    pot = EAMAlloy()
+    pot.load(fname, lazy=True)
+    assert (pot.rphi_r(['Al', 'Ni']) == eager.rphi_r(['Al', 'Ni'])).all()
+
+    # Tables not yet read fail if the file changes, while read tables remain
+    stat = fname.stat()
+    os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with pytest.raises(ValueError):
+        pot.F_rho('Al')
+    assert (pot.rphi_r(['Al', 'Ni']) == eager.rphi_r(['Al', 'Ni'])).all()
+
+def test_lazy_invalid(tmp_path, build_potential):
+    fname = tmp_path / 'pot.eam.alloy'
+    build_potential(EAMAlloy, ['Al', 'Ni']).build(fname)
+    lines = fname.read_text().splitlines()
+    fname.write_text('\n'.join(lines[:-1]))
+    with pytest.raises(ValueError):
+        EAMAlloy().load(fname, lazy=True)
@@ -0,0 +1,21 @@
+import io
+
+import pytest
+
+from potentials.paramfile import EAM, EAMAlloy, EAMFS, ADP
+from potentials.paramfile.load_eam import identify_eam_style, load_eam
+
+def test_identify_eam_style(build_potential):
+    symbols = ['Al', 'Ni']
+    for style, cls in [('eam', EAM), ('eam/alloy', EAMAlloy),
+                       ('eam/fs', EAMFS), ('adp', ADP)]:
+        content = build_potential(cls, symbols, tables='ones', numr=21, numrho=11).build()
+        assert identify_eam_style(io.StringIO(content)) == style
+        assert isinstance(load_eam(io.StringIO(content)), cls)
+
+    # Single symbol setfl files are identical for eam/alloy and eam/fs
+    content = build_potential(EAMFS, ['Al'], tables='ones', numr=21, numrho=11).build()
+    assert identify_eam_style(io.StringIO(content)) == 'eam/alloy'
+
+    with pytest.raises(ValueError):
+        identify_eam_style(io.StringIO(content + '0.0\n'))
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from potentials.paramfile import EAM, EAMAlloy, EAMFS, ADP
+
+@pytest.mark.parametrize('cls', [EAM, EAMAlloy, EAMFS, ADP])
+def test_resample(build_potential, cls):
+    pot = build_potential(cls, tables='smooth', numr=201, numrho=101, deltarho=0.05)
+    text = pot.build()
+
+    # Unchanged grids give no errors and the same tables
+    errors = pot.resample(numr=201, numrho=101)
+    assert max(errors.values()) == 0.0
+    assert pot.build() == text
+
+    # Finer grids closely match the original functions
+    errors = pot.resample(numr=401, numrho=201)
+    assert pot.numr == 401 and pot.numrho == 201
+    assert pot.cutoffr == 5.0
+    assert max(errors.values()) < 1e-6
+    if cls is EAM:
+        assert np.allclose(pot.rho_r(), np.exp(-2 * pot.r))
+    else:
+        assert np.allclose(pot.rphi_r(['Al', 'Ni']), np.exp(-pot.r) * np.cos(pot.r))
+        assert np.allclose(pot.F_rho('Ni'), -2 * np.sqrt(pot.rho + 1))
+    if cls is ADP:
+        assert ('w_r', 'Al-Ni') in errors
+        assert np.allclose(pot.w_r(['Al', 'Ni']), np.sin(pot.r))
+
+    # Coarse grids report larger errors and only the changed grid is resampled
+    errors = pot.resample(numr=11)
+    assert pot.numrho == 201
+    assert 'F_rho' not in [name for name, key in errors]
+    assert max(errors.values()) > 1e-4
@@ -0,0 +1,81 @@
+import io
+
+import numpy as np
+import pytest
+
+from potentials.paramfile import EAMAlloy, ADP
+from potentials.paramfile._setfl import read_values, write_table
+
+def naive_table(vals, xf, ncolumns):
+    """Reference tabulation using one format operation per value"""
+    content = ''
+    line = []
+    for j in range(len(vals)):
+        line.append(xf % vals[j])
+        if (j + 1) % ncolumns == 0:
+            content += ' '.join(line) + '\n'
+            line = []
+    if len(line) > 0:
+        content += ' '.join(line) + '\n'
+    return content
+
+def test_write_table():
+    vals = np.random.default_rng(0).normal(size=1003)
+    for xf, ncolumns in [('%25.16e', 5), ('%.8g', 3), ('%20.12e', 7)]:
+        fp = io.StringIO()
+        write_table(fp, vals, xf=xf, ncolumns=ncolumns, chunklines=17)
+        assert fp.getvalue() == naive_table(vals, xf, ncolumns)
+
+def test_build_load_roundtrip():
+    rng = np.random.default_rng(1)
+    for cls in [EAMAlloy, ADP]:
+        pot = cls(header='roundtrip', symbol=['Al', 'Ni'], number=[13, 28],
+                  mass=[26.98, 58.69], alat=[4.05, 3.52], lattice=['fcc', 'fcc'],
+                  numr=101, cutoffr=6.0, numrho=51, deltarho=0.01)
+        for symbol in pot.symbols:
+            pot.set_F_rho(symbol, table=rng.normal(size=51))
+            pot.set_rho_r(symbol, table=rng.normal(size=101))
+        for pair in [['Al', 'Al'], ['Ni', 'Al'], ['Ni', 'Ni']]:
+            pot.set_rphi_r(pair, table=rng.normal(size=101))
+            if cls is ADP:
+                pot.set_u_r(pair, table=rng.normal(size=101))
+                pot.set_w_r(pair, table=rng.normal(size=101))
+
+        content = pot.build()
+        pot2 = cls(io.StringIO(content))
+        assert pot2.build() == content
+        assert np.allclose(pot2.rphi_r(['Al', 'Ni']), pot.rphi_r(['Al', 'Ni']))
+
+def test_read_values():
+    content = ' 13 26.98 4.05 fcc\n1.0 -2.5e-3 nan\n 28 58.69 3.52 L1_2\n 4.0\n'
+    values, strings = read_values(io.StringIO(content), 12, [3, 10])
+    assert strings == ['fcc', 'L1_2']
+    assert values.shape == (10,)
+    assert np.isnan(values[5])
+    assert values[-1] == 4.0
+
+    # Numeric str terms fall back to token-based parsing
+    values, strings = read_values(io.StringIO('1 2 3 4 5'), 5, [3])
+    assert strings == ['4']
+    assert np.allclose(values, [1, 2, 3, 5])
+
+    with pytest.raises(ValueError):
+        read_values(io.StringIO(content), 13, [3, 10])
+
+    with pytest.raises(ValueError):
+        read_values(io.StringIO(content), 11, [3, 10])
+
+    # Terms split across chunks are parsed the same
+    rng = np.random.default_rng(2)
+    vals = rng.normal(size=200)
+    fp = io.StringIO()
+    write_table(fp, vals[:97], xf='%.8g')
+    fp.write('fcc\n')
+    write_table(fp, vals[97:], xf='%.8g')
+    content = fp.getvalue()
+    expected, strings = read_values(io.StringIO(content), 201, [97])
+    assert strings == ['fcc']
+    for chunksize in [1, 7, 64, 1000]:
+        values, strings = read_values(io.StringIO(content), 201, [97], chunksize=chunksize)
+        assert strings == ['fcc']
+        assert np.array_equal(values, expected)
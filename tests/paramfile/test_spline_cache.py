@@ -0,0 +1,34 @@
+import numpy as np
+
+from potentials.paramfile import EAMAlloy
+
+def test_spline_cache():
+    pot = EAMAlloy(symbol=['Al', 'Ni'], number=[13, 28], mass=[26.98, 58.69],
+                   alat=[4.05, 3.52], lattice=['fcc', 'fcc'],
+                   numr=101, cutoffr=5.0, numrho=101, cutoffrho=5.0)
+    pot.set_F_rho('Al', table=pot.rho**2)
+    pot.set_rphi_r(['Ni', 'Al'], table=np.sin(pot.r))
+    x = np.linspace(0, 4, 17)
+    assert len(pot.spline_cache) == 0
+
+    # Splines are built on first evaluation and reused after
+    assert np.allclose(pot.F_rho('Al', rho=x), x**2)
+    spline = pot.spline_cache.get('F_rho', 'Al', None, None)
+    pot.F_rho('Al', rho=x)
+    assert pot.spline_cache.get('F_rho', 'Al', None, None) is spline
+    assert np.allclose(pot.rphi_r(['Al', 'Ni'], r=x), np.sin(x), atol=1e-6)
+    assert ('rphi_r', 'Al-Ni') in pot.spline_cache
+
+    # Setting a function removes only its splines
+    pot.set_rphi_r(['Al', 'Ni'], table=np.cos(pot.r))
+    assert ('rphi_r', 'Al-Ni') not in pot.spline_cache
+    assert ('F_rho', 'Al') in pot.spline_cache
+    assert np.allclose(pot.rphi_r(['Al', 'Ni'], r=x), np.cos(x), atol=1e-6)
+
+    # Changing the grid removes all splines
+    pot.set_rho(num=201, cutoff=5.0)
+    assert len(pot.spline_cache) == 0
+
+    pot.F_rho('Al', rho=x)
+    pot.spline_cache.clear()
+    assert len(pot.spline_cache) == 0
@@ -0,0 +1,67 @@
+import pytest
+
+from potentials.paramfile.Tersoff import Tersoff
+
+def test_triplets():
+    pot = Tersoff(['Si', 'C'])
+    triplets = list(zip(pot.params.e1, pot.params.e2, pot.params.e3))
+    assert triplets == [('Si', 'Si', 'Si'), ('Si', 'Si', 'C'), ('Si', 'C', 'Si'),
+                        ('Si', 'C', 'C'), ('C', 'Si', 'Si'), ('C', 'Si', 'C'),
+                        ('C', 'C', 'Si'), ('C', 'C', 'C')]
+
+def test_text():
+    pot = Tersoff(['Si'])
+    pot.params.loc[0, 'A'] = 1830.8
+    pot.params.loc[0, 'Rcut'] = 2.85
+    lines = pot.text(headers='Silicon\n# test').splitlines()
+    assert lines[:2] == ['#Silicon', '# test']
+    assert lines[2].startswith('#e1 e2  e3  m   gamma lambda3 c   d   costheta0 n   ')
+    assert lines[2].endswith('Rcut D   lambda1 A      ')
+    assert lines[3].endswith('2.85 0.0 0.0     1830.8 ')
+    assert len(lines[2]) == len(lines[3])
+
+def write_abop(fname, mods=''):
+    fname.write_text('\n'.join([
+        'el1 Si C Si', 'el2 Si C C',
+        'D0 3.24 6.0 4.36', 'r0 2.232 1.4276 1.79',
+        'β 1.4761 2.0099 1.847', 'S 1.842 2.1675 1.847',
+        'γ 0.114 0.11233 0.011877', 'c 2.00494 181.91 273987',
+        'd 0.81472 6.28433 180.314', 'h 0.259 0.5556 0.68',
+        'R 2.82 2.0 2.4', 'D 0.14 0.15 0.2',
+        'bf 8.0 8.0 8.0', 'rf 1.0 0.6 0.9', mods]))
+
+def test_abop_zbl(tmp_path):
+    fname = tmp_path / 'SiC.abop'
+    write_abop(fname)
+    pot = Tersoff.abop(fname)
+    assert pot.pair_style == 'tersoff/zbl'
+    params = pot.params
+    assert params.Z_i.tolist() == [14, 14, 14, 14, 6, 6, 6, 6]
+    assert params.Z_j.tolist() == [14, 14, 6, 6, 14, 14, 6, 6]
+    assert params.Z_i.dtype.kind == 'i'
+
+def test_abop_fitter(tmp_path):
+    fname = tmp_path / 'SiC.abop'
+    write_abop(fname, mods='3 body mods\nα Si C Si 1.5\nω C Si C 2.0')
+    fitter = Tersoff.abop_fitter(fname)
+    assert fitter.pairs == [('Si', 'Si'), ('C', 'C'), ('Si', 'C')]
+    assert fitter.index[('C', 'Si', 'C')] == 5
+    assert fitter.text('x') == Tersoff.abop(fname).text('x')
+
+    # Updates match a fitter built from the same values
+    γ = fitter.values('γ')
+    for i in range(3):
+        fitter.update(β=[1.5, 2.0, 1.8], γ=γ * 2, rf=0.8)
+    check = Tersoff.abop_fitter(fname)
+    check.update(**{key: fitter.values(key) for key in fitter.keys})
+    assert fitter.text() == check.text()
+    assert fitter.tersoff().text() == check.text()
+    params = fitter.tersoff().params
+    assert params.gamma[5] == 0.11233 * 2 * 2.0
+    assert params.lambda3[2] == 1.5
+    assert params.ZBLcut.tolist() == [0.8] * 8
+
+    with pytest.raises(ValueError):
+        fitter.update(x=1.0)
+    with pytest.raises(ValueError):
+        fitter.update(β=[1.0, 2.0])
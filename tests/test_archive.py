@@ -0,0 +1,75 @@
+from io import BytesIO
+import tarfile
+
+import pytest
+
+import potentials
+from potentials.Database._archive import ArtifactArchive, build_archive, open_archive
+from potentials.record.Artifact import Artifact
+
+def build_folder(tmp_path):
+    folder = tmp_path / 'root' / 'test-pot'
+    folder.mkdir(parents=True)
+    for i in range(5):
+        (folder / f'file{i}.txt').write_bytes(f'content {i}\n'.encode() * 1000)
+    return tmp_path / 'root'
+
+@pytest.mark.parametrize('format', ['zip', 'tar', 'uncompressed tar'])
+def test_artifact_archive(tmp_path, format):
+    root = build_folder(tmp_path)
+    if format == 'uncompressed tar':
+        path = tmp_path / 'archive.tar'
+        with tarfile.open(path, 'w') as tar:
+            tar.add(root / 'test-pot', arcname='test-pot')
+        content = path.read_bytes()
+    else:
+        content = build_archive(root, 'test-pot', format)
+
+    with ArtifactArchive(content) as archive:
+        assert archive.format == {'zip': 'zip', 'tar': 'compressed tar',
+                                  'uncompressed tar': 'tar'}[format]
+        assert sorted(archive.names()) == [f'test-pot/file{i}.txt' for i in range(5)]
+        assert 'test-pot/file3.txt' in archive
+        assert 'test-pot/missing.txt' not in archive
+
+        archive.extract('test-pot/file3.txt', tmp_path / 'file3.txt')
+        assert (tmp_path / 'file3.txt').read_bytes() == b'content 3\n' * 1000
+        with pytest.raises(KeyError):
+            archive.extract('test-pot/missing.txt', tmp_path / 'missing.txt')
+
+        extracted = archive.extract_many({'test-pot/file4.txt': tmp_path / 'a',
+                                          'test-pot/file0.txt': tmp_path / 'b',
+                                          'test-pot/missing.txt': tmp_path / 'c'})
+        assert sorted(extracted) == ['test-pot/file0.txt', 'test-pot/file4.txt']
+        assert (tmp_path / 'a').read_bytes() == b'content 4\n' * 1000
+        assert (tmp_path / 'b').read_bytes() == b'content 0\n' * 1000
+        assert not (tmp_path / 'c').exists()
+
+    with tarfile.open(fileobj=BytesIO(build_archive(root, 'test-pot'))) as tar:
+        assert 'test-pot/file0.txt' in tar.getnames()
+    with pytest.raises(ValueError):
+        build_archive(root, 'test-pot', 'rar')
+    with pytest.raises(FileNotFoundError):
+        build_archive(root, 'missing')
+
+@pytest.mark.parametrize('format', ['zip', 'tar'])
+def test_get_lammps_potential_files_archive(tmp_path, format):
+    root = build_folder(tmp_path)
+    pot = potentials.load_record('potential_LAMMPS', id='test-pot', key='test-key',
+                                 potid='test', potkey='test-pot-key',
+                                 pair_style='eam/alloy', symbols=['Al'], elements=['Al'],
+                                 artifacts=[Artifact(filename=f'file{i}.txt',
+                                                     url=f'https://example.org/file{i}.txt')
+                                            for i in [1, 2]])
+    potdb = potentials.Database(local=True, remote=False, localpath=tmp_path / 'library')
+    potdb.save_record(pot)
+    potdb.local_database.add_tar(record=pot, tar=build_archive(root, 'test-pot', format))
+
+    with open_archive(potdb.local_database, pot) as archive:
+        assert archive.format == {'zip': 'zip', 'tar': 'compressed tar'}[format]
+    if format == 'tar':
+        assert 'test-pot/file1.txt' in potdb.local_database.get_tar(record=pot).getnames()
+
+    report = potdb.get_lammps_potential_files(pot, pot_dir=tmp_path / 'pots', download=False)
+    assert report == {'file1.txt': 'extract', 'file2.txt': 'extract'}
+    assert (tmp_path / 'pots' / 'file2.txt').read_bytes() == b'content 2\n' * 1000
@@ -0,0 +1,125 @@
+import hashlib
+import multiprocessing
+import os
+import time
+
+import pytest
+
+import potentials
+from potentials.Database import ArtifactCache
+from potentials.record.Artifact import Artifact
+
+from test_staging import build_library
+
+def artifact(name, content):
+    return Artifact(filename=name, url=f'https://example.org/{name}',
+                    sha256=hashlib.sha256(content).hexdigest())
+
+def writer(content):
+    return lambda path: path.write_bytes(content)
+
+def slow_source(content, counter):
+    """Builds a source function that records each call and writes slowly"""
+    def source(path):
+        with open(counter, 'a') as f:
+            f.write('call\n')
+        time.sleep(0.2)
+        with open(path, 'wb') as f:
+            f.write(content)
+    return source
+
+def stage_job(root, pot_dir, content, counter):
+    cache = ArtifactCache(root)
+    cache.stage(artifact('table.txt', content), pot_dir, 'hardlink',
+                source=slow_source(content, counter))
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                    reason='requires fork')
+def test_artifact_cache_concurrent(tmp_path):
+    content = b'table\n' * 1000
+    counter = tmp_path / 'counter.txt'
+    context = multiprocessing.get_context('fork')
+    jobs = [context.Process(target=stage_job,
+                            args=(tmp_path / 'cache', tmp_path / f'job{i}', content, counter))
+            for i in range(6)]
+    for job in jobs:
+        job.start()
+    for job in jobs:
+        job.join()
+        assert job.exitcode == 0
+
+    # Exactly one process populated the cache and all others linked to it
+    assert counter.read_text() == 'call\n'
+    cache = ArtifactCache(tmp_path / 'cache')
+    path = cache.path(cache.key(artifact('table.txt', content)))
+    for i in range(6):
+        assert os.path.samefile(tmp_path / f'job{i}' / 'table.txt', path)
+
+def test_artifact_cache_eviction(tmp_path):
+    cache = ArtifactCache(tmp_path / 'cache', maxsize=25)
+    contents = [f'{i}'.encode() * 10 for i in range(3)]
+    artifacts = [artifact(f'file{i}.txt', contents[i]) for i in range(3)]
+    for i in range(2):
+        assert cache.stage(artifacts[i], tmp_path / 'pots', source=writer(contents[i])) == 'copy'
+        time.sleep(0.05)
+    assert cache.size() == 20
+
+    # The least recently used file is evicted
+    cache.stage(artifacts[0], tmp_path / 'pots')
+    time.sleep(0.05)
+    cache.stage(artifacts[2], tmp_path / 'pots', source=writer(contents[2]))
+    assert sorted(cache.keys()) == sorted(cache.key(a) for a in artifacts[::2])
+    assert (tmp_path / 'pots' / 'file1.txt').read_bytes() == b'1' * 10
+
+    # Content not matching the checksum is never cached
+    with pytest.raises(ValueError):
+        cache.stage(artifact('bad.txt', b'good'), tmp_path / 'pots',
+                    source=writer(b'bad'))
+    assert cache.get(artifact('bad.txt', b'good'), download=False) is None
+    assert cache.clear() == 2
+    assert cache.keys() == []
+
+def test_get_lammps_potential_files_cache(tmp_path):
+    potdb, pot, libfile = build_library(tmp_path)
+    potdb.set_artifact_cache(root=tmp_path / 'cache')
+
+    pot_dir = potdb.artifact_cache.potential_dir(pot)
+    report = potdb.get_lammps_potential_files(pot, pot_dir=pot_dir, staging='symlink')
+    assert report == {'AlNi.eam.alloy': 'symlink'}
+    cached = potdb.artifact_cache.path(potdb.artifact_cache.key(pot.artifacts[0]))
+    assert os.path.samefile(pot_dir / 'AlNi.eam.alloy', cached)
+    assert not os.path.samefile(cached, libfile)
+    assert not os.access(cached, os.W_OK) or os.geteuid() == 0
+
+    # Other pot_dirs are staged from the cache without the database
+    potdb.unset_artifact_cache()
+    cache = ArtifactCache(tmp_path / 'cache')
+    libfile.unlink()
+    assert pot.download_files(pot_dir=tmp_path / 'job', cache=cache, staging='hardlink') == (1, 0)
+    assert (tmp_path / 'job' / 'AlNi.eam.alloy').read_text() == 'table\n'
+
+def test_artifact_cache_max_age(tmp_path):
+    a = Artifact(filename='table.txt', url='https://example.org/table.txt')
+    cache = ArtifactCache(tmp_path / 'cache', max_age=0.1)
+    path = cache.get(a, source=writer(b'old\n'))
+    assert cache.key(a).startswith('url-')
+
+    # Files cached by URL are refreshed once older than max_age
+    assert cache.get(a, source=writer(b'new\n')).read_bytes() == b'old\n'
+    time.sleep(0.2)
+    assert cache.get(a, download=False) == path
+    assert path.read_bytes() == b'old\n'
+    assert cache.get(a, source=writer(b'new\n')).read_bytes() == b'new\n'
+
+    # Files cached by checksum are never refreshed
+    content = b'table\n'
+    b = artifact('other.txt', content)
+    cache.get(b, source=writer(content))
+    time.sleep(0.2)
+    assert cache.get(b, source=writer(b'changed\n')).read_bytes() == content
+
+    with pytest.raises(ValueError):
+        ArtifactCache(tmp_path / 'cache', max_age=-1)
+    potdb = potentials.Database(local=True, remote=False, localpath=tmp_path / 'library')
+    with pytest.raises(ValueError):
+        potdb.set_artifact_cache(cache, maxsize=10)
@@ -0,0 +1,192 @@
+import hashlib
+import threading
+import time
+
+import pytest
+import requests
+
+from potentials.record.Artifact import Artifact
+from potentials.record._download import download_artifacts
+
+class FakeResponse():
+    def __init__(self, url, status_code=200, content=b'', headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {} if headers is None else headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} for {self.url}')
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+        if self.status_code == 200 and len(self.content) < len(self.url.encode() * 100):
+            raise requests.ConnectionError('connection lost')
+
+class FakeSession():
+    """Mimics requests.Session.get and tracks the number of open requests"""
+    def __init__(self, supports_range=True, range_offset=0, fail_after=None):
+        self.supports_range = supports_range
+        self.range_offset = range_offset
+        self.fail_after = fail_after
+        self.lock = threading.Lock()
+        self.active = 0
+        self.maxactive = 0
+        self.ranges = []
+
+    def get(self, url, headers=None, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.maxactive = max(self.maxactive, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        if 'missing' in url:
+            return FakeResponse(url, 404)
+        if 'error' in url:
+            return FakeResponse(url, 500)
+        content = url.encode() * 100
+        if headers is not None and 'Range' in headers:
+            self.ranges.append(headers['Range'])
+            if self.supports_range:
+                start = int(headers['Range'][6:-1]) + self.range_offset
+                contentrange = f'bytes {start}-{len(content) - 1}/{len(content)}'
+                return FakeResponse(url, 206, content[start:],
+                                    {'Content-Range': contentrange})
+        if self.fail_after is not None:
+            return FakeResponse(url, 200, content[:self.fail_after])
+        return FakeResponse(url, 200, content)
+
+def artifact(url):
+    return Artifact(url=url, filename=url.split('/')[-1])
+
+def test_download_artifacts(tmp_path):
+    artifacts = [artifact(f'https://a.org/file{i}.txt') for i in range(12)]
+    artifacts.append(artifact('https://a.org/missing.txt'))
+    artifacts.append(artifact('https://b.org/error.txt'))
+    session = FakeSession()
+
+    summary = download_artifacts([(a, tmp_path) for a in artifacts],
+                                 max_workers=6, max_per_host=3,
+                                 session=session)
+    assert summary['downloaded'] == 12
+    assert summary['skipped'] == 1
+    assert len(summary['failed']) == 1
+    assert isinstance(summary['failed'][0][1], requests.HTTPError)
+    assert session.maxactive <= 4
+    assert (tmp_path / 'file3.txt').read_bytes() == b'https://a.org/file3.txt' * 100
+
+    # Existing files are skipped unless overwrite is True
+    summary = download_artifacts([(a, tmp_path) for a in artifacts[:12]],
+                                 session=session)
+    assert summary['skipped'] == 12
+
+def test_download_resume_and_checksum(tmp_path):
+    url = 'https://a.org/table.eam'
+    content = url.encode() * 100
+    a = artifact(url)
+
+    # Interrupted downloads are resumed with a Range request
+    (tmp_path / 'table.eam.part').write_bytes(content[:1000])
+    session = FakeSession()
+    assert a.download(tmp_path, session=session, record_sha256=True)
+    assert session.ranges == ['bytes=1000-']
+    assert (tmp_path / 'table.eam').read_bytes() == content
+    assert not (tmp_path / 'table.eam.part').exists()
+
+    # Incomplete downloads are left for a later download to resume
+    (tmp_path / 'table.eam').unlink()
+    a.sha256 = None
+    with pytest.raises(requests.ConnectionError):
+        a.download(tmp_path, session=FakeSession(fail_after=1000))
+    assert [path.name for path in tmp_path.iterdir()] == ['table.eam.part']
+    assert (tmp_path / 'table.eam.part').read_bytes() == content[:1000]
+    assert a.download(tmp_path, session=FakeSession())
+    assert (tmp_path / 'table.eam').read_bytes() == content
+
+def test_artifact_metadata():
+    a = Artifact(url='https://a.org/table.eam', filename='table.eam', name='table.eam')
+    assert 'sha256' not in a.metadata()
+    a.sha256 = '0' * 64
+    assert a.metadata()['sha256'] == '0' * 64
+    assert a.sha256 == hashlib.sha256(content).hexdigest()
+
+    # Servers that return a different range restart the file
+    (tmp_path / 'table.eam.part').write_bytes(content[:1000])
+    (tmp_path / 'table.eam').unlink()
+    session = FakeSession(range_offset=500)
+    assert a.download(tmp_path, session=session)
+    assert session.ranges == ['bytes=1000-']
+    assert (tmp_path / 'table.eam').read_bytes() == content
+
+    # Servers that ignore the range restart the file
+    (tmp_path / 'table.eam.part').write_bytes(b'garbage')
+    (tmp_path / 'table.eam').unlink()
+    assert a.download(tmp_path, session=FakeSession(supports_range=False))
+    assert (tmp_path / 'table.eam').read_bytes() == content
+
+    # Verified files are not downloaded again even with overwrite
+    assert a.verify(tmp_path)
+    assert not a.download(tmp_path, overwrite=True, session=session)
+
+    # Content not matching the checksum is rejected
+    a.sha256 = '0' * 64
+    with pytest.raises(ValueError):
+        a.download(tmp_path, overwrite=True, session=session)
+    assert (tmp_path / 'table.eam').read_bytes() == content
+    assert not (tmp_path / 'table.eam.part').exists()
+
+    # Incomplete downloads are left for a later download to resume
+    (tmp_path / 'table.eam').unlink()
+    a.sha256 = None
+    with pytest.raises(requests.ConnectionError):
+        a.download(tmp_path, session=FakeSession(fail_after=1000))
+    assert [path.name for path in tmp_path.iterdir()] == ['table.eam.part']
+    assert (tmp_path / 'table.eam.part').read_bytes() == content[:1000]
+    assert a.download(tmp_path, session=FakeSession())
+    assert (tmp_path / 'table.eam').read_bytes() == content
+
+def test_artifact_metadata():
+    a = Artifact(url='https://a.org/table.eam', filename='table.eam', name='table.eam')
+    assert 'sha256' not in a.metadata()
+    a.sha256 = '0' * 64
+    assert a.metadata()['sha256'] == '0' * 64
+
+def test_download_lammps_potentials_failed(tmp_path, monkeypatch):
+    import potentials
+    from potentials.Database import _lammps_potential
+
+    def fake_download(tasks, **kwargs):
+        failed = []
+        for artifact, pot_dir in tasks:
+            if 'missing' in artifact.url:
+                failed.append((artifact, requests.HTTPError(f'404 for {artifact.url}')))
+            else:
+                (pot_dir / artifact.filename).write_text(artifact.url)
+        return {'downloaded': len(tasks) - len(failed), 'skipped': 0, 'failed': failed}
+    monkeypatch.setattr(_lammps_potential, 'download_artifacts', fake_download)
+
+    remote = potentials.load_database(style='local', host=tmp_path / 'remote')
+    for id in ['good', 'missing']:
+        remote.add_record(record=potentials.load_record(
+            'potential_LAMMPS', id=id, key=f'{id}-key', potid=f'{id}-pot',
+            pair_style='eam', symbols=['Al'], elements=['Al'],
+            artifacts=[Artifact(filename=f'{id}.eam', url=f'https://example.org/{id}.eam')]))
+    potdb = potentials.Database(local=True, remote=True, localpath=tmp_path / 'local',
+                                remote_database=remote, kim_models=[])
+
+    # Failures raise after the other files are downloaded and stored
+    with pytest.raises(requests.HTTPError):
+        potdb.download_lammps_potentials(downloadfiles=True, dedupe=True)
+    folder = tmp_path / 'local' / 'potential_LAMMPS'
+    assert (folder / 'good' / 'good.eam').read_text() == 'https://example.org/good.eam'
+    assert (folder / 'good' / potdb.local_artifact_store.manifest_name).is_file()
+    assert not (folder / 'missing' / potdb.local_artifact_store.manifest_name).exists()
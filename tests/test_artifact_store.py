@@ -0,0 +1,69 @@
+import os
+import shutil
+
+import potentials
+from potentials.record.Artifact import Artifact
+
+def build_potential(id, filenames):
+    pot = potentials.load_record('potential_LAMMPS', id=id, key=f'{id}-key',
+                                 potid='test-pot', potkey='test-pot-key',
+                                 pair_style='eam/alloy', symbols=['Al', 'Ni'],
+                                 elements=['Al', 'Ni'],
+                                 artifacts=[Artifact(filename=name, url=f'https://example.org/{name}')
+                                            for name in filenames])
+    pot.pair_coeff_paramfile(filenames[0])
+    return pot
+
+def build_library(tmp_path, **kwargs):
+    """Builds a local database with two versions sharing an identical file"""
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'AlNi.eam.alloy').write_bytes(b'shared table\n' * 100)
+    (src / 'extra.txt').write_bytes(b'unique')
+
+    potdb = potentials.Database(local=True, remote=False, localpath=tmp_path / 'library')
+    pots = [build_potential('test-v1', ['AlNi.eam.alloy']),
+            build_potential('test-v2', ['AlNi.eam.alloy', 'extra.txt'])]
+    potdb.save_lammps_potential(pots[0], filenames=[src / 'AlNi.eam.alloy'], **kwargs)
+    potdb.save_lammps_potential(pots[1], filenames=[src / 'AlNi.eam.alloy', src / 'extra.txt'],
+                                **kwargs)
+    return potdb, pots
+
+def test_dedupe_and_gc(tmp_path):
+    # Files are not deduplicated by default
+    potdb, pots = build_library(tmp_path)
+    folders = [potdb.local_database.get_folder(record=pot) for pot in pots]
+    assert not os.path.samefile(folders[0] / 'AlNi.eam.alloy', folders[1] / 'AlNi.eam.alloy')
+
+    # Converting an existing library links identical files to one blob
+    report = potdb.dedupe_artifacts()
+    assert report['folders'] == 2
+    assert report['files'] == 3
+    assert report['blobs'] == 2
+    assert report['saved'] == 1300
+    assert os.path.samefile(folders[0] / 'AlNi.eam.alloy', folders[1] / 'AlNi.eam.alloy')
+    store = potdb.local_artifact_store
+    manifest = store.load_manifest(folders[1])
+    assert manifest['extra.txt']['size'] == 6
+    assert store.blob_path(manifest['extra.txt']['sha256']).read_bytes() == b'unique'
+
+    # Running again changes nothing
+    assert potdb.dedupe_artifacts()['saved'] == 0
+
+    # Blobs only referenced by deleted folders are removed
+    shutil.rmtree(folders[1])
+    assert potdb.gc_artifacts() == {'removed': 1, 'freed': 6}
+    assert len(store.blobs()) == 1
+
+def test_save_and_read_through_manifest(tmp_path):
+    potdb, pots = build_library(tmp_path, dedupe=True)
+    folders = [potdb.local_database.get_folder(record=pot) for pot in pots]
+    assert os.path.samefile(folders[0] / 'AlNi.eam.alloy', folders[1] / 'AlNi.eam.alloy')
+    assert potdb.dedupe_artifacts()['saved'] == 0
+
+    # Folder files are read through the manifest
+    (folders[1] / 'AlNi.eam.alloy').unlink()
+    report = potdb.get_lammps_potential_files(pots[1], pot_dir=tmp_path / 'pots',
+                                              download=False)
+    assert report == {'AlNi.eam.alloy': 'copy', 'extra.txt': 'copy'}
+    assert (tmp_path / 'pots' / 'AlNi.eam.alloy').read_bytes() == b'shared table\n' * 100
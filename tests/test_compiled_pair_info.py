@@ -0,0 +1,70 @@
+import potentials
+import pytest
+
+def build_records():
+    """Builds potential_LAMMPS records for the different pair_coeff variations"""
+    records = []
+
+    pot = potentials.load_record('potential_LAMMPS', id='test-eam-alloy',
+                                 pair_style='eam/alloy', symbols=['Al', 'Ni', 'Al2'],
+                                 elements=['Al', 'Ni', 'Al'], masses=[None, 58.0, None],
+                                 comments='Test potential\nSecond line',
+                                 dois=['10.1000/test'])
+    pot.pair_coeff_paramfile('AlNi.eam.alloy')
+    pot.add_command()
+    pot.commands[0].add_term('option', 'neighbor 2.0 bin')
+    records.append(pot)
+
+    pot = potentials.load_record('potential_LAMMPS', id='test-eam',
+                                 pair_style='eam', symbols=['Cu', 'Ag'],
+                                 elements=['Cu', 'Ag'])
+    pot.pair_coeff_eam(['Cu.eam', 'Ag.eam'])
+    records.append(pot)
+
+    pot = potentials.load_record('potential_LAMMPS', id='test-lj',
+                                 pair_style='lj/cut', symbols=['Ar', 'Kr'],
+                                 elements=['Ar', 'Kr'], allsymbols=True)
+    pot.pair_style_terms.add_term('parameter', 10.0)
+    for interaction, sigma in [(['Ar', 'Ar'], 3.4), (['Ar', 'Kr'], 3.5), (['Kr', 'Kr'], 3.6)]:
+        pot.add_pair_coeff(interaction=interaction)
+        pot.pair_coeffs[-1].add_term('parameter', 0.01)
+        pot.pair_coeffs[-1].add_term('parameter', sigma)
+    records.append(pot)
+
+    return records
+
+@pytest.mark.parametrize('pot', build_records())
+def test_compiled_pair_info(pot):
+    compiled = pot.compile_pair_info(pot_dir='pots')
+    pot.pot_dir = 'pots'
+    symbolsets = [None, pot.symbols[0], pot.symbols[::-1], pot.symbols * 2]
+    for symbols in symbolsets:
+        for comments in [True, False]:
+            assert compiled.pair_info(symbols, comments=comments) == pot.pair_info(symbols, comments=comments)
+        assert (compiled.pair_data_info('data.dat', [True, False, True], symbols)
+                == pot.pair_data_info('data.dat', [True, False, True], symbols))
+        assert (compiled.pair_restart_info('restart.bin', symbols)
+                == pot.pair_restart_info('restart.bin', symbols))
+
+    # Given masses and pot_dir values are used
+    masses = [1.0] + [None] * (len(pot.symbols) - 1)
+    assert (compiled.pair_info(pot.symbols, masses=masses)
+            == pot.pair_info(pot.symbols, masses=masses))
+    other = compiled.pair_info(pot_dir='other')
+    pot.pot_dir = 'other'
+    assert other == pot.pair_info()
+
+def test_cache():
+    pot = build_records()[0]
+    compiled = pot.compile_pair_info(maxsize=2)
+    compiled.pair_info(['Al', 'Ni'])
+    compiled.pair_info(['Al', 'Ni'])
+    info = compiled.cache_info()
+    assert info.hits == 1 and info.misses == 1
+
+    # Masses are part of the key
+    compiled.pair_info(['Al', 'Ni'], masses=[27.0, None])
+    assert compiled.cache_info().misses == 2
+
+    with pytest.raises(ValueError):
+        compiled.pair_info(['Xx'])
@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+def import_modules(statement):
+    """Runs an import statement in a new interpreter and returns the imported module names"""
+    code = f'import sys, json\n{statement}\nprint(json.dumps(sorted(sys.modules)))'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, check=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+def test_import_potentials():
+    modules = import_modules('import potentials')
+    for name in ['matplotlib', 'scipy', 'ipywidgets', 'habanero',
+                 'potentials.paramfile']:
+        assert name not in modules
+
+def test_record_styles_registered():
+    code = ('import potentials, yabadaba\n'
+            'print(type(yabadaba.load_record("potential_LAMMPS")).__name__)')
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, check=True).stdout
+    assert output.splitlines()[-1] == 'PotentialLAMMPS'
+
+@pytest.mark.parametrize('statement', [
+    'from potentials.record.PotentialLAMMPS import PotentialLAMMPS',
+    'import potentials; potentials.load_record',
+])
+def test_import_record(statement):
+    modules = import_modules(statement)
+    for name in ['matplotlib', 'scipy', 'ipywidgets', 'potentials.paramfile']:
+        assert name not in modules
+
+def test_import_paramfile():
+    modules = import_modules('from potentials.paramfile import EAMAlloy')
+    for name in ['matplotlib', 'ipywidgets']:
+        assert name not in modules
+
+def test_lazy_attributes():
+    import potentials
+    import potentials.Database._sync
+    assert isinstance(potentials.Database, type)
+    assert callable(potentials.load_record)
+    assert 'paramfile' in dir(potentials)
+    with pytest.raises(AttributeError):
+        potentials.missing
@@ -0,0 +1,51 @@
+from DataModelDict import DataModelDict as DM
+
+import potentials
+
+def kim_record(code, pots):
+    """Builds a potential_LAMMPS_KIM record with versions 001 and 002"""
+    model = DM()
+    model['potential-LAMMPS-KIM'] = root = DM()
+    root['key'] = f'{code}-key'
+    root['id'] = f'MO_{code}'
+    root['potential'] = []
+    for potid, symbols in pots:
+        root['potential'].append(DM([
+            ('key', f'{potid}-key'), ('id', potid),
+            ('atom', [DM([('symbol', s), ('element', s)]) for s in symbols])]))
+    root['full-kim-id'] = [f'EAM_Test__MO_{code}_{v}' for v in ['001', '002']]
+    return potentials.load_record('potential_LAMMPS_KIM', model=model)
+
+def test_get_kim_lammps_potentials(tmp_path):
+    kim_models = ['EAM_Test__MO_111111111111_001', 'EAM_Test__MO_111111111111_002',
+                  'EAM_Test__MO_222222222222_002', 'EAM_Test__MO_333333333333_001',
+                  'not_a_kim_model']
+    potdb = potentials.Database(local=True, remote=False, localpath=tmp_path,
+                                kim_models=kim_models)
+    potdb.save_record(kim_record('111111111111', [('2000--A--Al', ['Al'])]))
+    potdb.save_record(kim_record('222222222222', [('2001--B--Al-Ni', ['Al', 'Ni']),
+                                                  ('2001--B--Ni-Cu', ['Ni', 'Cu']),
+                                                  ('2001--B--Al', ['Al'])]))
+
+    # Each installed id is matched and multi-potential records are expanded
+    records, df = potdb.get_kim_lammps_potentials(return_df=True)
+    assert [r.id[-3:] for r in records] == ['001', '002', '002', '002', '002']
+    assert df.potid.tolist() == ['2000--A--Al', '2000--A--Al', '2001--B--Al-Ni',
+                                 '2001--B--Ni-Cu', '2001--B--Al']
+    assert records[2].symbols == ['Al', 'Ni']
+    assert records[3].symbols == ['Ni', 'Cu']
+
+    # Expanded entries share the loaded model content
+    assert records[2].potentials is records[3].potentials
+
+    # but not the selected potential's atoms
+    records[3].atoms.pop()
+    assert records[3].symbols == ['Ni']
+    assert records[3].potentials[1].atoms[1].symbol == 'Cu'
+
+    records = potdb.get_kim_lammps_potentials(elements='Ni')
+    assert [r.potid for r in records] == ['2001--B--Al-Ni', '2001--B--Ni-Cu']
+    records = potdb.get_kim_lammps_potentials(symbols=['Al', 'Ni'])
+    assert [r.potid for r in records] == ['2001--B--Al-Ni']
+    records = potdb.get_kim_lammps_potentials(key='MO_111111111111_002')
+    assert [r.id for r in records] == ['EAM_Test__MO_111111111111_002']
@@ -0,0 +1,70 @@
+import datetime
+import json
+import os
+
+import numpy as np
+
+import potentials
+from potentials.Database import _json
+from potentials.Database._metadata_index import MetadataIndex
+
+def lammps_potential(id, pair_style, elements, status=None):
+    return potentials.load_record('potential_LAMMPS', id=id, key=id + '-key',
+                                  potid=id + '-pot', pair_style=pair_style,
+                                  status=status, symbols=elements,
+                                  elements=elements)
+
+def test_metadata_index(tmp_path):
+    potdb = potentials.Database(local=True, remote=False, localpath=tmp_path,
+                                kim_models=[])
+    potdb.save_record(lammps_potential('A', 'eam', ['Al']))
+    potdb.save_record(lammps_potential('B', 'eam/alloy', ['Al', 'Ni']))
+    potdb.save_record(lammps_potential('C', 'meam', ['Ni', 'Cu'], 'retracted'))
+    index = potdb.local_index
+    assert isinstance(index, MetadataIndex)
+
+    def ids(**kwargs):
+        return [record.id for record in potdb.get_lammps_potentials(**kwargs)]
+
+    assert ids() == ['A', 'B', 'C']
+    assert index.path.is_file()
+    assert ids(pair_style=['eam', 'meam']) == ['A', 'C']
+    assert ids(elements='Ni') == ['B', 'C']
+    assert ids(elements=['Al', 'Ni']) == ['B']
+    assert ids(status='retracted', elements='Cu') == ['C']
+    assert ids(potid='B-pot') == ['B']
+    assert ids(name='A', pair_style='eam') == ['A']
+
+    # Results match the unindexed local database search
+    records, df = potdb.get_lammps_potentials(elements='Al', return_df=True)
+    l_recs, l_df = potdb.local_database.get_records('potential_LAMMPS',
+                                                    elements='Al', return_df=True)
+    assert df.name.tolist() == l_df.name.tolist()
+
+    # Saved, changed and deleted records are picked up incrementally
+    potdb.save_record(lammps_potential('D', 'eam', ['Cu']))
+    assert ids(elements='Cu') == ['C', 'D']
+    potdb.save_record(lammps_potential('D', 'eam', ['Fe']), overwrite=True)
+    assert ids(elements='Cu') == ['C']
+    potdb.delete_record(name='A', style='potential_LAMMPS')
+    assert ids(pair_style='eam') == ['D']
+    os.remove(tmp_path / 'potential_LAMMPS' / 'B.json')
+    assert ids() == ['C', 'D']
+    assert index.sync('potential_LAMMPS', potdb.local_database) == 0
+
+    # Index files from other versions are rebuilt
+    with index.connect() as conn:
+        conn.execute("UPDATE info SET value=0 WHERE key='version'")
+    conn.close()
+    assert ids() == ['C', 'D']
+
+    # Metadata is stored as JSON
+    with index.connect() as conn:
+        content = conn.execute("SELECT metadata FROM records WHERE name='C'").fetchone()[0]
+    conn.close()
+    assert json.loads(content)['status'] == 'retracted'
+
+def test_json_metadata():
+    meta = {'date': datetime.date(2020, 1, 2), 'count': np.int64(3),
+            'time': datetime.datetime(2020, 1, 2, 3, 4, 5), 'tags': ['a', None]}
+    assert _json.loads(_json.dumps(meta)) == meta
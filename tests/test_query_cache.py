@@ -0,0 +1,68 @@
+import json
+import time
+
+import potentials
+from potentials.Database._query_cache import QueryCache
+
+from common_values import testdb_host
+
+class CountingDatabase():
+    """Local stand-in for a remote database that counts queries"""
+    def __init__(self):
+        self.database = potentials.load_database(style='local', host=testdb_host)
+        self.host = self.database.host
+        self.calls = 0
+
+    def get_records(self, *args, **kwargs):
+        self.calls += 1
+        return self.database.get_records(*args, **kwargs)
+
+def test_query_cache(tmp_path):
+    remote = CountingDatabase()
+    potdb = potentials.Database(local=False, remote=True, remote_database=remote)
+    assert potdb.remote_cache is None
+    potdb.get_potentials()
+    potdb.get_potentials()
+    assert remote.calls == 2
+
+    # Repeated and equivalent queries are answered from the cache
+    potdb.set_remote_cache(ttl=60, maxsize=2)
+    records = potdb.get_potentials(elements=['Al', 'Ti'])
+    records2 = potdb.get_potentials(elements=['Ti', 'Al'])
+    assert remote.calls == 3
+    assert potdb.remote_cache.hits == 1
+    assert potdb.remote_cache.misses == 1
+    assert [r.id for r in records] == [r.id for r in records2]
+    assert records[0] is not records2[0]
+
+    # Least recently used queries are evicted
+    potdb.get_potentials(elements='Ag')
+    potdb.get_potentials(elements='Fe')
+    assert len(potdb.remote_cache) == 2
+    potdb.get_potentials(elements=['Al', 'Ti'])
+    assert remote.calls == 6
+
+    # Expired results are queried again
+    cache = QueryCache(ttl=0.05, path=tmp_path / 'cache.json')
+    potdb.set_remote_cache(cache)
+    potdb.get_potentials()
+    time.sleep(0.1)
+    potdb.get_potentials()
+    assert cache.misses == 2
+
+    # Results persist to the cache file
+    cache = QueryCache(ttl=60, path=tmp_path / 'cache.json')
+    potdb.set_remote_cache(cache)
+    potdb.get_potentials()
+    cache2 = QueryCache(ttl=60, path=tmp_path / 'cache.json')
+    records, df = cache2.get_records(remote, 'Potential')
+    assert cache2.hits == 1
+    assert len(records) == 3
+    assert df.name.tolist() == [record.name for record in records]
+    assert records[0].name == df.name[0]
+    json.loads((tmp_path / 'cache.json').read_text())
+    cache2.clear()
+    assert not (tmp_path / 'cache.json').exists()
+
+    potdb.unset_remote_cache()
+    assert potdb.remote_cache is None
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import potentials
+from potentials.Database._record_list import RecordList
+
+from common_values import testdb_host
+
+def test_record_list():
+    potdb = potentials.Database(localpath=testdb_host, remote=False)
+    records, df = potdb.get_potentials(return_df=True)
+    assert isinstance(records, RecordList)
+    assert len(records) == len(df) == 3
+    assert records.num_built == 0
+    assert records.df.id.tolist() == df.id.tolist()
+
+    # Records are built when accessed
+    assert records[1].id == df.id[1]
+    assert records.num_built == 1
+
+    # Slicing and masks return lazy RecordLists
+    subset = records[df.id == df.id[2]]
+    assert isinstance(subset, RecordList)
+    assert len(subset) == 1
+    assert subset[0].id == df.id[2]
+    assert [r.id for r in records[::-1]] == df.id.tolist()[::-1]
+    assert len(records[[]]) == 0
+
+    # Array conversion builds all records
+    array = np.asarray(records)
+    assert array.shape == (3,)
+    assert records.num_built == 3
+    joined = RecordList.concat([records[:1], records[2:]])
+    assert [r.id for r in joined] == [df.id[0], df.id[2]]
+
+    with pytest.raises(ValueError):
+        RecordList(df, [])
+
+def test_download_records(tmp_path):
+    remote = potentials.load_database(style='local', host=tmp_path / 'remote')
+    remote.add_record(record=potentials.load_record(
+        'potential_LAMMPS', id='A', key='A-key', potid='A-pot', pair_style='eam',
+        symbols=['Al'], elements=['Al']))
+    potdb = potentials.Database(local=True, remote=True, localpath=tmp_path / 'local',
+                                remote_database=remote, kim_models=[])
+
+    records = potdb.download_lammps_potentials(return_records=True)
+    assert isinstance(records, RecordList)
+    assert records.df.id.tolist() == ['A']
+    assert records[0].id == 'A'
@@ -0,0 +1,80 @@
+import errno
+import os
+
+import pytest
+
+import potentials
+from potentials.Database._staging import stage_file
+from potentials.record.Artifact import Artifact
+
+def build_library(tmp_path):
+    """Builds a local database containing one potential with a parameter file"""
+    source = tmp_path / 'AlNi.eam.alloy'
+    source.write_text('table\n')
+    pot = potentials.load_record('potential_LAMMPS', id='test-eam-alloy', key='test-key',
+                                 potid='test-pot', potkey='test-pot-key',
+                                 pair_style='eam/alloy', symbols=['Al', 'Ni'],
+                                 elements=['Al', 'Ni'],
+                                 artifacts=[Artifact(filename='AlNi.eam.alloy',
+                                                     url='https://example.org/AlNi.eam.alloy')])
+    pot.pair_coeff_paramfile('AlNi.eam.alloy')
+    potdb = potentials.Database(local=True, remote=False, localpath=tmp_path / 'library')
+    potdb.save_lammps_potential(pot, filenames=[source])
+    return potdb, pot, potdb.local_database.get_folder(record=pot) / 'AlNi.eam.alloy'
+
+@pytest.mark.parametrize('mode', ['copy', 'symlink', 'hardlink'])
+def test_get_lammps_potential_files_staging(tmp_path, mode):
+    potdb, pot, libfile = build_library(tmp_path)
+    pot_dir = tmp_path / mode
+
+    report = potdb.get_lammps_potential_files(pot, pot_dir=pot_dir, staging=mode)
+    assert report == {'AlNi.eam.alloy': mode}
+    dest = pot_dir / 'AlNi.eam.alloy'
+    assert dest.read_text() == 'table\n'
+    assert dest.is_symlink() == (mode == 'symlink')
+    assert os.path.samefile(dest, libfile) == (mode != 'copy')
+
+    report = potdb.get_lammps_potential_files(pot, pot_dir=pot_dir, staging=mode)
+    assert report == {'AlNi.eam.alloy': 'existing'}
+
+def test_get_lammps_potential_files_reflink(tmp_path):
+    potdb, pot, libfile = build_library(tmp_path)
+    report = potdb.get_lammps_potential_files(pot, pot_dir=tmp_path / 'pots', staging='reflink')
+
+    # Filesystems without copy-on-write support fall back to copying
+    assert report['AlNi.eam.alloy'] in ['reflink', 'copy']
+    assert (tmp_path / 'pots' / 'AlNi.eam.alloy').read_text() == 'table\n'
+    assert not os.path.samefile(tmp_path / 'pots' / 'AlNi.eam.alloy', libfile)
+
+    with pytest.raises(ValueError):
+        potdb.get_lammps_potential_files(pot, pot_dir=tmp_path / 'pots', staging='move')
+
+def test_stage_file_fallback(tmp_path, monkeypatch):
+    source = tmp_path / 'source.txt'
+    source.write_text('source')
+    dest = tmp_path / 'dest.txt'
+
+    # Cross-device hardlinks are copied instead
+    def cross_device_link(src, dst):
+        raise OSError(errno.EXDEV, 'Invalid cross-device link')
+    with monkeypatch.context() as m:
+        m.setattr(os, 'link', cross_device_link)
+        assert stage_file(source, dest, 'hardlink') == 'copy'
+    assert dest.read_text() == 'source'
+    assert not os.path.samefile(source, dest)
+
+    # Replacing a link does not write through to the linked file
+    assert stage_file(source, dest, 'hardlink') == 'hardlink'
+    other = tmp_path / 'other.txt'
+    other.write_text('other')
+    assert stage_file(other, dest, 'copy') == 'copy'
+    assert dest.read_text() == 'other'
+    assert source.read_text() == 'source'
+
+def test_get_lammps_potential_files_in_place(tmp_path):
+    potdb, pot, libfile = build_library(tmp_path)
+
+    # Overwriting into the database folder keeps the library files
+    report = potdb.get_lammps_potential_files(pot, pot_dir=libfile.parent, overwrite=True)
+    assert report == {'AlNi.eam.alloy': 'existing'}
+    assert libfile.read_text() == 'table\n'
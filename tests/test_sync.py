@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+import potentials
+from potentials.Database import _sync
+from potentials.record.Artifact import Artifact
+
+def build_potential(id, version):
+    pot = potentials.load_record('potential_LAMMPS', id=id, key=f'{id}-key',
+                                 potid='test-pot', potkey='test-pot-key',
+                                 pair_style='eam/alloy', symbols=['Al'], elements=['Al'],
+                                 artifacts=[Artifact(filename=f'{id}.eam.alloy',
+                                                     url=f'https://example.org/{id}/{version}')])
+    pot.pair_coeff_paramfile(f'{id}.eam.alloy')
+    return pot
+
+class FakeDownloader():
+    """Replaces download_artifacts, writing each url as the file content"""
+    def __init__(self):
+        self.urls = []
+
+    def __call__(self, tasks, **kwargs):
+        for artifact, pot_dir in tasks:
+            self.urls.append(artifact.url)
+            (pot_dir / artifact.filename).write_text(artifact.url)
+        return {'downloaded': len(tasks), 'skipped': 0, 'failed': []}
+
+@pytest.fixture
+def databases(tmp_path, monkeypatch):
+    downloader = FakeDownloader()
+    monkeypatch.setattr(_sync, 'download_artifacts', downloader)
+    remote = potentials.load_database(style='local', host=tmp_path / 'remote')
+    for id in ['test-a', 'test-b']:
+        remote.add_record(record=build_potential(id, 'v1'))
+    potdb = potentials.Database(local=True, remote=True, localpath=tmp_path / 'local',
+                                remote_database=remote)
+    return potdb, remote, downloader
+
+def test_sync_all(tmp_path, databases):
+    potdb, remote, downloader = databases
+    manifest = tmp_path / 'local' / 'sync_manifest.json'
+
+    # Dry runs report changes without transferring anything
+    report = potdb.sync_all(dry_run=True)
+    assert report['records']['potential_LAMMPS']['added'] == ['test-a', 'test-b']
+    assert report['files']['downloaded'] == ['test-a/test-a.eam.alloy', 'test-b/test-b.eam.alloy']
+    assert not manifest.exists()
+    assert len(potdb.local_database.get_records('potential_LAMMPS')) == 0
+    assert downloader.urls == []
+
+    report = potdb.sync_all(report=tmp_path / 'report.json')
+    assert report['records']['potential_LAMMPS']['added'] == ['test-a', 'test-b']
+    assert json.loads((tmp_path / 'report.json').read_text())['files'] == report['files']
+    assert manifest.is_file()
+    folder = tmp_path / 'local' / 'potential_LAMMPS'
+    assert (folder / 'test-b' / 'test-b.eam.alloy').read_text() == 'https://example.org/test-b/v1'
+
+    # Nothing is transferred when nothing changed
+    downloader.urls.clear()
+    report = potdb.sync_all()
+    assert report['records']['potential_LAMMPS']['unchanged'] == 2
+    assert downloader.urls == []
+
+    # Only changed records and files are transferred
+    remote.update_record(record=build_potential('test-b', 'v2'))
+    (folder / 'test-a' / 'test-a.eam.alloy').unlink()
+    report = potdb.sync_all()
+    assert report['records']['potential_LAMMPS']['updated'] == ['test-b']
+    assert report['records']['potential_LAMMPS']['unchanged'] == 1
+    assert sorted(downloader.urls) == ['https://example.org/test-a/v1',
+                                       'https://example.org/test-b/v2']
+    assert (folder / 'test-b' / 'test-b.eam.alloy').read_text() == 'https://example.org/test-b/v2'
+
+    # Existing libraries without a manifest are compared to the local records
+    manifest.unlink()
+    downloader.urls.clear()
+    report = potdb.download_all(sync=True)
+    assert report['records']['potential_LAMMPS']['unchanged'] == 2
+    assert downloader.urls == []
+
+    # Records removed from the remote are reported but kept
+    remote.delete_record(record=build_potential('test-a', 'v1'))
+    report = potdb.sync_all()
+    assert report['records']['potential_LAMMPS']['missing'] == ['test-a']
+    assert (folder / 'test-a.json').is_file()
@@ -1,9 +1,30 @@
-from potentials.tools.atomic_info import atomic_mass, atomic_number, atomic_symbol
+from potentials.tools.atomic_info import atomic_mass, atomic_masses, atomic_number, atomic_symbol
 
 import numpy as np
+import pytest
 
 def test_atomic_info():
 
     assert atomic_symbol(46) == 'Pd'
     assert atomic_number('U') == 92
     assert np.isclose(atomic_mass('Be'), 9.0121831)
+
+def test_atomic_mass():
+    assert np.isclose(atomic_mass('H'), 1.007975)
+    assert np.isclose(atomic_mass('D'), 2.01410177812)
+    assert np.isclose(atomic_mass('U-235'), 235.0439301)
+    assert atomic_mass('Tc') == 98.0
+    assert atomic_mass('Am') == atomic_mass('Am', 243)
+    assert atomic_number('Uuo') == 118
+    with pytest.raises(ValueError):
+        atomic_mass('Xx')
+    with pytest.raises(ValueError):
+        atomic_mass('Fe', 1)
+    with pytest.raises(IndexError):
+        atomic_symbol(200)
+
+def test_atomic_masses():
+    masses = atomic_masses(['Fe', 'Al', 'Fe', 13])
+    assert masses.shape == (4,)
+    assert np.allclose(masses, [atomic_mass('Fe'), atomic_mass('Al'),
+                                atomic_mass('Fe'), atomic_mass('Al')])
@@ -0,0 +1,48 @@
+from potentials.tools.numderivative import central_weights, numderivative
+
+import numpy as np
+import pytest
+
+def legacy_numderivative(x, y, n=1):
+    """The previous recursive forward difference implementation"""
+    if n == 0:
+        return x, y
+    deltax = x[1] - x[0]
+    return legacy_numderivative(x[:-1] + deltax / 2, (y[1:] - y[:-1]) / deltax, n=n-1)
+
+def test_forward():
+    x = np.linspace(0, 2, 101)
+    y = np.sin(x)
+    for n in range(4):
+        newx, newy = numderivative(x, y, n=n)
+        oldx, oldy = legacy_numderivative(x, y, n=n)
+        assert np.allclose(newx, oldx)
+        assert np.allclose(newy, oldy)
+
+def test_central_weights():
+    assert np.allclose(central_weights(1), [-0.5, 0.0, 0.5])
+    assert np.allclose(central_weights(2), [1.0, -2.0, 1.0])
+    assert np.allclose(central_weights(1, accuracy=4), [1/12, -2/3, 0.0, 2/3, -1/12])
+    with pytest.raises(ValueError):
+        central_weights(1, accuracy=3)
+
+def test_central():
+    x = np.linspace(0, 2, 201)
+    y = np.sin(x)
+    newx, newy = numderivative(x, y, n=2, method='central', accuracy=4)
+    assert np.array_equal(newx, x[2:-2])
+    assert np.allclose(newy, -np.sin(newx), atol=1e-8)
+
+    # Stacked derivatives 0..n share the coordinates of the widest stencil
+    newx, newy = numderivative(x, y, n=3, method='central', stack=True)
+    assert newy.shape == (4, 197)
+    assert np.array_equal(newy[0], y[2:-2])
+    for m, f in enumerate([np.sin, np.cos, lambda x: -np.sin(x), lambda x: -np.cos(x)]):
+        assert np.allclose(newy[m], f(newx), atol=1e-4)
+
+    # Multiple functions are handled as rows
+    newx, newy = numderivative(x, np.array([y, 2 * y]), method='central')
+    assert np.allclose(newy[1], 2 * newy[0])
+
+    with pytest.raises(ValueError):
+        numderivative(x, y, n=2, stack=True)